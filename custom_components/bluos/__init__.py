@@ -1,30 +1,107 @@
 """The BluOS integration."""
 import logging
+from pathlib import Path
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .artwork import BluOSArtworkCache
+from .const import (
+    DATA_ARTWORK,
+    DATA_HOST_INDEX,
+    DATA_SCHEDULER,
+    DATA_TOPOLOGY,
+    DOMAIN,
+)
 from .coordinator import BluOSDataUpdateCoordinator
+from .host_index import BluOSHostIndex
+from .listening import STORAGE_VERSION, storage_key
+from .scheduler import BluOSPollScheduler
+from .services import async_setup_services
+from .topology import BluOSGroupTopology
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the BluOS domain services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up BluOS from a config entry."""
+    hass.data.setdefault(DOMAIN, {})
+    # One scheduler polls all players, see scheduler.py
+    if DATA_SCHEDULER not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_SCHEDULER] = BluOSPollScheduler(hass)
+    scheduler: BluOSPollScheduler = hass.data[DOMAIN][DATA_SCHEDULER]
+    if DATA_HOST_INDEX not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_HOST_INDEX] = BluOSHostIndex(hass)
+    host_index: BluOSHostIndex = hass.data[DOMAIN][DATA_HOST_INDEX]
+    if DATA_TOPOLOGY not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_TOPOLOGY] = BluOSGroupTopology(hass)
+    topology: BluOSGroupTopology = hass.data[DOMAIN][DATA_TOPOLOGY]
+    if DATA_ARTWORK not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_ARTWORK] = BluOSArtworkCache(
+            hass, Path(hass.config.path(".cache", DOMAIN, "artwork"))
+        )
+
     coordinator = BluOSDataUpdateCoordinator(hass, entry)
+    coordinator.api.limiter = scheduler.limiter
+    # Release the player's keep-alive connections when the entry goes away
+    entry.async_on_unload(coordinator.api.close)
+    # Runs before the session closes (unload callbacks run last-in first-out)
+    entry.async_on_unload(coordinator.async_shutdown)
+    await coordinator.listening.async_load()
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})
+    # Entries created before discovery existed are identified by host:port;
+    # discovery identifies players by MAC, which survives IP changes
+    mac = coordinator.data.sync_status.mac
+    if (
+        mac
+        and entry.unique_id != format_mac(mac)
+        and hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, format_mac(mac))
+        is None
+    ):
+        hass.config_entries.async_update_entry(entry, unique_id=format_mac(mac))
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    host_index.async_add_entry(entry.entry_id, entry.data[CONF_HOST])
+    entry.async_on_unload(lambda: host_index.async_remove_entry(entry.entry_id))
+    # The coordinator reports every SyncStatus change to the topology
+    entry.async_on_unload(
+        lambda: topology.async_remove_player(entry.data[CONF_HOST])
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    scheduler.async_add(coordinator)
+    entry.async_on_unload(lambda: scheduler.async_remove(coordinator))
+
+    # Long-poll /Status for instant updates (stopped automatically on unload)
+    coordinator.async_start_push()
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -33,3 +110,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the listening statistics of a removed player."""
+    await Store(hass, STORAGE_VERSION, storage_key(entry.entry_id)).async_remove()
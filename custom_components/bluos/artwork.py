@@ -0,0 +1,333 @@
+"""Artwork cache behind the media player image proxy."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+import hashlib
+from http import HTTPStatus
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import time
+
+import aiohttp
+from aiohttp import hdrs
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    ARTWORK_DISK_CACHE_SIZE,
+    ARTWORK_MAX_BYTES,
+    ARTWORK_MEMORY_CACHE_SIZE,
+    ARTWORK_REVALIDATE_INTERVAL,
+    ARTWORK_TIMEOUT,
+)
+
+try:
+    from PIL import Image
+except ImportError:  # Art is served at its original size without Pillow
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Artwork:
+    """An image and the validators to check it with the player."""
+
+    content: bytes
+    content_type: str
+    etag: str | None = None
+    last_modified: str | None = None
+    # Identifies the image content: etag, Last-Modified or a content hash
+    version: str = ""
+    # Wall-clock time the image was last fetched or revalidated
+    checked: float = 0.0
+
+
+class BluOSArtworkCache:
+    """Fetch artwork once and serve it to every frontend client.
+
+    Without the proxy every open dashboard downloads full-size art straight
+    from the player on every track change, and clients outside the home
+    network can't reach the player at all. Home Assistant serves the art
+    instead (see BluOSMediaPlayer.async_get_media_image), from this cache:
+
+    - Originals are kept in memory and on disk, keyed by image URL, each in
+      a least-recently-used cache bounded in bytes.
+    - Cached images are revalidated with the player (If-None-Match /
+      If-Modified-Since) every ARTWORK_REVALIDATE_INTERVAL; until then they
+      are served without a request.
+    - Resized copies are kept in memory, keyed by URL and size, and reused
+      as long as their original is unchanged.
+    - Concurrent requests for the same image share a single download.
+
+    One cache serves all players, so grouped players showing the same art
+    share it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: Path,
+        memory_size: int = ARTWORK_MEMORY_CACHE_SIZE,
+        disk_size: int = ARTWORK_DISK_CACHE_SIZE,
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.directory = directory
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        # (url, size) -> image, oldest first; size None is the original
+        self._memory: OrderedDict[tuple[str, int | None], Artwork] = OrderedDict()
+        self._memory_bytes = 0
+        # File name -> bytes on disk, oldest first; scanned on first use
+        self._disk: OrderedDict[str, int] | None = None
+        self._disk_bytes = 0
+        self._disk_lock = asyncio.Lock()
+        self._fetches: dict[str, asyncio.Task[Artwork | None]] = {}
+
+    async def async_get(
+        self, url: str, size: int | None = None
+    ) -> tuple[bytes | None, str | None]:
+        """Return the image at ``url`` and its content type.
+
+        With a ``size`` (and Pillow installed), images larger than ``size``
+        pixels on their longest side are scaled down.
+        """
+        art = await self._async_get_art(url, size)
+        if art is None:
+            return None, None
+        return art.content, art.content_type
+
+    async def _async_get_art(self, url: str, size: int | None) -> Artwork | None:
+        """Return a cached or fresh image, resized to ``size``."""
+        key = (url, size)
+        art = self._memory_get(key)
+        if art is not None and time.time() - art.checked < ARTWORK_REVALIDATE_INTERVAL:
+            return art
+
+        original = await self._async_get_original(url)
+        if original is None or size is None or Image is None:
+            return original
+
+        if art is not None and art.version == original.version:
+            art = replace(art, checked=original.checked)
+        else:
+            art = await self.hass.async_add_executor_job(_resize, original, size)
+        if len(original.content) <= ARTWORK_MAX_BYTES:
+            self._memory_put(key, art)
+        return art
+
+    async def _async_get_original(self, url: str) -> Artwork | None:
+        """Return the original image, revalidating it when due."""
+        key = (url, None)
+        art = self._memory_get(key)
+        if art is None:
+            art = await self._async_disk_load(url)
+            if art is not None:
+                self._memory_put(key, art)
+        if art is not None and time.time() - art.checked < ARTWORK_REVALIDATE_INTERVAL:
+            return art
+
+        # Every open dashboard asks for the new art at once on a track change
+        if (fetch := self._fetches.get(url)) is None:
+            fetch = self.hass.async_create_task(self._async_fetch(url, art))
+            self._fetches[url] = fetch
+            fetch.add_done_callback(lambda _: self._fetches.pop(url, None))
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch(self, url: str, cached: Artwork | None) -> Artwork | None:
+        """Download an image, or revalidate the cached copy."""
+        headers = {}
+        if cached is not None and cached.etag:
+            headers[hdrs.IF_NONE_MATCH] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
+        try:
+            async with async_get_clientsession(self.hass).get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=ARTWORK_TIMEOUT),
+            ) as response:
+                if response.status == HTTPStatus.NOT_MODIFIED and cached is not None:
+                    art = replace(cached, checked=time.time())
+                else:
+                    response.raise_for_status()
+                    content = await response.read()
+                    etag = response.headers.get(hdrs.ETAG)
+                    last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+                    art = Artwork(
+                        content=content,
+                        content_type=response.content_type,
+                        etag=etag,
+                        last_modified=last_modified,
+                        version=etag
+                        or last_modified
+                        or hashlib.sha1(content).hexdigest(),
+                        checked=time.time(),
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Error fetching artwork %s: %s", url, err)
+            # A stale image beats none
+            return cached
+
+        if len(art.content) > ARTWORK_MAX_BYTES:
+            return art
+        self._memory_put((url, None), art)
+        await self._async_disk_store(
+            url, art, cached is None or art.content is not cached.content
+        )
+        return art
+
+    def _memory_get(self, key: tuple[str, int | None]) -> Artwork | None:
+        """Return an image from memory, marking it as recently used."""
+        art = self._memory.get(key)
+        if art is not None:
+            self._memory.move_to_end(key)
+        return art
+
+    def _memory_put(self, key: tuple[str, int | None], art: Artwork) -> None:
+        """Keep an image in memory, evicting the least recently used ones."""
+        if (old := self._memory.pop(key, None)) is not None:
+            self._memory_bytes -= len(old.content)
+        self._memory[key] = art
+        self._memory_bytes += len(art.content)
+        while self._memory_bytes > self.memory_size and len(self._memory) > 1:
+            _, old = self._memory.popitem(last=False)
+            self._memory_bytes -= len(old.content)
+
+    async def _async_disk_index(self) -> OrderedDict[str, int]:
+        """Return the index of the disk cache, scanning the directory once."""
+        async with self._disk_lock:
+            if self._disk is None:
+                self._disk = await self.hass.async_add_executor_job(self._scan)
+                self._disk_bytes = sum(self._disk.values())
+        return self._disk
+
+    async def _async_disk_load(self, url: str) -> Artwork | None:
+        """Return an image from disk, marking it as recently used."""
+        name = _file_name(url)
+        index = await self._async_disk_index()
+        if name not in index:
+            return None
+        art = await self.hass.async_add_executor_job(self._read, name)
+        if art is None:
+            self._disk_bytes -= index.pop(name, 0)
+            return None
+        index.move_to_end(name)
+        return art
+
+    async def _async_disk_store(
+        self, url: str, art: Artwork, content_changed: bool
+    ) -> None:
+        """Write an image to disk, evicting the least recently used ones."""
+        name = _file_name(url)
+        index = await self._async_disk_index()
+        if not await self.hass.async_add_executor_job(
+            self._write, name, url, art, content_changed
+        ):
+            return
+
+        self._disk_bytes += len(art.content) - index.pop(name, 0)
+        index[name] = len(art.content)
+        evicted = []
+        while self._disk_bytes > self.disk_size and len(index) > 1:
+            old, size = index.popitem(last=False)
+            self._disk_bytes -= size
+            evicted.append(old)
+        if evicted:
+            await self.hass.async_add_executor_job(self._delete, evicted)
+
+    def _scan(self) -> OrderedDict[str, int]:
+        """List the cached images, least recently used first."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            files = []
+            for path in self.directory.glob("*.bin"):
+                stat = path.stat()
+                files.append((stat.st_mtime, path.stem, stat.st_size))
+        except OSError as err:
+            _LOGGER.warning("Cannot use artwork cache %s: %s", self.directory, err)
+            return OrderedDict()
+        return OrderedDict((name, size) for _, name, size in sorted(files))
+
+    def _read(self, name: str) -> Artwork | None:
+        """Read an image and its validators."""
+        path = self.directory / f"{name}.bin"
+        try:
+            meta = json.loads((self.directory / f"{name}.json").read_text())
+            content = path.read_bytes()
+            # The file time orders the disk cache across restarts
+            os.utime(path)
+            return Artwork(
+                content=content,
+                content_type=meta["content_type"],
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+                version=meta.get("version", ""),
+                checked=meta.get("checked", 0.0),
+            )
+        except (OSError, ValueError, KeyError) as err:
+            _LOGGER.debug("Cannot read cached artwork %s: %s", name, err)
+            return None
+
+    def _write(self, name: str, url: str, art: Artwork, content_changed: bool) -> bool:
+        """Write an image (if changed) and its validators."""
+        meta = {
+            "url": url,
+            "content_type": art.content_type,
+            "etag": art.etag,
+            "last_modified": art.last_modified,
+            "version": art.version,
+            "checked": art.checked,
+        }
+        try:
+            if content_changed:
+                (self.directory / f"{name}.bin").write_bytes(art.content)
+            (self.directory / f"{name}.json").write_text(json.dumps(meta))
+        except OSError as err:
+            _LOGGER.debug("Cannot write cached artwork %s: %s", url, err)
+            return False
+        return True
+
+    def _delete(self, names: list[str]) -> None:
+        """Remove evicted images."""
+        for name in names:
+            for suffix in (".bin", ".json"):
+                try:
+                    (self.directory / f"{name}{suffix}").unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as err:
+                    _LOGGER.debug("Cannot remove cached artwork %s: %s", name, err)
+
+
+def _file_name(url: str) -> str:
+    """Return the cache file name (without suffix) of an image URL."""
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def _resize(art: Artwork, size: int) -> Artwork:
+    """Scale an image down to ``size`` pixels on its longest side."""
+    try:
+        with Image.open(io.BytesIO(art.content)) as image:
+            if max(image.size) <= size:
+                return art
+            image.thumbnail((size, size))
+            output = io.BytesIO()
+            if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+                image.save(output, "PNG", optimize=True)
+                content_type = "image/png"
+            else:
+                image.convert("RGB").save(output, "JPEG", quality=85, optimize=True)
+                content_type = "image/jpeg"
+    except (OSError, ValueError, Image.DecompressionBombError) as err:
+        _LOGGER.debug("Cannot resize artwork: %s", err)
+        return art
+    return replace(art, content=output.getvalue(), content_type=content_type)
@@ -1,10 +1,45 @@
 """BluOS API client."""
+import asyncio
+import contextlib
 import logging
-import xml.etree.ElementTree as ET
+import time
 from typing import Any
-from urllib.parse import quote
 
-import requests
+import aiohttp
+
+from .const import (
+    CIRCUIT_BREAKER_THRESHOLD,
+    CONNECT_TIMEOUT,
+    ERROR_LOG_INTERVAL,
+    KEEPALIVE_TIMEOUT,
+    MAX_CONNECTIONS_PER_HOST,
+    READ_TIMEOUT,
+)
+from .metrics import BluOSMetrics
+from .models import (
+    Battery,
+    BrowseItem,
+    BrowsePage,
+    GroupMember,
+    PlayerStatus,
+    PlaylistState,
+    Preset,
+    SyncState,
+    VolumeState,
+)
+from .request_trace import BluOSRequestTrace
+from .xml_schema import (
+    BROWSE_SCHEMA,
+    PLAYLIST_SCHEMA,
+    PRESETS_SCHEMA,
+    STATE_SCHEMA,
+    STATUS_SCHEMA,
+    SYNC_STATUS_SCHEMA,
+    VOLUME_SCHEMA,
+    ExpatError,
+    XmlSchema,
+    extract,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,72 +47,190 @@ _LOGGER = logging.getLogger(__name__)
 class BluOSApi:
     """BluOS API client."""
 
-    def __init__(self, host: str, port: int = 11000) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        host: str,
+        port: int = 11000,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        Without a ``session`` the client creates its own, with a small
+        keep-alive connection pool dedicated to this player. Call ``close``
+        when the client is no longer needed.
+        """
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}"
-        self.timeout = 10
+        self.timeout = aiohttp.ClientTimeout(
+            sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+        )
+        # While the player is offline a request only gets CONNECT_TIMEOUT
+        self.probe_timeout = aiohttp.ClientTimeout(total=CONNECT_TIMEOUT)
+        self._session = session
+        self._owns_session = session is None
+        # Optional limit on in-flight requests, shared between players
+        self.limiter: asyncio.Semaphore | None = None
+        # Consecutive failed requests (circuit breaker) and error log state
+        self.failures = 0
+        self._last_error_log = 0.0
+        self._suppressed_errors = 0
+        # Latency, error, payload and parse time counters per endpoint
+        self.metrics = BluOSMetrics()
+        # Recent requests and responses, for the diagnostics
+        self.trace = BluOSRequestTrace()
+
+    @property
+    def reachable(self) -> bool:
+        """Return False while the circuit breaker is open (player offline)."""
+        return self.failures < CIRCUIT_BREAKER_THRESHOLD
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating the keep-alive pool on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ),
+            )
+            self._owns_session = True
+        return self._session
 
-    def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> str | None:
-        """Make a GET request to the BluOS API."""
+    async def close(self) -> None:
+        """Close the connection pool if this client owns it."""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> str | None:
+        """Make a GET request to the BluOS API.
+
+        ``timeout`` extends the read timeout for long-poll requests. Those
+        sit idle on the player for minutes and don't count against
+        ``limiter``. Once the player stops answering, regular requests are
+        cut short so an offline player doesn't hold up a slot for the full
+        read timeout.
+        """
         url = f"{self.base_url}/{endpoint}"
+        request_timeout = self.timeout
+        if timeout:
+            request_timeout = aiohttp.ClientTimeout(
+                sock_connect=CONNECT_TIMEOUT, sock_read=timeout
+            )
+        elif not self.reachable:
+            request_timeout = self.probe_timeout
+        if params:
+            params = {key: str(value) for key, value in params.items()}
+
+        limiter = self.limiter if self.limiter and not timeout else None
+
+        # Action URLs (e.g. from /Browse) carry their own query string
+        name = endpoint.split("?", 1)[0]
+        start = 0.0
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
-            # Log the actual URL that was called (with params)
-            _LOGGER.debug("BluOS API call: %s", response.url)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as err:
-            _LOGGER.error("Error making request to %s: %s", url, err)
+            async with limiter or contextlib.nullcontext():
+                start = time.monotonic()
+                async with self._get_session().get(
+                    url, params=params, timeout=request_timeout
+                ) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                    text = await response.text()
+                latency = time.monotonic() - start
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            self.metrics.record_error(name, isinstance(err, asyncio.TimeoutError))
+            self.trace.record(
+                endpoint,
+                params,
+                getattr(err, "status", None) or f"{type(err).__name__}: {err}",
+                time.monotonic() - start if start else 0.0,
+            )
+            self._record_failure(url, err)
             return None
 
-    def _parse_xml(self, xml_string: str) -> dict[str, Any] | None:
-        """Parse XML response."""
+        self.metrics.record_response(name, latency, len(body), long_poll=bool(timeout))
+        self.trace.record(endpoint, params, response.status, latency, text)
+        self._record_success()
+        return text
+
+    def _record_failure(self, url: str, err: Exception) -> None:
+        """Count a failed request and log it, at most once per ERROR_LOG_INTERVAL."""
+        self.failures += 1
+        if self.failures == CIRCUIT_BREAKER_THRESHOLD:
+            _LOGGER.warning(
+                "%s is not responding, polling it less often until it answers",
+                self.host,
+            )
+
+        now = time.monotonic()
+        if self._last_error_log and now - self._last_error_log < ERROR_LOG_INTERVAL:
+            self._suppressed_errors += 1
+            _LOGGER.debug("Error making request to %s: %s", url, err)
+            return
+
+        self._last_error_log = now
+        suppressed, self._suppressed_errors = self._suppressed_errors, 0
+        if suppressed:
+            _LOGGER.error(
+                "Error making request to %s: %s (%d similar errors since the last report)",
+                url,
+                err,
+                suppressed,
+            )
+        else:
+            _LOGGER.error("Error making request to %s: %s", url, err)
+
+    def _record_success(self) -> None:
+        """Close the circuit breaker after a successful request."""
+        if not self.reachable:
+            _LOGGER.info("%s is responding again", self.host)
+            # Report the next outage right away
+            self._last_error_log = 0.0
+            self._suppressed_errors = 0
+        self.failures = 0
+
+    def _parse_xml(
+        self, xml_string: str, schema: XmlSchema, endpoint: str
+    ) -> dict[str, Any] | None:
+        """Parse an XML response, extracting only the fields in ``schema``."""
         if not xml_string:
             return None
         
+        start = time.perf_counter()
         try:
-            root = ET.fromstring(xml_string)
-            return self._element_to_dict(root)
-        except ET.ParseError as err:
+            return extract(xml_string, schema)
+        except ExpatError as err:
             _LOGGER.error("Error parsing XML: %s", err)
             return None
+        finally:
+            self.metrics.record_parse(endpoint, time.perf_counter() - start)
 
-    def _element_to_dict(self, element: ET.Element) -> dict[str, Any]:
-        """Convert XML element to dictionary."""
-        result = {}
-        
-        # Add attributes
-        if element.attrib:
-            result.update(element.attrib)
-        
-        # Add text content
-        if element.text and element.text.strip():
-            if len(element.attrib) == 0 and len(list(element)) == 0:
-                return element.text.strip()
-            result["_text"] = element.text.strip()
-        
-        # Add child elements
-        for child in element:
-            child_data = self._element_to_dict(child)
-            if child.tag in result:
-                # Handle multiple children with same tag
-                if not isinstance(result[child.tag], list):
-                    result[child.tag] = [result[child.tag]]
-                result[child.tag].append(child_data)
-            else:
-                result[child.tag] = child_data
-        
-        return result
+    async def get_status(
+        self, timeout: int | None = None, etag: str | None = None
+    ) -> PlayerStatus | None:
+        """Get player status.
 
-    def get_status(self) -> dict[str, Any] | None:
-        """Get player status."""
-        response = self._get("Status")
+        When ``timeout`` and ``etag`` are given this is a long-poll request:
+        the player holds the request open for up to ``timeout`` seconds and
+        only answers early when its status no longer matches ``etag``.
+        """
+        params = None
+        request_timeout = None
+        if timeout and etag:
+            params = {"timeout": timeout, "etag": etag}
+            # Give the player the full long-poll window before we give up
+            request_timeout = READ_TIMEOUT + timeout
+
+        response = await self._get("Status", params, request_timeout)
         if not response:
             return None
         
-        status = self._parse_xml(response)
+        status = self._parse_xml(response, STATUS_SCHEMA, "Status")
         if not status:
             return None
         
@@ -111,62 +264,53 @@ class BluOSApi:
         image = status.get("image", "") or status.get("currentImage", "") or status.get("stationImage", "")
         
         # Extract relevant information
-        result = {
-            "name": status.get("name", "BluOS Player"),
-            "state": self._parse_state(status.get("state")),
-            "volume": int(status.get("volume", 0)),
-            "mute": status.get("mute", "0") == "1",
-            "shuffle": status.get("shuffle", "0") == "1",
-            "repeat": status.get("repeat", "0"),
-            "service": status.get("service", ""),
-            "service_name": status.get("serviceName", ""),
-            "service_icon": status.get("serviceIcon", ""),
-            # Title fields from BluOS
-            "title1": status.get("title1", ""),
-            "title2": status.get("title2", ""),
-            "title3": status.get("title3", ""),
-            # Parsed fields for media player
-            "title": title,
-            "artist": artist,
-            "album": album,
-            # Image
-            "image": image,
-            # Playback info
-            "totlen": int(status.get("totlen", 0)),
-            "secs": int(status.get("secs", 0)),
-            "can_seek": status.get("canSeek", "0") == "1",
-            # Stream info
-            "stream_format": status.get("streamFormat", ""),
-            "stream_url": status.get("streamUrl", ""),
-            # Preset info
-            "is_preset": status.get("is_preset", "false") == "true",
-            "preset_id": status.get("preset_id", ""),
-            "preset_name": status.get("preset_name", ""),
-            # Quality
-            "quality": status.get("quality", "0"),
-            "db": status.get("db", "0"),
-            # Battery info (for battery-powered devices like Flex)
-            "battery": self._parse_battery(status.get("battery")),
-            # Group (for compatibility)
-            "group": status.get("group", {}),
-        }
-        
-        return result
+        return PlayerStatus(
+            etag=status.get("etag", ""),
+            name=status.get("name", "BluOS Player"),
+            state=self._parse_state(status.get("state")),
+            volume=int(status.get("volume", 0)),
+            mute=status.get("mute", "0") == "1",
+            shuffle=status.get("shuffle", "0") == "1",
+            repeat=status.get("repeat", "0"),
+            service=status.get("service", ""),
+            service_name=status.get("serviceName", ""),
+            service_icon=status.get("serviceIcon", ""),
+            title1=status.get("title1", ""),
+            title2=status.get("title2", ""),
+            title3=status.get("title3", ""),
+            title=title,
+            artist=artist,
+            album=album,
+            image=image,
+            totlen=int(status.get("totlen", 0)),
+            secs=int(status.get("secs", 0)),
+            can_seek=status.get("canSeek", "0") == "1",
+            stream_format=status.get("streamFormat", ""),
+            stream_url=status.get("streamUrl", ""),
+            is_preset=status.get("is_preset", "false") == "true",
+            preset_id=status.get("preset_id", ""),
+            preset_name=status.get("preset_name", ""),
+            presets_version=status.get("prid", ""),
+            quality=status.get("quality", "0"),
+            db=status.get("db", "0"),
+            battery=self._parse_battery(status.get("battery")),
+            group=status.get("group", ""),
+            sync_stat=status.get("syncStat", ""),
+        )
     
-    def _parse_battery(self, battery_data: dict | None) -> dict[str, Any]:
+    def _parse_battery(self, battery_data: dict[str, str] | None) -> Battery | None:
         """Parse battery information.
         
         Battery XML format: <battery level="100" charging="true" icon="..."/>
-        Parsed as: {"level": "100", "charging": "true", "icon": "..."}
         """
         if not battery_data:
-            return {}
+            return None
         
-        return {
-            "level": int(battery_data.get("level", 0)),
-            "charging": battery_data.get("charging", "false") == "true",
-            "icon": battery_data.get("icon", ""),
-        }
+        return Battery(
+            level=int(battery_data.get("level", 0)),
+            charging=battery_data.get("charging", "false") == "true",
+            icon=battery_data.get("icon", ""),
+        )
 
     def _parse_state(self, state: str | None) -> str:
         """Parse player state."""
@@ -182,88 +326,78 @@ class BluOSApi:
         
         return state_map.get(state.lower(), "idle")
 
-    def get_sync_status(self) -> dict[str, Any] | None:
+    async def get_sync_status(
+        self, timeout: int | None = None, etag: str | None = None
+    ) -> SyncState | None:
         """Get sync/group status and device information.
         
         SyncStatus includes device details:
         <SyncStatus name="FLEX Speaker" model="P125" modelName="PULSE FLEX 2i" 
                     brand="Bluesound" icon="..." ...>
+
+        Supports the same ``timeout``/``etag`` long-poll as get_status.
         """
-        response = self._get("SyncStatus")
+        params = None
+        request_timeout = None
+        if timeout and etag:
+            params = {"timeout": timeout, "etag": etag}
+            request_timeout = READ_TIMEOUT + timeout
+
+        response = await self._get("SyncStatus", params, request_timeout)
         if not response:
             return None
         
-        sync_status = self._parse_xml(response)
+        sync_status = self._parse_xml(response, SYNC_STATUS_SCHEMA, "SyncStatus")
         if not sync_status:
             return None
         
-        # Parse group information
-        result = {
-            "master": None,
-            "slaves": [],
-            "zone": sync_status.get("zone"),
-            "master_id": sync_status.get("master"),
+        return SyncState(
+            etag=sync_status.get("etag", ""),
+            # Master XML: <master port="11000">10.10.10.20</master>
+            master=sync_status.get("master") or None,
+            # Slave XML: <slave id="10.10.10.23" port="11000"/>
+            slaves=tuple(
+                GroupMember(
+                    ip=slave.get("id", ""),
+                    name=slave.get("name", ""),
+                    zone=slave.get("zone", ""),
+                )
+                for slave in sync_status.get("slave", ())
+            ),
+            zone=sync_status.get("zone"),
             # Device information from SyncStatus
-            "device_name": sync_status.get("name", ""),
-            "model": sync_status.get("model", ""),
-            "model_name": sync_status.get("modelName", ""),
-            "brand": sync_status.get("brand", ""),
-            "icon": sync_status.get("icon", ""),
-            "mac": sync_status.get("mac", ""),
-            # Battery info (always present in SyncStatus, even when grouped)
-            "battery": self._parse_battery(sync_status.get("battery")),
-        }
-        
-        # Check if this player is a slave
-        if sync_status.get("master"):
-            master_data = sync_status.get("master")
-            # Master can be a string (IP) or a dict with _text containing the IP
-            if isinstance(master_data, dict):
-                result["master"] = master_data.get("_text", "")
-            else:
-                result["master"] = master_data
-        
-        # Get list of slaves if this is a master
-        if "slave" in sync_status:
-            slaves = sync_status["slave"]
-            if not isinstance(slaves, list):
-                slaves = [slaves]
-            result["slaves"] = [
-                {
-                    # Slave XML: <slave id="10.10.10.23" port="11000"/>
-                    "ip": slave.get("id", ""),
-                    "name": slave.get("name", ""),
-                    "zone": slave.get("zone", ""),
-                }
-                for slave in slaves
-            ]
-        
-        return result
+            device_name=sync_status.get("name", ""),
+            model=sync_status.get("model", ""),
+            model_name=sync_status.get("modelName", ""),
+            brand=sync_status.get("brand", ""),
+            icon=sync_status.get("icon", ""),
+            mac=sync_status.get("mac", ""),
+            battery=self._parse_battery(sync_status.get("battery")),
+        )
 
-    def get_presets(self) -> list[dict[str, Any]]:
-        """Get available presets/sources."""
-        response = self._get("Presets")
+    async def get_presets(self) -> tuple[Preset, ...] | None:
+        """Get available presets/sources.
+
+        Returns None when the request fails, so callers can tell a failure
+        apart from a player without presets.
+        """
+        response = await self._get("Presets")
         if not response:
-            return []
-        
-        presets_data = self._parse_xml(response)
-        if not presets_data or "preset" not in presets_data:
-            return []
-        
-        presets = presets_data["preset"]
-        if not isinstance(presets, list):
-            presets = [presets]
+            return None
         
-        return [
-            {
-                "id": preset.get("id", ""),
-                "name": preset.get("name", ""),
-                "url": preset.get("url", ""),
-            }
-            for preset in presets
-        ]
-
-    def get_volume(self) -> dict[str, Any] | None:
+        presets_data = self._parse_xml(response, PRESETS_SCHEMA, "Presets")
+        if presets_data is None:
+            return None
+        return tuple(
+            Preset(
+                id=preset.get("id", ""),
+                name=preset.get("name", ""),
+                url=preset.get("url", ""),
+            )
+            for preset in presets_data.get("preset", ())
+        )
+
+    async def get_volume(self) -> VolumeState | None:
         """Get volume information from /Volume endpoint.
         
         This endpoint returns the individual player's volume,
@@ -273,100 +407,159 @@ class BluOSApi:
         <volume db="-43.1" mute="0">11</volume>
         Parsed as: {"db": "-43.1", "mute": "0", "_text": "11"}
         """
-        response = self._get("Volume")
+        response = await self._get("Volume")
+        return self._parse_volume(response)
+
+    def _parse_volume(self, response: str | None) -> VolumeState | None:
+        """Parse a <volume> response (from /Volume, with or without changes)."""
         if not response:
-            _LOGGER.debug("get_volume: No response from /Volume endpoint for %s", self.host)
             return None
-        
-        _LOGGER.debug("get_volume: Raw response from %s: %s", self.host, response[:200])
-        
-        volume_data = self._parse_xml(response)
+        volume_data = self._parse_xml(response, VOLUME_SCHEMA, "Volume")
         if not volume_data:
-            _LOGGER.debug("get_volume: Failed to parse XML response for %s", self.host)
             return None
         
-        _LOGGER.debug("get_volume: Parsed data from %s: %s", self.host, volume_data)
-        
         # The volume value is in the _text field (XML text content)
         # <volume db="-43.1" mute="0">11</volume> → {"_text": "11", "db": "-43.1", ...}
         volume_value = volume_data.get("_text", "0")
         
         # Parse volume information
-        result = {
-            "volume": int(volume_value),
-            "mute": volume_data.get("mute", "0") == "1",
-            "db": volume_data.get("db", "0"),
-        }
-        
-        _LOGGER.debug("get_volume: Result for %s: %s", self.host, result)
-        return result
+        return VolumeState(
+            volume=int(volume_value),
+            mute=volume_data.get("mute", "0") == "1",
+            db=volume_data.get("db", "0"),
+        )
 
-    def play(self) -> bool:
-        """Start playback."""
-        response = self._get("Play")
-        return response is not None
+    async def play(self) -> str | None:
+        """Start playback, returning the new state (None on failure)."""
+        response = await self._get("Play")
+        return self._parse_command_state(response, "Play", "playing")
 
-    def pause(self) -> bool:
-        """Pause playback."""
-        response = self._get("Pause")
-        return response is not None
+    async def pause(self) -> str | None:
+        """Pause playback, returning the new state (None on failure)."""
+        response = await self._get("Pause")
+        return self._parse_command_state(response, "Pause", "paused")
 
-    def stop(self) -> bool:
-        """Stop playback."""
-        response = self._get("Pause")  # BluOS uses Pause for stop
-        return response is not None
+    async def stop(self) -> str | None:
+        """Stop playback, returning the new state (None on failure)."""
+        response = await self._get("Pause")  # BluOS uses Pause for stop
+        return self._parse_command_state(response, "Pause", "paused")
 
-    def play_pause(self) -> bool:
-        """Toggle play/pause."""
-        response = self._get("Pause", {"toggle": "1"})
-        return response is not None
+    async def play_pause(self) -> str | None:
+        """Toggle play/pause, returning the new state (None on failure)."""
+        response = await self._get("Pause", {"toggle": "1"})
+        return self._parse_command_state(response, "Pause", None)
 
-    def next_track(self) -> bool:
+    async def next_track(self) -> bool:
         """Skip to next track."""
-        response = self._get("Skip")
+        response = await self._get("Skip")
         return response is not None
 
-    def previous_track(self) -> bool:
+    async def previous_track(self) -> bool:
         """Skip to previous track."""
-        response = self._get("Back")
+        response = await self._get("Back")
         return response is not None
 
-    def set_volume(self, volume: int) -> bool:
-        """Set volume level (0-100)."""
-        response = self._get("Volume", {"level": volume})
-        return response is not None
+    async def set_volume(self, volume: int) -> VolumeState | None:
+        """Set volume level (0-100), returning the resulting volume."""
+        response = await self._get("Volume", {"level": volume})
+        return self._parse_volume(response)
 
-    def volume_up(self) -> bool:
-        """Increase volume."""
-        response = self._get("Volume", {"level": "+3"})
-        return response is not None
+    async def volume_up(self) -> VolumeState | None:
+        """Increase volume, returning the resulting volume."""
+        response = await self._get("Volume", {"level": "+3"})
+        return self._parse_volume(response)
 
-    def volume_down(self) -> bool:
-        """Decrease volume."""
-        response = self._get("Volume", {"level": "-3"})
-        return response is not None
+    async def volume_down(self) -> VolumeState | None:
+        """Decrease volume, returning the resulting volume."""
+        response = await self._get("Volume", {"level": "-3"})
+        return self._parse_volume(response)
 
-    def mute(self, mute: bool) -> bool:
-        """Mute or unmute."""
-        response = self._get("Volume", {"mute": "1" if mute else "0"})
-        return response is not None
+    async def mute(self, mute: bool) -> VolumeState | None:
+        """Mute or unmute, returning the resulting volume."""
+        response = await self._get("Volume", {"mute": "1" if mute else "0"})
+        return self._parse_volume(response)
 
-    def select_preset(self, preset_id: str) -> bool:
+    async def select_preset(self, preset_id: str) -> bool:
         """Select a preset/source."""
-        response = self._get("Preset", {"id": preset_id})
+        response = await self._get("Preset", {"id": preset_id})
         return response is not None
 
-    def shuffle(self, shuffle: bool) -> bool:
-        """Enable or disable shuffle."""
-        response = self._get("Shuffle", {"state": "1" if shuffle else "0"})
+    async def shuffle(self, shuffle: bool) -> PlaylistState | None:
+        """Enable or disable shuffle, returning the play queue settings."""
+        response = await self._get("Shuffle", {"state": "1" if shuffle else "0"})
+        return self._parse_playlist(response, "Shuffle")
+
+    async def repeat(self, repeat: int) -> PlaylistState | None:
+        """Set repeat mode (0=off, 1=all, 2=one), returning the play queue settings."""
+        response = await self._get("Repeat", {"state": repeat})
+        return self._parse_playlist(response, "Repeat")
+
+    def _parse_command_state(
+        self, response: str | None, endpoint: str, expected: str | None
+    ) -> str | None:
+        """Parse the <state> a transport command returns.
+
+        Falls back to ``expected`` if the response carries no state.
+        """
+        if response is None:
+            return None
+        data = self._parse_xml(response, STATE_SCHEMA, endpoint)
+        if data and data.get("_text"):
+            return self._parse_state(data["_text"])
+        return expected
+
+    def _parse_playlist(
+        self, response: str | None, endpoint: str
+    ) -> PlaylistState | None:
+        """Parse the <playlist> /Shuffle and /Repeat return."""
+        if response is None:
+            return None
+        data = self._parse_xml(response, PLAYLIST_SCHEMA, endpoint) or {}
+        shuffle = data.get("shuffle")
+        return PlaylistState(
+            shuffle=None if shuffle is None else shuffle == "1",
+            repeat=data.get("repeat"),
+            length=int(data.get("length", 0)),
+        )
+
+    async def browse(self, key: str | None = None) -> BrowsePage | None:
+        """Get one page of the /Browse tree (the list of services without key)."""
+        response = await self._get("Browse", {"key": key} if key else None)
+        if response is None:
+            return None
+        data = self._parse_xml(response, BROWSE_SCHEMA, "Browse")
+        if data is None:
+            return None
+
+        return BrowsePage(
+            items=tuple(
+                BrowseItem(
+                    text=item.get("text", ""),
+                    text2=item.get("text2", ""),
+                    type=item.get("type", ""),
+                    image=item.get("image", ""),
+                    browse_key=item.get("browseKey", ""),
+                    play_url=item.get("playURL", ""),
+                )
+                for item in data.get("item", ())
+            ),
+            next_key=data.get("nextKey", ""),
+            parent_key=data.get("parentKey", ""),
+            service_name=data.get("serviceName", ""),
+            service_icon=data.get("serviceIcon", ""),
+        )
+
+    async def play_url(self, url: str) -> bool:
+        """Play a stream or file URL."""
+        response = await self._get("Play", {"url": url})
         return response is not None
 
-    def repeat(self, repeat: int) -> bool:
-        """Set repeat mode (0=off, 1=all, 2=one)."""
-        response = self._get("Repeat", {"state": repeat})
+    async def play_action(self, action_url: str) -> bool:
+        """Request a player-relative action URL, e.g. a /Browse item's playURL."""
+        response = await self._get(action_url.lstrip("/"))
         return response is not None
 
-    def add_slave(self, slave_ip: str) -> bool:
+    async def add_slave(self, slave_ip: str) -> bool:
         """Add a slave player to this master."""
         # BluOS AddSlave parameters
         # slave: IP address of the secondary player (required)
@@ -377,17 +570,12 @@ class BluOSApi:
         }
         
         _LOGGER.info("Adding slave %s to master %s", slave_ip, self.host)
-        _LOGGER.debug("AddSlave params: %s", params)
-        response = self._get("AddSlave", params)
-        
-        if response:
-            _LOGGER.debug("AddSlave response: %s", response[:200] if len(response) > 200 else response)
-        else:
+        response = await self._get("AddSlave", params)
+        if response is None:
             _LOGGER.error("AddSlave returned no response")
-        
         return response is not None
 
-    def remove_slave(self, slave_ip: str | None = None) -> bool:
+    async def remove_slave(self, slave_ip: str | None = None) -> bool:
         """Remove a slave player or unjoin this player from group."""
         if slave_ip:
             # Remove specific slave
@@ -398,6 +586,5 @@ class BluOSApi:
             params = {}
             _LOGGER.debug("Ungrouping player %s", self.host)
         
-        response = self._get("RemoveSlave", params)
-        _LOGGER.debug("RemoveSlave response: %s", response)
+        response = await self._get("RemoveSlave", params)
         return response is not None
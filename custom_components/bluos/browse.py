@@ -0,0 +1,65 @@
+"""Cached access to the BluOS /Browse tree."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+
+from .bluos_api import BluOSApi
+from .const import BROWSE_CACHE_SIZE, BROWSE_DEFAULT_TTL, BROWSE_TTL
+from .models import BrowseItem, BrowsePage
+
+
+class BluOSBrowser:
+    """Load /Browse pages on demand and keep the recent ones.
+
+    Libraries and radio directories can hold tens of thousands of entries,
+    so nothing is loaded ahead: each page is fetched when it is opened and
+    the player's ``nextKey`` leads to the next page. Pages are kept in a
+    least-recently-used cache of BROWSE_CACHE_SIZE pages, each for the TTL
+    of its service (a local library changes less often than a radio
+    directory).
+    """
+
+    def __init__(self, api: BluOSApi, max_pages: int = BROWSE_CACHE_SIZE) -> None:
+        """Initialize the browser."""
+        self.api = api
+        self.max_pages = max_pages
+        # Browse key ("" for the top level) -> (expiry, page), oldest first
+        self._pages: OrderedDict[str, tuple[float, BrowsePage]] = OrderedDict()
+
+    async def async_get_page(self, key: str | None = None) -> BrowsePage | None:
+        """Return a page from the cache, fetching it if missing or expired."""
+        cache_key = key or ""
+        now = time.monotonic()
+        cached = self._pages.get(cache_key)
+        if cached is not None and cached[0] > now:
+            self._pages.move_to_end(cache_key)
+            return cached[1]
+
+        page = await self.api.browse(key)
+        if page is None:
+            return None
+
+        self._pages[cache_key] = (now + self.ttl(cache_key), page)
+        self._pages.move_to_end(cache_key)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return page
+
+    def find_item(self, browse_key: str) -> BrowseItem | None:
+        """Return the cached item that leads to ``browse_key``, if any."""
+        for _, page in reversed(self._pages.values()):
+            for item in page.items:
+                if item.browse_key == browse_key:
+                    return item
+        return None
+
+    def clear(self) -> None:
+        """Forget every cached page."""
+        self._pages.clear()
+
+    @staticmethod
+    def ttl(key: str) -> float:
+        """Return how long a page may be cached, by the service it belongs to."""
+        service = key.split(":", 1)[0] if key else ""
+        return BROWSE_TTL.get(service, BROWSE_DEFAULT_TTL)
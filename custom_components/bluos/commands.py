@@ -0,0 +1,101 @@
+"""Latest-wins command channel for BluOS players."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+Command = Callable[[], Awaitable[Any]]
+
+
+@dataclass(slots=True)
+class _Slot:
+    """State of one command key."""
+
+    # Sends the pending commands one at a time; None while idle
+    task: asyncio.Task[None] | None = None
+    pending: Command | None = None
+    # Callers whose command is pending (or was replaced while pending)
+    waiters: list[asyncio.Future[Any]] = field(default_factory=list)
+
+
+class BluOSCommandChannel:
+    """Collapse bursts of set-commands into the latest one.
+
+    Dragging the volume slider calls set_volume dozens of times a second.
+    Per key (e.g. ``"volume"``) at most one command is in flight and one is
+    pending; a new command replaces the pending one. Commands for one key
+    run in order, so the player always ends up with the last value asked
+    for. Callers whose command was replaced get the result of the command
+    that replaced it.
+
+    Commands are sent by a background task of the config entry, not by the
+    callers, so a caller that is cancelled (e.g. its websocket closed mid-drag) doesn't
+    take the commands queued behind it down with it.
+
+    Only use this for idempotent commands where the last one fully
+    describes the intended state.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the channel."""
+        self.hass = hass
+        self.entry = entry
+        self._slots: dict[str, _Slot] = {}
+
+    async def async_send(self, key: str, command: Command) -> Any:
+        """Run ``command`` unless a newer command for ``key`` replaces it."""
+        slot = self._slots.setdefault(key, _Slot())
+        slot.pending = command
+        waiter: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        slot.waiters.append(waiter)
+        # The task may have finished already if it started eagerly
+        if slot.task is None or slot.task.done():
+            slot.task = self.entry.async_create_background_task(
+                self.hass, self._async_drain(slot), f"BluOS {key} commands"
+            )
+        return await waiter
+
+    async def async_shutdown(self) -> None:
+        """Cancel the commands in flight, e.g. before the session closes."""
+        tasks = [slot.task for slot in self._slots.values() if slot.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _async_drain(self, slot: _Slot) -> None:
+        """Send the pending command of a key until none is left."""
+        try:
+            while slot.pending is not None:
+                command, slot.pending = slot.pending, None
+                waiters, slot.waiters = slot.waiters, []
+                try:
+                    result = await command()
+                except Exception as err:  # pylint: disable=broad-except
+                    _set_exception(waiters, err)
+                else:
+                    _set_result(waiters, result)
+        finally:
+            slot.task = None
+            slot.pending = None
+            # Only left over if the channel's task was cancelled
+            waiters, slot.waiters = slot.waiters, []
+            _set_result(waiters, None)
+
+
+def _set_result(waiters: list[asyncio.Future[Any]], result: Any) -> None:
+    """Resolve waiting callers."""
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.set_result(result)
+
+
+def _set_exception(waiters: list[asyncio.Future[Any]], err: Exception) -> None:
+    """Fail waiting callers."""
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.set_exception(err)
@@ -1,6 +1,7 @@
 """Config flow for BluOS integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -8,12 +9,26 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
-from .const import DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_PLAYERS,
+    CONF_PUSH_UPDATES,
+    DEFAULT_NAME,
+    DEFAULT_PORT,
+    DEFAULT_PUSH_UPDATES,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+    PROBE_TIMEOUT,
+)
 from .bluos_api import BluOSApi
+from .lsdp import async_discover
+from .models import SyncState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,19 +40,38 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
-    api = BluOSApi(data[CONF_HOST], data[CONF_PORT])
-    
+async def async_probe(hass: HomeAssistant, host: str, port: int) -> SyncState:
+    """Check that a player answers, using its small /SyncStatus response."""
+    api = BluOSApi(host, port, async_get_clientsession(hass))
     try:
-        player_info = await hass.async_add_executor_job(api.get_status)
-        if not player_info:
-            raise CannotConnect
+        sync_status = await asyncio.wait_for(api.get_sync_status(), PROBE_TIMEOUT)
     except Exception as err:
-        _LOGGER.error("Error connecting to BluOS device: %s", err)
+        _LOGGER.debug("Error probing BluOS device %s: %s", host, err)
         raise CannotConnect from err
+    if sync_status is None:
+        raise CannotConnect
+    return sync_status
+
+
+def player_unique_id(sync_status: SyncState, host: str, port: int) -> str:
+    """Return the unique id of a player: its MAC, or host:port without one."""
+    if sync_status.mac:
+        return format_mac(sync_status.mac)
+    return f"{host}:{port}"
+
+
+async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Validate the user input allows us to connect."""
+    try:
+        sync_status = await async_probe(hass, data[CONF_HOST], data[CONF_PORT])
+    except CannotConnect:
+        _LOGGER.error("Error connecting to BluOS device %s", data[CONF_HOST])
+        raise
 
-    return {"title": player_info.get("name", "BluOS Player")}
+    return {
+        "title": sync_status.device_name or DEFAULT_NAME,
+        "unique_id": player_unique_id(sync_status, data[CONF_HOST], data[CONF_PORT]),
+    }
 
 
 class CannotConnect(Exception):
@@ -49,10 +83,34 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        # Players found by LSDP that aren't configured yet, by host:port
+        self._discovered: dict[str, dict[str, Any]] | None = None
+        # Player found by zeroconf, waiting for confirmation
+        self._discovery: dict[str, Any] | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Handle the initial step.
+
+        Players found on the network are offered first; the host form is
+        for players discovery can't reach (e.g. on another subnet).
+        """
+        if user_input is None and self._discovered is None:
+            self._discovered = await self._async_discover_players()
+            if self._discovered:
+                return await self.async_step_pick()
+
         errors: dict[str, str] = {}
         
         if user_input is not None:
@@ -64,13 +122,175 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                await self.async_set_unique_id(
-                    f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
-                )
-                self._abort_if_unique_id_configured()
+                self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
+                await self.async_set_unique_id(info["unique_id"])
+                self._abort_if_unique_id_configured(updates=user_input)
                 
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user pick any number of discovered players to add at once."""
+        assert self._discovered
+        if user_input is not None:
+            picked = user_input[CONF_PLAYERS]
+            if not picked:
+                return await self.async_step_user()
+
+            # This flow adds the first player, a flow per player adds the rest
+            for key in picked[1:]:
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                        data=self._discovered[key],
+                    )
+                )
+            player = self._discovered[picked[0]]
+            await self.async_set_unique_id(player["unique_id"])
+            self._abort_if_unique_id_configured()
+            return self._async_create_player_entry(player)
+
+        players = {
+            key: f"{player['title']} ({player[CONF_HOST]})"
+            for key, player in self._discovered.items()
+        }
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_PLAYERS, default=list(players)): cv.multi_select(
+                        players
+                    ),
+                }
+            ),
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> FlowResult:
+        """Add a player the user picked together with others in the pick step."""
+        await self.async_set_unique_id(discovery_info["unique_id"])
+        self._abort_if_unique_id_configured()
+        return self._async_create_player_entry(discovery_info)
+
+    async def async_step_zeroconf(
+        self, discovery_info: ZeroconfServiceInfo
+    ) -> FlowResult:
+        """Handle a player announcing itself as _musc._tcp."""
+        host = discovery_info.host
+        port = discovery_info.port or DEFAULT_PORT
+        self._async_abort_entries_match({CONF_HOST: host})
+        try:
+            sync_status = await async_probe(self.hass, host, port)
+        except CannotConnect:
+            return self.async_abort(reason="cannot_connect")
+
+        unique_id = player_unique_id(sync_status, host, port)
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured(updates={CONF_HOST: host, CONF_PORT: port})
+
+        self._discovery = {
+            CONF_HOST: host,
+            CONF_PORT: port,
+            "title": sync_status.device_name or DEFAULT_NAME,
+            "unique_id": unique_id,
+        }
+        self.context["title_placeholders"] = {"name": self._discovery["title"]}
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm adding a player found by zeroconf."""
+        assert self._discovery
+        if user_input is not None:
+            return self._async_create_player_entry(self._discovery)
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={
+                "name": self._discovery["title"],
+                "host": self._discovery[CONF_HOST],
+            },
+        )
+
+    @callback
+    def _async_create_player_entry(self, player: dict[str, Any]) -> FlowResult:
+        """Create the entry of a discovered player."""
+        return self.async_create_entry(
+            title=player["title"],
+            data={CONF_HOST: player[CONF_HOST], CONF_PORT: player[CONF_PORT]},
+        )
+
+    async def _async_discover_players(self) -> dict[str, dict[str, Any]]:
+        """Find players over LSDP that aren't configured yet.
+
+        All candidates are probed at the same time, and players already
+        configured (by host or by MAC) are left out.
+        """
+        nodes = await async_discover(DISCOVERY_TIMEOUT)
+        configured = {
+            (entry.data[CONF_HOST], entry.data[CONF_PORT])
+            for entry in self._async_current_entries()
+        }
+        candidates = [
+            node for node in nodes if (node.host, node.port) not in configured
+        ]
+        probes = await asyncio.gather(
+            *(async_probe(self.hass, node.host, node.port) for node in candidates),
+            return_exceptions=True,
+        )
+
+        configured_ids = self._async_current_ids()
+        discovered: dict[str, dict[str, Any]] = {}
+        for node, sync_status in zip(candidates, probes):
+            if isinstance(sync_status, BaseException):
+                _LOGGER.debug("Discovered player %s did not answer", node.host)
+                continue
+            unique_id = player_unique_id(sync_status, node.host, node.port)
+            if unique_id in configured_ids:
+                continue
+            discovered[f"{node.host}:{node.port}"] = {
+                CONF_HOST: node.host,
+                CONF_PORT: node.port,
+                "title": sync_status.device_name or node.name,
+                "unique_id": unique_id,
+            }
+        _LOGGER.debug("Discovered %d new BluOS players", len(discovered))
+        return discovered
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle BluOS options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_PUSH_UPDATES,
+                        default=self._config_entry.options.get(
+                            CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES
+                        ),
+                    ): cv.boolean,
+                }
+            ),
+        )
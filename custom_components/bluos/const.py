@@ -5,19 +5,112 @@ DOMAIN = "bluos"
 # Configuration
 CONF_HOST = "host"
 CONF_PORT = "port"
+CONF_PUSH_UPDATES = "push_updates"
+CONF_PLAYERS = "players"
 
 # Defaults
 DEFAULT_PORT = 11000
 DEFAULT_NAME = "BluOS Player"
+DEFAULT_PUSH_UPDATES = True
+
+# HTTP client
+CONNECT_TIMEOUT = 3  # seconds to establish a connection
+READ_TIMEOUT = 10  # seconds to wait for a response
+KEEPALIVE_TIMEOUT = 60  # seconds an idle connection is kept open
+MAX_CONNECTIONS_PER_HOST = 6  # long-polls plus concurrent regular requests
+
+# Discovery
+DISCOVERY_TIMEOUT = 3  # seconds to collect LSDP announces
+PROBE_TIMEOUT = 5  # seconds a discovered player may take to answer /SyncStatus
 
 # Update interval
 UPDATE_INTERVAL = 2  # seconds (faster refresh for media information)
+IDLE_INTERVAL = 10  # seconds between /Status polls while paused or stopped
+UPDATE_CYCLE_DEADLINE = 5  # seconds one refresh may take before results are used
+
+# Unreachable players
+CIRCUIT_BREAKER_THRESHOLD = 3  # failed requests before a player counts as offline
+BACKOFF_MAX_INTERVAL = 300  # longest wait between polls of an offline player
+ERROR_LOG_INTERVAL = 300  # seconds between request error logs per player
+
+# Fleet-wide poll scheduler
+MAX_INFLIGHT_REQUESTS = 8  # regular requests in flight across all players
+SCHEDULER_LAG_WARNING = 1  # seconds a poll may start late before we warn
+
+# Refresh tiers (hot data, /Status, uses UPDATE_INTERVAL)
+WARM_INTERVAL = 10  # seconds between /Volume and /SyncStatus refreshes
+COLD_INTERVAL = 1800  # seconds the preset list is cached
+VOLUME_VERIFY_INTERVAL = 300  # seconds between /Volume checks of ungrouped players
+
+# Push mode (long-polling /Status)
+LONG_POLL_TIMEOUT = 100  # seconds the player may hold a request open
+LONG_POLL_MIN_INTERVAL = 1  # seconds between long-polls (BluOS API guideline)
+LONG_POLL_RETRY_INTERVAL = 5  # seconds to wait after a failed long-poll
+PUSH_FALLBACK_INTERVAL = 30  # seconds between full refreshes in push mode
+
+# Media browser
+MEDIA_TYPE_BLUOS = "bluos"  # content type of /Browse entries
+BROWSE_CACHE_SIZE = 64  # /Browse pages cached per player
+BROWSE_DEFAULT_TTL = 300  # seconds a page is cached unless listed below
+# Seconds a page is cached by service (the browse key prefix); "" is the
+# top-level list of services
+BROWSE_TTL = {
+    "": 3600,
+    "LocalMusic": 1800,
+    "Playlists": 600,
+    "TuneIn": 900,
+    "RadioParadise": 900,
+    "Capture": 3600,
+}
+
+# Artwork proxy
+ARTWORK_SIZE = 500  # px, longest side of the now-playing art
+ARTWORK_THUMBNAIL_SIZE = 200  # px, longest side of media browser thumbnails
+ARTWORK_MEMORY_CACHE_SIZE = 16 * 1024 * 1024  # bytes of art kept in memory
+ARTWORK_DISK_CACHE_SIZE = 64 * 1024 * 1024  # bytes of art kept on disk
+ARTWORK_MAX_BYTES = 4 * 1024 * 1024  # larger images are served, not cached
+ARTWORK_REVALIDATE_INTERVAL = 600  # seconds before cached art is revalidated
+ARTWORK_TIMEOUT = 10  # seconds to download an image
+
+# Request trace (exported with the diagnostics)
+TRACE_SIZE = 100  # requests kept per player
+TRACE_BODY_LIMIT = 512  # characters of each response kept
+
+# Listening statistics
+LISTENING_DAY_BUCKETS = 24  # buckets of the rolling day (one per hour)
+LISTENING_WEEK_BUCKETS = 28  # buckets of the rolling week (one per 6 hours)
+LISTENING_TOP_SIZE = 20  # stations and artists tracked per player
+LISTENING_MAX_GAP = 120  # most seconds counted between two status updates
+LISTENING_SAVE_DELAY = 300  # seconds between snapshots written to storage
+
+# Seconds an optimistic state may wait for the player to confirm it
+OPTIMISTIC_TIMEOUT = 5
+
+# Seconds the reported position may drift from Home Assistant's extrapolation
+# before the media player writes a new position
+POSITION_TOLERANCE = 3
+
+# hass.data[DOMAIN] keys besides config entry ids
+DATA_SCHEDULER = "scheduler"
+DATA_HOST_INDEX = "host_index"
+DATA_TOPOLOGY = "topology"
+DATA_ARTWORK = "artwork"
+
+# Dispatcher signals
+SIGNAL_HOST_INDEX_UPDATED = f"{DOMAIN}_host_index_updated"
+SIGNAL_TOPOLOGY_UPDATED = f"{DOMAIN}_topology_updated"
 
 # Services
 SERVICE_JOIN = "join"
 SERVICE_UNJOIN = "unjoin"
+SERVICE_REFRESH = "refresh"
+SERVICE_PAUSE_ALL = "pause_all"
+SERVICE_SET_VOLUME_MANY = "set_volume_many"
+SERVICE_PLAY_PRESET_MANY = "play_preset_many"
 
 # Attributes
 ATTR_BLUEOS_GROUP = "blueos_group"
 ATTR_MASTER = "master"
 ATTR_SLAVES = "slaves"
+ATTR_VOLUME_LEVEL = "volume_level"
+ATTR_PRESET = "preset"
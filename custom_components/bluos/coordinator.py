@@ -1,19 +1,109 @@
 """Data update coordinator for BluOS."""
-from datetime import timedelta
+import asyncio
+from collections.abc import Awaitable, Callable
+import dataclasses
+from datetime import datetime
 import logging
+import time
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .bluos_api import BluOSApi
-from .const import UPDATE_INTERVAL
+from .browse import BluOSBrowser
+from .commands import BluOSCommandChannel
+from .listening import BluOSListeningStats
+from .models import PlayerData, PlayerStatus, PlaylistState, SyncState, VolumeState
+from .const import (
+    BACKOFF_MAX_INTERVAL,
+    COLD_INTERVAL,
+    CONF_PUSH_UPDATES,
+    DATA_HOST_INDEX,
+    DATA_SCHEDULER,
+    DATA_TOPOLOGY,
+    DOMAIN,
+    DEFAULT_PUSH_UPDATES,
+    IDLE_INTERVAL,
+    LONG_POLL_MIN_INTERVAL,
+    LONG_POLL_RETRY_INTERVAL,
+    LONG_POLL_TIMEOUT,
+    OPTIMISTIC_TIMEOUT,
+    PUSH_FALLBACK_INTERVAL,
+    UPDATE_CYCLE_DEADLINE,
+    UPDATE_INTERVAL,
+    VOLUME_VERIFY_INTERVAL,
+    WARM_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds an endpoint may be early and still count as due
+DUE_TOLERANCE = 0.5
 
-class BluOSDataUpdateCoordinator(DataUpdateCoordinator):
+# /Status fields a grouped slave reports exactly like its master; the rest
+# (name, battery, syncStat, prid, etag, ...) belong to the slave
+NOW_PLAYING_FIELDS = (
+    "state",
+    "shuffle",
+    "repeat",
+    "service",
+    "service_name",
+    "service_icon",
+    "title1",
+    "title2",
+    "title3",
+    "title",
+    "artist",
+    "album",
+    "image",
+    "totlen",
+    "secs",
+    "can_seek",
+    "stream_format",
+    "stream_url",
+    "is_preset",
+    "preset_id",
+    "preset_name",
+    "quality",
+    "db",
+)
+
+
+@dataclasses.dataclass(slots=True)
+class _OptimisticValue:
+    """A value applied before the player confirmed it."""
+
+    value: Any
+    expires: float
+
+
+@callback
+def async_get_coordinators(hass: HomeAssistant) -> list["BluOSDataUpdateCoordinator"]:
+    """Return the coordinators of all loaded BluOS players."""
+    return [
+        value
+        for value in hass.data.get(DOMAIN, {}).values()
+        if isinstance(value, BluOSDataUpdateCoordinator)
+    ]
+
+
+@callback
+def async_get_coordinator_for_host(
+    hass: HomeAssistant, host: str | None
+) -> "BluOSDataUpdateCoordinator | None":
+    """Return the coordinator of the loaded player at ``host``."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if (host_index := domain_data.get(DATA_HOST_INDEX)) is None:
+        return None
+    coordinator = domain_data.get(host_index.entry_id_for_host(host))
+    return coordinator if isinstance(coordinator, BluOSDataUpdateCoordinator) else None
+
+
+class BluOSDataUpdateCoordinator(DataUpdateCoordinator[PlayerData]):
     """Class to manage fetching BluOS data."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -23,32 +113,664 @@ class BluOSDataUpdateCoordinator(DataUpdateCoordinator):
             entry.data[CONF_PORT],
         )
         self.entry = entry
+        # Latest-wins queue for set-commands (volume, mute, ...)
+        self.commands = BluOSCommandChannel(hass, entry)
+        # Pages of the player's /Browse tree, loaded as the user opens them
+        self.browser = BluOSBrowser(self.api)
+        # Listening time and top stations, fed with every confirmed /Status
+        self.listening = BluOSListeningStats(hass, entry.entry_id)
+        self.push_updates = entry.options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES)
+        # Last etag seen per long-pollable endpoint
+        self._etags: dict[str, str | None] = {"status": None, "sync_status": None}
+
+        # Refresh tiers: hot data (Status) every cycle, warm data (Volume,
+        # SyncStatus) every WARM_INTERVAL and cold data (Presets) is cached
+        # until COLD_INTERVAL passes or the cache is invalidated. In push mode
+        # the long-poll loops keep Status and SyncStatus fresh, so the timer
+        # only verifies them now and then. In polling mode the Status tier
+        # follows playback, see _async_update_cadence. Volume follows the
+        # group role, see _async_update_volume_tier.
+        self._intervals: dict[str, float] = {
+            "status": PUSH_FALLBACK_INTERVAL if self.push_updates else UPDATE_INTERVAL,
+            "sync_status": PUSH_FALLBACK_INTERVAL if self.push_updates else WARM_INTERVAL,
+            "volume": WARM_INTERVAL,
+            "presets": COLD_INTERVAL,
+        }
+        # Monotonic time each endpoint was last fetched successfully
+        self._fetched_at: dict[str, float] = {}
+        # Presets version (Status prid) the cached preset list belongs to
+        self._presets_version: str | None = None
+        self._unknown_preset_id: str | None = None
+        # Status syncStat the cached SyncStatus belongs to
+        self._sync_stat: str | None = None
+        # Fields that changed since the listeners were last notified
+        self.changed_fields: frozenset[str] = frozenset()
+        self._notified_data: PlayerData | None = None
+        # Refreshes that failed in a row (exponential backoff)
+        self._failed_cycles = 0
+        # Latest data as reported by the player, and the optimistic values
+        # ((section, field) -> value) shown on top of it until confirmed
+        self.confirmed_data: PlayerData | None = None
+        self._optimistic: dict[tuple[str, str], _OptimisticValue] = {}
+        self._unsub_optimistic: CALLBACK_TYPE | None = None
+        # True while this player is a slave taking its now-playing fields
+        # from the master's coordinator instead of fetching /Status, and the
+        # master status last shared with the slaves
+        self.following = False
+        self._shared_status: PlayerStatus | None = None
+        # True while the player is ungrouped and its volume is read from
+        # /Status, and when the last /Volume check disagreed with /Status
+        self._volume_from_status = False
+        self._volume_mismatch = False
+
+        # Seconds between polls; the domain's BluOSPollScheduler runs them
+        self.poll_interval: float = min(self._intervals.values())
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"BluOS {entry.data[CONF_HOST]}",
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=None,
+        )
+
+    @property
+    def refresh_intervals(self) -> dict[str, float]:
+        """Return the seconds between refreshes of each endpoint."""
+        return dict(self._intervals)
+
+    @property
+    def failed_cycles(self) -> int:
+        """Return the number of refreshes that failed in a row."""
+        return self._failed_cycles
+
+    async def async_shutdown(self) -> None:
+        """Cancel the timers and commands of the coordinator on unload."""
+        if self._unsub_optimistic is not None:
+            self._unsub_optimistic()
+            self._unsub_optimistic = None
+        await self.commands.async_shutdown()
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Record which fields changed, then notify the listeners.
+
+        Entities compare ``changed_fields`` with the fields they depend on
+        and skip writing state when none of them changed. SyncStatus changes
+        are reported to the domain's group topology first, so entities read
+        an up-to-date group, and the confirmed status to the listening
+        statistics. A master shares its status with its grouped slaves.
+        """
+        self.changed_fields = (
+            self.data.diff(self._notified_data) if self.data else frozenset()
+        )
+        self._notified_data = self.data
+        topology = self.hass.data.get(DOMAIN, {}).get(DATA_TOPOLOGY)
+        if "sync_status" in self.changed_fields and topology:
+            topology.async_update_player(self.api.host, self.data.sync_status)
+        if self.following and self._async_master_coordinator() is None:
+            # Ungrouped, or the master went away: fetch our own /Status again
+            self.following = False
+            self.async_invalidate_cache("status")
+            self.hass.async_create_task(self.async_request_refresh())
+        if self.confirmed_data is not None:
+            self.listening.async_update(self.confirmed_data.status)
+            self._async_share_status(topology)
+        super().async_update_listeners()
+
+    @callback
+    def _async_master_coordinator(self) -> "BluOSDataUpdateCoordinator | None":
+        """Return the coordinator of this player's master, if it can be followed.
+
+        The master must be loaded and its last refresh must have succeeded.
+        """
+        topology = self.hass.data.get(DOMAIN, {}).get(DATA_TOPOLOGY)
+        if topology is None or (master := topology.master_of(self.api.host)) is None:
+            return None
+        coordinator = async_get_coordinator_for_host(self.hass, master)
+        if (
+            coordinator is None
+            or coordinator.confirmed_data is None
+            or not coordinator.last_update_success
+        ):
+            return None
+        return coordinator
+
+    @callback
+    def _async_share_status(self, topology: Any) -> None:
+        """Pass a changed status on to the slaves following this master."""
+        status = self.confirmed_data.status
+        if topology is None or status is self._shared_status:
+            return
+        self._shared_status = status
+        for slave in topology.slaves_of(self.api.host):
+            if (coordinator := async_get_coordinator_for_host(self.hass, slave)) is not None:
+                coordinator.async_follow_master(self)
+
+    @callback
+    def async_follow_master(self, master: "BluOSDataUpdateCoordinator") -> None:
+        """Take the now-playing fields of the master's latest status."""
+        data = self.confirmed_data
+        if (
+            not self.following
+            or data is None
+            or not self.last_update_success
+            or self._async_master_coordinator() is not master
+        ):
+            return
+        status = _follow(data.status, master.confirmed_data.status)
+        if status != data.status:
+            self.confirmed_data = dataclasses.replace(data, status=status)
+            self._async_publish_optimistic()
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Adapt the poll cadence after every refresh, successful or not."""
+        if self.last_update_success:
+            self._failed_cycles = 0
+        else:
+            self._failed_cycles += 1
+        self._async_update_cadence()
+
+    @callback
+    def _async_update_cadence(self) -> None:
+        """Poll fast while playing, slowly while idle and back off while offline.
+
+        Each failed refresh in a row doubles the interval up to
+        BACKOFF_MAX_INTERVAL; the first successful one restores the regular
+        cadence. A shorter interval takes effect right away.
+        """
+        if not self.push_updates:
+            playing = self.data is not None and self.data.status.state == "playing"
+            self._intervals["status"] = UPDATE_INTERVAL if playing else IDLE_INTERVAL
+
+        interval = min(self._intervals.values())
+        if self._failed_cycles:
+            interval = min(interval * 2**self._failed_cycles, BACKOFF_MAX_INTERVAL)
+        if interval == self.poll_interval:
+            return
+
+        _LOGGER.debug("%s: polling every %ss", self.api.host, interval)
+        faster = interval < self.poll_interval
+        self.poll_interval = interval
+        if faster and (scheduler := self.hass.data.get(DOMAIN, {}).get(DATA_SCHEDULER)):
+            scheduler.async_reschedule(self)
+
+    @callback
+    def async_set_optimistic(
+        self,
+        status: dict[str, Any] | None = None,
+        volume: dict[str, Any] | None = None,
+    ) -> list[tuple[tuple[str, str], _OptimisticValue]]:
+        """Show the expected result of a command before the player reports it.
+
+        The values stay until a refresh or long-poll confirms them, or until
+        OPTIMISTIC_TIMEOUT passes, after which the player's data wins again.
+        Returns the values to pass to ``async_clear_optimistic`` if the
+        command fails.
+        """
+        if self.data is None:
+            return []
+        expires = time.monotonic() + OPTIMISTIC_TIMEOUT
+        keys = []
+        for section, changes in (("status", status), ("volume", volume)):
+            for name, value in (changes or {}).items():
+                optimistic = _OptimisticValue(value, expires)
+                self._optimistic[(section, name)] = optimistic
+                keys.append(((section, name), optimistic))
+
+        self._async_publish_optimistic()
+        if self._unsub_optimistic is not None:
+            self._unsub_optimistic()
+        self._unsub_optimistic = async_call_later(
+            self.hass, OPTIMISTIC_TIMEOUT, self._async_expire_optimistic
         )
+        return keys
+
+    @callback
+    def async_clear_optimistic(
+        self, keys: list[tuple[tuple[str, str], _OptimisticValue]]
+    ) -> None:
+        """Roll back optimistic values, e.g. because the command failed.
+
+        Values a newer command has set since are left alone.
+        """
+        for key, optimistic in keys:
+            if self._optimistic.get(key) is optimistic:
+                del self._optimistic[key]
+        self._async_publish_optimistic()
+
+    @callback
+    def async_apply_command_result(self, result: Any) -> None:
+        """Merge the state a command response reported into the data.
+
+        ``result`` is what a BluOSApi command returned: the new playback
+        state (str), a VolumeState or a PlaylistState. Anything else
+        carries no state.
+        """
+        data = self.confirmed_data
+        if data is None:
+            return
+
+        if isinstance(result, VolumeState):
+            changes: dict[str, Any] = {"volume": result}
+            # /Status reports the master's volume on a slave
+            if not data.sync_status.master:
+                changes["status"] = dataclasses.replace(
+                    data.status, volume=result.volume, mute=result.mute
+                )
+        elif isinstance(result, PlaylistState):
+            fields = {
+                name: value
+                for name in ("shuffle", "repeat")
+                if (value := getattr(result, name)) is not None
+            }
+            if not fields:
+                return
+            changes = {"status": dataclasses.replace(data.status, **fields)}
+        elif isinstance(result, str):
+            changes = {"status": dataclasses.replace(data.status, state=result)}
+        else:
+            return
+
+        self.confirmed_data = dataclasses.replace(data, **changes)
+        self._async_publish_optimistic()
+        self._async_update_cadence()
+
+    async def async_refresh_endpoints(self, *keys: str) -> None:
+        """Refresh after a command, re-fetching only the endpoints it affected."""
+        for key in keys:
+            self.async_invalidate_cache(key)
+        await self.async_request_refresh()
+
+    @callback
+    def _async_expire_optimistic(self, _now: datetime) -> None:
+        """Drop optimistic values the player never confirmed."""
+        self._unsub_optimistic = None
+        self._async_publish_optimistic()
+
+    @callback
+    def _async_publish_optimistic(self) -> None:
+        """Notify the listeners of the confirmed data plus optimistic values.
+
+        Unlike ``async_set_updated_data`` this doesn't count as a successful
+        refresh; nothing was fetched.
+        """
+        if self.confirmed_data is None:
+            return
+        data = self._with_optimistic(self.confirmed_data)
+        if data != self.data:
+            self.data = data
+            self.async_update_listeners()
+
+    def _with_optimistic(self, data: PlayerData) -> PlayerData:
+        """Record ``data`` as confirmed and apply the pending optimistic values.
+
+        A value is dropped once the player reports it (confirmed) or once it
+        expired (rolled back to what the player reports).
+        """
+        self.confirmed_data = data
+        if not self._optimistic:
+            return data
+
+        now = time.monotonic()
+        changes: dict[str, dict[str, Any]] = {"status": {}, "volume": {}}
+        for (section, name), optimistic in list(self._optimistic.items()):
+            model = getattr(data, section)
+            if (
+                model is None
+                or getattr(model, name) == optimistic.value
+                or now >= optimistic.expires
+            ):
+                del self._optimistic[(section, name)]
+                continue
+            changes[section][name] = optimistic.value
+
+        replacements = {
+            section: dataclasses.replace(getattr(data, section), **fields)
+            for section, fields in changes.items()
+            if fields
+        }
+        return dataclasses.replace(data, **replacements) if replacements else data
+
+    def _is_due(self, key: str, now: float | None = None) -> bool:
+        """Return True if an endpoint's refresh tier says it should be fetched."""
+        fetched_at = self._fetched_at.get(key)
+        if fetched_at is None:
+            return True
+        # Fetch times are taken at the start of a cycle; allow for timer jitter
+        elapsed = (now or time.monotonic()) - fetched_at
+        return elapsed >= self._intervals[key] - DUE_TOLERANCE
+
+    @callback
+    def async_invalidate_cache(self, key: str | None = None) -> None:
+        """Make an endpoint (or every endpoint) due on the next refresh."""
+        if key is None:
+            self._fetched_at.clear()
+        else:
+            self._fetched_at.pop(key, None)
+
+    async def _async_update_data(self) -> PlayerData:
+        """Fetch data from API.
 
-    async def _async_update_data(self):
-        """Fetch data from API."""
+        Only the endpoints whose tier is due are fetched, and those are
+        fetched concurrently, so a cycle costs about the slowest single
+        request. Endpoints that miss UPDATE_CYCLE_DEADLINE keep their previous
+        data instead of holding back the others. A grouped slave takes its
+        now-playing fields from the master's coordinator and only fetches
+        its own /Volume and /SyncStatus.
+        """
+        now = time.monotonic()
         try:
-            status = await self.hass.async_add_executor_job(self.api.get_status)
-            sync_status = await self.hass.async_add_executor_job(
-                self.api.get_sync_status
+            previous = self.confirmed_data
+            master = (
+                self._async_master_coordinator()
+                if previous is not None and self.api.reachable
+                else None
             )
-            presets = await self.hass.async_add_executor_job(self.api.get_presets)
-            volume = await self.hass.async_add_executor_job(self.api.get_volume)
 
+            status_task = asyncio.create_task(
+                self._async_fetch_status(
+                    master is None
+                    and (
+                        previous is None
+                        or self.following
+                        or self._is_due("status", now)
+                        or not self.api.reachable
+                    )
+                )
+            )
+            fetches: dict[str, Awaitable[Any]] = {
+                "status": status_task,
+                # Runs in its own task so a slow /SyncStatus can't take the
+                # fresh /Status down with it at the deadline
+                "sync_status": self._async_get_sync_status(status_task),
+            }
+            self._async_update_volume_tier(previous)
+            # An offline player is only probed with /Status until it answers
+            if self.api.reachable and self._is_due("volume", now):
+                fetches["volume"] = self.api.get_volume()
+            if self.api.reachable and self._is_due("presets", now):
+                fetches["presets"] = self.api.get_presets()
+
+            results = await self._async_fetch_concurrently(fetches)
+
+            status = results.get("status")
             if status is None:
                 raise UpdateFailed("Failed to fetch player status")
+            sync_status = results.get("sync_status")
+            if sync_status is None:
+                sync_status = previous.sync_status if previous else SyncState()
 
-            return {
-                "status": status,
-                "sync_status": sync_status or {},
-                "presets": presets,
-                "volume": volume or {},
-            }
+            self.following = master is not None
+            if master is not None:
+                status = _follow(status, master.confirmed_data.status)
+            self._etags["status"] = status.etag or None
+
+            presets = results.get("presets")
+            if presets is None:
+                presets = previous.presets if previous else ()
+            else:
+                self._fetched_at["presets"] = now
+                self._presets_version = status.presets_version or None
+
+            volume = results.get("volume")
+            standalone = not self._is_grouped(sync_status)
+            if volume is not None:
+                self._fetched_at["volume"] = now
+                self._volume_mismatch = standalone and (
+                    (volume.volume, volume.mute) != (status.volume, status.mute)
+                )
+            self._volume_from_status = standalone and not self._volume_mismatch
+            if volume is None:
+                if self._volume_from_status:
+                    volume = _status_volume(status)
+                else:
+                    volume = previous.volume if previous else None
+
+            data = PlayerData(
+                status=status,
+                sync_status=sync_status,
+                presets=presets,
+                volume=volume,
+            )
+            self._check_presets(data)
+            return self._with_optimistic(data)
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        finally:
+            self.api.metrics.record_cycle(time.monotonic() - now)
+
+    @callback
+    def _is_grouped(self, sync_status: SyncState | None) -> bool:
+        """Return True if the player is a master or slave (or its role is unknown)."""
+        if sync_status is None:
+            return True
+        if sync_status.master or sync_status.slaves:
+            return True
+        topology = self.hass.data.get(DOMAIN, {}).get(DATA_TOPOLOGY)
+        return topology is not None and bool(
+            topology.master_of(self.api.host) or topology.slaves_of(self.api.host)
+        )
+
+    @callback
+    def _async_update_volume_tier(self, data: PlayerData | None) -> None:
+        """Fetch /Volume as often as the player's group role needs it.
+
+        /Status reports the master's volume on a grouped player, so its own
+        /Volume is fetched every WARM_INTERVAL. An ungrouped player reports
+        the same volume in both, so /Volume is only fetched every
+        VOLUME_VERIFY_INTERVAL to check that; if the two disagree, /Volume is
+        fetched as if the player were grouped until they agree again.
+        """
+        standalone = (
+            data is not None
+            and self._volume_from_status
+            and not self._is_grouped(data.sync_status)
+        )
+        self._intervals["volume"] = (
+            VOLUME_VERIFY_INTERVAL if standalone else WARM_INTERVAL
+        )
+
+    @callback
+    def _check_presets(self, data: PlayerData) -> bool:
+        """Invalidate the cached presets if the status shows they are stale.
+
+        The list is stale when the presets version (prid) in /Status moved on,
+        or when the player reports a preset id the cached list doesn't know.
+        """
+        status = data.status
+        stale = False
+
+        version = status.presets_version or None
+        if version and self._presets_version and version != self._presets_version:
+            stale = True
+
+        preset_id = status.preset_id
+        if (
+            preset_id
+            and preset_id != self._unknown_preset_id
+            and all(preset.id != preset_id for preset in data.presets)
+        ):
+            # Only retry once per unknown id, it may simply not be a preset
+            self._unknown_preset_id = preset_id
+            stale = True
+
+        if stale:
+            _LOGGER.debug("%s: preset list changed, refreshing it", self.api.host)
+            self.async_invalidate_cache("presets")
+        return stale
+
+    async def _async_fetch_concurrently(
+        self, fetches: dict[str, Awaitable[Any]]
+    ) -> dict[str, Any]:
+        """Run fetches concurrently and return the results that made the deadline.
+
+        Fetches that are still running at the deadline are cancelled and
+        fetches that raised are left out, so callers get partial results.
+        """
+        tasks = {key: asyncio.ensure_future(fetch) for key, fetch in fetches.items()}
+        done, pending = await asyncio.wait(
+            tasks.values(), timeout=UPDATE_CYCLE_DEADLINE
+        )
+        for task in pending:
+            task.cancel()
+        # Let the cancelled fetches unwind before their results are dropped
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results: dict[str, Any] = {}
+        for key, task in tasks.items():
+            if task in pending:
+                _LOGGER.debug(
+                    "%s: %s missed the %ss update deadline",
+                    self.api.host,
+                    key,
+                    UPDATE_CYCLE_DEADLINE,
+                )
+            elif (err := task.exception()) is not None:
+                _LOGGER.debug("%s: fetching %s failed: %s", self.api.host, key, err)
+            else:
+                results[key] = task.result()
+        return results
+
+    async def _async_fetch_status(self, refresh: bool) -> PlayerStatus | None:
+        """Fetch /Status if due, otherwise return the confirmed one."""
+        started = time.monotonic()
+        if not refresh:
+            return self.confirmed_data.status
+        status = await self.api.get_status()
+        if status is not None:
+            self._fetched_at["status"] = started
+        return status
+
+    async def _async_get_sync_status(
+        self, status_task: asyncio.Task[PlayerStatus | None]
+    ) -> SyncState | None:
+        """Return SyncStatus, only fetching it when the player reports a change.
+
+        Group topology and device identity rarely change. In push mode the
+        SyncStatus watch keeps them current; otherwise /Status carries a
+        syncStat counter that changes whenever SyncStatus does. Either way it
+        is verified once its refresh tier is due. Returns None if /Status
+        failed.
+        """
+        started = time.monotonic()
+        # Shielded: cancelling this fetch at the deadline must not cancel /Status
+        status = await asyncio.shield(status_task)
+        if status is None:
+            return None
+
+        previous = self.data.sync_status if self.data else None
+        if (
+            previous is not None
+            and not self._is_due("sync_status")
+            and (self.push_updates or status.sync_stat == self._sync_stat)
+        ):
+            return previous
+
+        sync_status = await self.api.get_sync_status()
+        if sync_status is None:
+            return previous or SyncState()
+
+        self._sync_stat = status.sync_stat
+        self._etags["sync_status"] = sync_status.etag or None
+        self._fetched_at["sync_status"] = started
+        return sync_status
+
+    @callback
+    def async_start_push(self) -> None:
+        """Start the long-poll loops if push updates are enabled."""
+        if not self.push_updates:
+            return
+
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_watch("status", self.api.get_status),
+            f"BluOS status watch {self.api.host}",
+        )
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_watch("sync_status", self.api.get_sync_status),
+            f"BluOS sync status watch {self.api.host}",
+        )
+
+    async def _async_watch(
+        self,
+        key: str,
+        fetch: Callable[[int, str | None], Awaitable[PlayerStatus | SyncState | None]],
+    ) -> None:
+        """Long-poll an endpoint and push every change to the listeners.
+
+        The player holds each request open until the endpoint's etag changes
+        (or the long-poll timeout expires), so an unchanged endpoint costs one
+        request per LONG_POLL_TIMEOUT and only ``coordinator.data[key]`` is
+        replaced when the player reports a change.
+        """
+        while True:
+            if key == "status" and self.following:
+                # The master shares its status; check back for an ungroup
+                await asyncio.sleep(WARM_INTERVAL)
+                continue
+
+            etag = self._etags[key]
+            result = await fetch(LONG_POLL_TIMEOUT, etag)
+
+            if result is None:
+                # Player unreachable; the regular refresh reports the failure
+                # and backs off, the watch retries at the same pace
+                await asyncio.sleep(max(LONG_POLL_RETRY_INTERVAL, self.poll_interval))
+                continue
+
+            new_etag = result.etag or None
+            if new_etag is None:
+                # Firmware without etag support cannot long-poll
+                _LOGGER.warning(
+                    "%s does not report an etag for %s, falling back to polling",
+                    self.api.host,
+                    key,
+                )
+                self.push_updates = False
+                self._intervals["sync_status"] = WARM_INTERVAL
+                self._async_update_cadence()
+                return
+
+            # Every answer confirms the endpoint, changed or not
+            self._fetched_at[key] = time.monotonic()
+
+            if not self.last_update_success:
+                # The player is back; don't wait for the backed-off poll
+                await self.async_request_refresh()
+
+            if new_etag != etag and self.confirmed_data is not None:
+                self._etags[key] = new_etag
+                changes: dict[str, Any] = {key: result}
+                if key == "status" and self._volume_from_status:
+                    changes["volume"] = _status_volume(result)
+                regrouped = (
+                    key == "sync_status"
+                    and self._volume_from_status
+                    and self._is_grouped(result)
+                )
+                if regrouped:
+                    # /Status now carries the master's volume; fetch our own
+                    self._volume_from_status = False
+                    self.async_invalidate_cache("volume")
+                data = dataclasses.replace(self.confirmed_data, **changes)
+                self.async_set_updated_data(self._with_optimistic(data))
+                if regrouped or (key == "status" and self._check_presets(data)):
+                    await self.async_request_refresh()
+
+            # BluOS asks clients not to issue long-polls back to back
+            await asyncio.sleep(LONG_POLL_MIN_INTERVAL)
+
+
+def _status_volume(status: PlayerStatus) -> VolumeState:
+    """Return the volume an ungrouped player reports in /Status."""
+    return VolumeState(volume=status.volume, mute=status.mute, db=status.db)
+
+
+def _follow(status: PlayerStatus, master: PlayerStatus) -> PlayerStatus:
+    """Return a slave's status with the master's now-playing fields."""
+    return dataclasses.replace(
+        status, **{name: getattr(master, name) for name in NOW_PLAYING_FIELDS}
+    )
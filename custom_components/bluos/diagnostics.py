@@ -0,0 +1,56 @@
+"""Diagnostics support for BluOS."""
+from __future__ import annotations
+
+import dataclasses
+import re
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SCHEDULER, DOMAIN
+from .coordinator import BluOSDataUpdateCoordinator
+
+TO_REDACT = {"mac"}
+# The MAC address in raw SyncStatus responses of the request trace
+MAC_ATTRIBUTE = re.compile(r'mac="[^"]*"')
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: BluOSDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    scheduler = hass.data[DOMAIN].get(DATA_SCHEDULER)
+
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "push_updates": coordinator.push_updates,
+            "poll_interval": coordinator.poll_interval,
+            "intervals": coordinator.refresh_intervals,
+            "failed_cycles": coordinator.failed_cycles,
+        },
+        "api": {
+            "reachable": coordinator.api.reachable,
+            "consecutive_failures": coordinator.api.failures,
+        },
+        "metrics": coordinator.api.metrics.as_dict(),
+        "scheduler": dict(scheduler.stats) if scheduler else None,
+        "listening": coordinator.listening.as_dict(),
+        "trace": [
+            entry | {"body": MAC_ATTRIBUTE.sub('mac="**REDACTED**"', entry["body"])}
+            for entry in coordinator.api.trace.as_list()
+        ],
+        "data": async_redact_data(
+            dataclasses.asdict(coordinator.confirmed_data)
+            if coordinator.confirmed_data
+            else {},
+            TO_REDACT,
+        ),
+    }
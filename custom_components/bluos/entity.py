@@ -0,0 +1,71 @@
+"""Base entity for BluOS."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DEFAULT_PORT, DOMAIN
+from .coordinator import BluOSDataUpdateCoordinator
+from .models import SyncState
+
+
+class BluOSEntity(CoordinatorEntity[BluOSDataUpdateCoordinator]):
+    """Coordinator entity that only writes state when its data changed.
+
+    Subclasses list the ``PlayerData`` fields their state depends on in
+    ``_update_fields`` (dotted paths as reported by ``PlayerData.diff``, e.g.
+    ``"status.state"`` or ``"volume"``). Refreshes that change none of them
+    don't reach the recorder or the websocket clients.
+    """
+
+    # None means every change is relevant
+    _update_fields: frozenset[str] | None = None
+
+    def __init__(self, coordinator: BluOSDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._last_available: bool | None = None
+
+    @staticmethod
+    def _device_info(
+        coordinator: BluOSDataUpdateCoordinator, entry: ConfigEntry
+    ) -> DeviceInfo:
+        """Return the device of a player, the same for all of its entities.
+
+        Platforms are set up concurrently, so whichever entity registers
+        first creates the device; each one must carry its name and model.
+        """
+        # SyncStatus is more detailed than Status
+        sync_status = coordinator.data.sync_status if coordinator.data else SyncState()
+        device_name = sync_status.device_name
+        if not device_name and coordinator.data:
+            device_name = coordinator.data.status.name
+        return DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=device_name or "BluOS Player",  # e.g., "FLEX Speaker"
+            manufacturer=sync_status.brand or "Pimmeke1989",  # e.g., "Bluesound"
+            # e.g., "PULSE FLEX 2i" or "P125"
+            model=sync_status.model_name or sync_status.model or "BluOS Player",
+            configuration_url=(
+                f"http://{entry.data[CONF_HOST]}:{entry.data.get(CONF_PORT, DEFAULT_PORT)}"
+            ),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state if availability or one of the watched fields changed."""
+        available = self.available
+        if available != self._last_available or self._has_relevant_change():
+            self._last_available = available
+            self.async_write_ha_state()
+
+    @callback
+    def _has_relevant_change(self) -> bool:
+        """Return True if the last coordinator update touched watched fields."""
+        changed = self.coordinator.changed_fields
+        if self._update_fields is None:
+            return bool(changed)
+        return not self._update_fields.isdisjoint(changed)
@@ -0,0 +1,111 @@
+"""Host to config entry to entity index for BluOS players."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_HOST_INDEX_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BluOSHostIndex:
+    """Map player hosts to config entries and media_player entity ids.
+
+    Group attributes and the join/unjoin services translate IPs reported by
+    SyncStatus into entities. Scanning the entity registry for that is
+    O(registry size); this index answers in O(1) and follows the registry
+    through its update events (entities created, renamed or removed).
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._entry_by_host: dict[str, str] = {}
+        self._host_by_entry: dict[str, str] = {}
+        self._entity_by_entry: dict[str, str] = {}
+        self._entry_by_entity: dict[str, str] = {}
+        self._unsub_registry: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_entry(self, entry_id: str, host: str) -> None:
+        """Index a config entry and its media_player entity (if registered)."""
+        self._entry_by_host[host] = entry_id
+        self._host_by_entry[entry_id] = host
+
+        registry = er.async_get(self.hass)
+        for entity in er.async_entries_for_config_entry(registry, entry_id):
+            if entity.domain == Platform.MEDIA_PLAYER:
+                self._async_set_entity(entry_id, entity.entity_id)
+
+        if self._unsub_registry is None:
+            self._unsub_registry = self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated
+            )
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Drop a config entry from the index."""
+        host = self._host_by_entry.pop(entry_id, None)
+        if host is not None and self._entry_by_host.get(host) == entry_id:
+            del self._entry_by_host[host]
+        entity_id = self._entity_by_entry.pop(entry_id, None)
+        if entity_id is not None:
+            self._entry_by_entity.pop(entity_id, None)
+
+        if not self._host_by_entry and self._unsub_registry is not None:
+            self._unsub_registry()
+            self._unsub_registry = None
+
+    @callback
+    def entry_id_for_host(self, host: str | None) -> str | None:
+        """Return the config entry id of the player at ``host``."""
+        return self._entry_by_host.get(host) if host else None
+
+    @callback
+    def entity_id_for_host(self, host: str | None) -> str | None:
+        """Return the media_player entity id of the player at ``host``."""
+        entry_id = self.entry_id_for_host(host)
+        return self._entity_by_entry.get(entry_id) if entry_id else None
+
+    @callback
+    def entry_id_for_entity(self, entity_id: str) -> str | None:
+        """Return the config entry id of a BluOS media_player entity."""
+        return self._entry_by_entity.get(entity_id)
+
+    @callback
+    def _async_set_entity(self, entry_id: str, entity_id: str) -> None:
+        """Point a config entry at its media_player entity."""
+        old_entity_id = self._entity_by_entry.get(entry_id)
+        if old_entity_id is not None:
+            self._entry_by_entity.pop(old_entity_id, None)
+        self._entity_by_entry[entry_id] = entity_id
+        self._entry_by_entity[entity_id] = entry_id
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Follow media_player entities being created, renamed or removed."""
+        action = event.data["action"]
+        entity_id = event.data["entity_id"]
+        if not entity_id.startswith(f"{Platform.MEDIA_PLAYER}."):
+            return
+
+        if action == "remove":
+            entry_id = self._entry_by_entity.pop(entity_id, None)
+            if entry_id is None:
+                return
+            self._entity_by_entry.pop(entry_id, None)
+        else:
+            entity = er.async_get(self.hass).async_get(entity_id)
+            if entity is None or entity.config_entry_id not in self._host_by_entry:
+                return
+            if self._entity_by_entry.get(entity.config_entry_id) == entity_id:
+                return
+            self._async_set_entity(entity.config_entry_id, entity_id)
+
+        _LOGGER.debug("Host index updated for %s (%s)", entity_id, action)
+        async_dispatcher_send(self.hass, SIGNAL_HOST_INDEX_UPDATED)
@@ -0,0 +1,297 @@
+"""Listening statistics of a BluOS player.
+
+The coordinator feeds every /Status it confirms to ``BluOSListeningStats``,
+which keeps running totals instead of history: rolling windows of fixed-size
+time buckets and top-K sketches with a fixed number of counters. An update
+touches one bucket and a few counters, however long the player has been
+playing, and the state stays the same size.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    LISTENING_DAY_BUCKETS,
+    LISTENING_MAX_GAP,
+    LISTENING_SAVE_DELAY,
+    LISTENING_TOP_SIZE,
+    LISTENING_WEEK_BUCKETS,
+)
+from .models import PlayerStatus
+
+STORAGE_VERSION = 1
+
+DAY = 86400
+WEEK = 7 * DAY
+
+
+class RollingWindow:
+    """Totals over the last ``count`` buckets of ``width`` seconds.
+
+    Buckets are a ring indexed by bucket number; a bucket is reset when the
+    ring wraps around to it, so old time falls out without being scanned.
+    """
+
+    __slots__ = ("width", "count", "_ids", "_seconds", "_tracks", "_sources")
+
+    def __init__(self, width: float, count: int) -> None:
+        """Initialize an empty window."""
+        self.width = width
+        self.count = count
+        self._ids = [-1] * count
+        self._seconds = [0.0] * count
+        self._tracks = [0] * count
+        self._sources: list[dict[str, float]] = [{} for _ in range(count)]
+
+    def _bucket(self, now: float) -> int:
+        """Return the ring index of the bucket ``now`` falls in."""
+        bucket_id = int(now // self.width)
+        index = bucket_id % self.count
+        if self._ids[index] != bucket_id:
+            self._ids[index] = bucket_id
+            self._seconds[index] = 0.0
+            self._tracks[index] = 0
+            self._sources[index] = {}
+        return index
+
+    def add(self, now: float, source: str, seconds: float, tracks: int = 0) -> None:
+        """Add listening time and started tracks to the current bucket."""
+        index = self._bucket(now)
+        self._tracks[index] += tracks
+        if seconds:
+            self._seconds[index] += seconds
+            sources = self._sources[index]
+            sources[source] = sources.get(source, 0.0) + seconds
+
+    def totals(self, now: float) -> tuple[float, int, dict[str, float]]:
+        """Return the seconds, tracks and seconds per source within the window."""
+        oldest = int(now // self.width) - self.count + 1
+        seconds = 0.0
+        tracks = 0
+        sources: dict[str, float] = {}
+        for index, bucket_id in enumerate(self._ids):
+            if bucket_id < oldest:
+                continue
+            seconds += self._seconds[index]
+            tracks += self._tracks[index]
+            for source, source_seconds in self._sources[index].items():
+                sources[source] = sources.get(source, 0.0) + source_seconds
+        return seconds, tracks, sources
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the buckets, for storage."""
+        return {
+            "ids": self._ids,
+            "seconds": self._seconds,
+            "tracks": self._tracks,
+            "sources": self._sources,
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Restore buckets saved by ``as_dict`` (ignored if the layout changed)."""
+        if len(data.get("ids", ())) != self.count:
+            return
+        self._ids = list(data["ids"])
+        self._seconds = list(data["seconds"])
+        self._tracks = list(data["tracks"])
+        self._sources = [dict(sources) for sources in data["sources"]]
+
+
+class TopK:
+    """Space-Saving sketch of the heaviest keys, with at most ``size`` counters.
+
+    Known keys are counted exactly. A new key replaces the smallest counter
+    once the sketch is full and inherits its count, which bounds the error
+    of every reported count by the smallest counter.
+    """
+
+    __slots__ = ("size", "_counts")
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty sketch."""
+        self.size = size
+        self._counts: dict[str, float] = {}
+
+    def add(self, key: str, weight: float = 1) -> None:
+        """Count ``weight`` for ``key``."""
+        counts = self._counts
+        if key in counts:
+            counts[key] += weight
+        elif len(counts) < self.size:
+            counts[key] = weight
+        else:
+            smallest = min(counts, key=counts.__getitem__)
+            counts[key] = counts.pop(smallest) + weight
+
+    def top(self, number: int | None = None) -> list[tuple[str, float]]:
+        """Return the heaviest keys, heaviest first."""
+        ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:number]
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters, for storage."""
+        return dict(self._counts)
+
+    def load(self, data: dict[str, float]) -> None:
+        """Restore counters saved by ``as_dict``."""
+        ranked = sorted(data.items(), key=lambda item: item[1], reverse=True)
+        self._counts = dict(ranked[: self.size])
+
+
+class BluOSListeningStats:
+    """Listening time, track counts and top stations/artists of one player.
+
+    Time is counted from one confirmed /Status to the next while the player
+    plays, attributed to the source (service) and station it was playing.
+    Gaps longer than LISTENING_MAX_GAP (Home Assistant was stopped, the
+    player was offline) count as that long at most. Snapshots are saved to
+    storage LISTENING_SAVE_DELAY after the first change.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the statistics."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, storage_key(entry_id)
+        )
+        self.day = RollingWindow(DAY / LISTENING_DAY_BUCKETS, LISTENING_DAY_BUCKETS)
+        self.week = RollingWindow(WEEK / LISTENING_WEEK_BUCKETS, LISTENING_WEEK_BUCKETS)
+        self.stations = TopK(LISTENING_TOP_SIZE)
+        self.artists = TopK(LISTENING_TOP_SIZE)
+        self.total_seconds = 0.0
+        self.total_tracks = 0
+        # The previous sample: (wall time, playing, source, station, track, secs)
+        self._last: tuple[float, bool, str, str, tuple[str, str], int] | None = None
+        # (artist, title) of the last track played, kept across restarts
+        self._track: tuple[str, str] | None = None
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Restore the last snapshot."""
+        if not (data := await self._store.async_load()):
+            return
+        self.day.load(data.get("day", {}))
+        self.week.load(data.get("week", {}))
+        self.stations.load(data.get("stations", {}))
+        self.artists.load(data.get("artists", {}))
+        self.total_seconds = data.get("total_seconds", 0.0)
+        self.total_tracks = data.get("total_tracks", 0)
+        if track := data.get("track"):
+            self._track = (track[0], track[1])
+
+    @callback
+    def async_update(self, status: PlayerStatus, now: float | None = None) -> None:
+        """Account for the time since the previous status and record ``status``."""
+        now = time.time() if now is None else now
+        playing = status.state == "playing"
+        source = status.service_name or status.service or "Unknown"
+        station = _station(status)
+        track = (status.artist, status.title)
+
+        seconds = 0.0
+        tracks = 0
+        last = self._last
+        if last is not None and last[1]:
+            seconds = min(max(now - last[0], 0.0), LISTENING_MAX_GAP)
+        if playing and (track[0] or track[1]):
+            # A new track, or the same one started over (repeat); resuming
+            # after a pause or a restart of Home Assistant is neither
+            restarted = (
+                last is not None
+                and last[1]
+                and track == last[4]
+                and status.secs < last[5]
+            )
+            if track != self._track or restarted:
+                tracks = 1
+            self._track = track
+        self._last = (now, playing, source, station, track, status.secs)
+        if not seconds and not tracks:
+            return
+
+        # Time since the previous sample belongs to what played back then
+        if seconds:
+            source, station = last[2], last[3]
+        self.day.add(now, source, seconds, tracks)
+        self.week.add(now, source, seconds, tracks)
+        self.total_seconds += seconds
+        self.total_tracks += tracks
+        if seconds and station:
+            self.stations.add(station, seconds)
+        if tracks and track[0]:
+            self.artists.add(track[0])
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save a snapshot soon, unless one is already scheduled.
+
+        ``Store.async_delay_save`` restarts its delay on every call, so it is
+        only called once per snapshot; it also writes on shutdown.
+        """
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._snapshot, LISTENING_SAVE_DELAY)
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the statistics to save."""
+        self._save_pending = False
+        return {
+            "day": self.day.as_dict(),
+            "week": self.week.as_dict(),
+            "stations": self.stations.as_dict(),
+            "artists": self.artists.as_dict(),
+            "total_seconds": self.total_seconds,
+            "total_tracks": self.total_tracks,
+            "track": list(self._track) if self._track else None,
+        }
+
+    def as_dict(self, now: float | None = None) -> dict[str, Any]:
+        """Return the current statistics, for the sensors and diagnostics."""
+        now = time.time() if now is None else now
+        result: dict[str, Any] = {}
+        for name, window in (("day", self.day), ("week", self.week)):
+            seconds, tracks, sources = window.totals(now)
+            result[name] = {
+                "seconds": round(seconds),
+                "tracks": tracks,
+                "sources": {
+                    source: round(source_seconds)
+                    for source, source_seconds in sorted(
+                        sources.items(), key=lambda item: item[1], reverse=True
+                    )
+                },
+            }
+        result["total_seconds"] = round(self.total_seconds)
+        result["total_tracks"] = self.total_tracks
+        result["top_stations"] = {
+            station: round(seconds) for station, seconds in self.stations.top()
+        }
+        result["top_artists"] = {
+            artist: int(plays) for artist, plays in self.artists.top()
+        }
+        return result
+
+
+def storage_key(entry_id: str) -> str:
+    """Return the storage key of a player's statistics."""
+    return f"{DOMAIN}.listening.{entry_id}"
+
+
+def _station(status: PlayerStatus) -> str:
+    """Return the station a status is playing, or "" for tracks.
+
+    Streams have no length; the radio format puts the station name in
+    title1, which the API also reports as the album.
+    """
+    if status.is_preset and status.preset_name:
+        return status.preset_name
+    if status.totlen:
+        return ""
+    return status.album or status.title1
@@ -0,0 +1,201 @@
+"""Lenbrook Service Discovery Protocol (LSDP) client.
+
+BluOS players announce themselves over UDP broadcast on port 11430. A query
+names the node classes it is interested in; every matching node answers
+with an announce message carrying its IP address and a few TXT records
+(name, port, model, version).
+
+Packet layout (all integers big-endian):
+
+    header:   length (1, =6) | "LSDP" | version (1, =1)
+    message:  length (1) | type (1) | type-specific body
+    query:    count (1) | class id (2) * count
+    announce: node id length (1) | node id | address length (1) | address |
+              record count (1) | records
+    record:   class id (2) | txt count (1) | (key length (1) | key |
+              value length (1) | value) * txt count
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import ipaddress
+import logging
+import struct
+
+_LOGGER = logging.getLogger(__name__)
+
+LSDP_PORT = 11430
+LSDP_VERSION = 1
+LSDP_MAGIC = b"LSDP"
+
+MSG_QUERY_BROADCAST = ord("Q")
+MSG_ANNOUNCE = ord("A")
+
+# Node classes
+CLASS_PLAYER = 0x0001
+CLASS_SECONDARY_PLAYER = 0x0003
+CLASS_ZONE_PLAYER = 0x0006
+PLAYER_CLASSES = (CLASS_PLAYER, CLASS_SECONDARY_PLAYER, CLASS_ZONE_PLAYER)
+
+# Queries sent per discovery run (UDP broadcasts get lost)
+QUERY_REPEAT = 3
+
+
+@dataclass(frozen=True, slots=True)
+class LsdpNode:
+    """A BluOS node that answered a query."""
+
+    host: str
+    node_id: str
+    class_id: int
+    txt: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        """Return the node's name."""
+        return self.txt.get("name", self.host)
+
+    @property
+    def port(self) -> int:
+        """Return the node's HTTP port."""
+        return int(self.txt.get("port", 11000))
+
+
+def build_query(classes: tuple[int, ...] = PLAYER_CLASSES) -> bytes:
+    """Build a broadcast query for ``classes``."""
+    body = struct.pack(
+        f">BB{len(classes)}H", MSG_QUERY_BROADCAST, len(classes), *classes
+    )
+    return _header() + bytes([len(body) + 1]) + body
+
+
+def build_announce(
+    host: str, node_id: bytes, records: list[tuple[int, dict[str, str]]]
+) -> bytes:
+    """Build an announce message (used by the local responder stand-in)."""
+    address = ipaddress.IPv4Address(host).packed
+    body = bytearray([MSG_ANNOUNCE, len(node_id)])
+    body += node_id
+    body += bytes([len(address)]) + address
+    body.append(len(records))
+    for class_id, txt in records:
+        body += struct.pack(">HB", class_id, len(txt))
+        for key, value in txt.items():
+            key_bytes, value_bytes = key.encode(), value.encode()
+            body += bytes([len(key_bytes)]) + key_bytes
+            body += bytes([len(value_bytes)]) + value_bytes
+    return _header() + bytes([len(body) + 1]) + bytes(body)
+
+
+def parse_packet(data: bytes) -> list[LsdpNode]:
+    """Return the player nodes announced in an LSDP packet.
+
+    Queries, deletes and malformed packets yield no nodes.
+    """
+    try:
+        if data[0] != 6 or data[1:5] != LSDP_MAGIC or data[5] != LSDP_VERSION:
+            return []
+        nodes: list[LsdpNode] = []
+        offset = 6
+        while offset < len(data):
+            length = data[offset]
+            if length == 0:
+                break
+            message = data[offset + 1 : offset + length]
+            offset += length
+            if message and message[0] == MSG_ANNOUNCE:
+                nodes.extend(_parse_announce(message))
+        return nodes
+    except (IndexError, struct.error, UnicodeDecodeError, ValueError):
+        return []
+
+
+def _header() -> bytes:
+    """Return the packet header."""
+    return bytes([6]) + LSDP_MAGIC + bytes([LSDP_VERSION])
+
+
+def _parse_announce(message: bytes) -> list[LsdpNode]:
+    """Parse an announce message body (starting at its type byte)."""
+    offset = 1
+
+    def read_bytes() -> bytes:
+        """Read a length-prefixed field."""
+        nonlocal offset
+        length = message[offset]
+        value = message[offset + 1 : offset + 1 + length]
+        if len(value) != length:
+            raise ValueError("Truncated LSDP announce")
+        offset += 1 + length
+        return value
+
+    node_id = read_bytes().hex(":")
+    host = str(ipaddress.ip_address(read_bytes()))
+    record_count = message[offset]
+    offset += 1
+
+    nodes = []
+    for _ in range(record_count):
+        (class_id,) = struct.unpack_from(">H", message, offset)
+        txt_count = message[offset + 2]
+        offset += 3
+        txt = {}
+        for _ in range(txt_count):
+            key = read_bytes().decode()
+            txt[key] = read_bytes().decode()
+        if class_id in PLAYER_CLASSES:
+            nodes.append(LsdpNode(host, node_id, class_id, txt))
+    return nodes
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Collect announces."""
+
+    def __init__(self) -> None:
+        """Initialize the protocol."""
+        self.nodes: dict[tuple[str, int], LsdpNode] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Record the players in an announce."""
+        for node in parse_packet(data):
+            self.nodes.setdefault((node.host, node.port), node)
+
+    def error_received(self, exc: Exception) -> None:
+        """Log socket errors (e.g. ICMP port unreachable)."""
+        _LOGGER.debug("LSDP socket error: %s", exc)
+
+
+async def async_discover(
+    timeout: float = 3,
+    target: tuple[str, int] = ("255.255.255.255", LSDP_PORT),
+) -> list[LsdpNode]:
+    """Broadcast a query and return the players that answered within ``timeout``.
+
+    Players broadcast their announce to port 11430, so the socket listens
+    there when it can; otherwise (e.g. a local responder owns the port) it
+    still receives answers sent straight back to it.
+    """
+    loop = asyncio.get_running_loop()
+    transport: asyncio.DatagramTransport | None = None
+    for port in (LSDP_PORT, 0):
+        try:
+            transport, protocol = await loop.create_datagram_endpoint(
+                _DiscoveryProtocol,
+                local_addr=("0.0.0.0", port),
+                allow_broadcast=True,
+            )
+            break
+        except OSError as err:
+            _LOGGER.debug("Cannot listen on UDP port %s: %s", port, err)
+    if transport is None:
+        return []
+
+    try:
+        query = build_query()
+        for _ in range(QUERY_REPEAT):
+            transport.sendto(query, target)
+            await asyncio.sleep(timeout / QUERY_REPEAT)
+    finally:
+        transport.close()
+    return list(protocol.nodes.values())
@@ -1,33 +1,59 @@
 """BluOS Media Player platform."""
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import hashlib
 import logging
 from typing import Any
 
 import voluptuous as vol
 
+from homeassistant.components import media_source
 from homeassistant.components.media_player import (
+    BrowseError,
+    BrowseMedia,
+    MediaClass,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
     MediaType,
+    async_process_play_media_url,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import config_validation as cv, entity_platform, entity_registry as er
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
+from .artwork import BluOSArtworkCache
 from .const import (
+    ARTWORK_SIZE,
+    ARTWORK_THUMBNAIL_SIZE,
     ATTR_BLUEOS_GROUP,
     ATTR_MASTER,
     ATTR_SLAVES,
+    DATA_ARTWORK,
+    DATA_HOST_INDEX,
+    DATA_TOPOLOGY,
     DOMAIN,
+    MEDIA_TYPE_BLUOS,
+    POSITION_TOLERANCE,
     SERVICE_JOIN,
+    SERVICE_REFRESH,
     SERVICE_UNJOIN,
+    SIGNAL_HOST_INDEX_UPDATED,
+    SIGNAL_TOPOLOGY_UPDATED,
 )
-from .coordinator import BluOSDataUpdateCoordinator
+from .coordinator import BluOSDataUpdateCoordinator, async_get_coordinators
+from .entity import BluOSEntity
+from .host_index import BluOSHostIndex
+from .models import BrowseItem, BrowsePage
+from .topology import BluOSGroupTopology
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,8 +69,22 @@ SUPPORT_BLUOS = (
     | MediaPlayerEntityFeature.SELECT_SOURCE
     | MediaPlayerEntityFeature.SHUFFLE_SET
     | MediaPlayerEntityFeature.REPEAT_SET
+    | MediaPlayerEntityFeature.GROUPING
+    | MediaPlayerEntityFeature.BROWSE_MEDIA
 )
 
+# /Browse item types and how the media browser shows them
+BROWSE_MEDIA_CLASSES = {
+    "album": MediaClass.ALBUM,
+    "artist": MediaClass.ARTIST,
+    "composer": MediaClass.COMPOSER,
+    "genre": MediaClass.GENRE,
+    "playlist": MediaClass.PLAYLIST,
+    "song": MediaClass.TRACK,
+    "track": MediaClass.TRACK,
+    "audio": MediaClass.TRACK,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -73,13 +113,40 @@ async def async_setup_entry(
         "async_unjoin_player",
     )
 
+    platform.async_register_entity_service(
+        SERVICE_REFRESH,
+        {},
+        "async_refresh_player",
+    )
+
 
-class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
+class BluOSMediaPlayer(BluOSEntity, MediaPlayerEntity):
     """Representation of a BluOS media player."""
 
     _attr_has_entity_name = True
     _attr_name = None
 
+    # The playback position (status.secs) is deliberately missing: Home
+    # Assistant extrapolates it, see _async_track_position. Group fields are
+    # missing too: the domain's topology signals group changes.
+    _update_fields = frozenset(
+        {
+            "status.state",
+            "status.volume",
+            "status.mute",
+            "status.shuffle",
+            "status.repeat",
+            "status.service",
+            "status.title",
+            "status.artist",
+            "status.album",
+            "status.image",
+            "status.totlen",
+            "volume",
+            "presets",
+        }
+    )
+
     def __init__(
         self,
         coordinator: BluOSDataUpdateCoordinator,
@@ -89,30 +156,75 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_media_player"
-        
-        # Get device information from SyncStatus (more detailed than Status)
-        sync_status = coordinator.data.get("sync_status", {}) if coordinator.data else {}
-        
-        # Use device name from SyncStatus, fallback to Status, then default
-        device_name = sync_status.get("device_name", "")
-        if not device_name and coordinator.data and "status" in coordinator.data:
-            device_name = coordinator.data["status"].get("name", "BluOS Player")
-        if not device_name:
-            device_name = "BluOS Player"
-        
-        # Get model and brand from SyncStatus
-        model_name = sync_status.get("model_name", "")
-        model = sync_status.get("model", "BluOS Player")
-        brand = sync_status.get("brand", "Pimmeke1989")
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": device_name,  # e.g., "FLEX Speaker"
-            "manufacturer": brand,  # e.g., "Bluesound" or "Pimmeke1989"
-            "model": model_name if model_name else model,  # e.g., "PULSE FLEX 2i" or "P125"
-            "configuration_url": f"http://{entry.data[CONF_HOST]}:{entry.data.get('port', 11000)}",
-        }
+        self._attr_device_info = self._device_info(coordinator, entry)
         self._attr_supported_features = SUPPORT_BLUOS
+        self._host_index: BluOSHostIndex = coordinator.hass.data[DOMAIN][DATA_HOST_INDEX]
+        self._topology: BluOSGroupTopology = coordinator.hass.data[DOMAIN][DATA_TOPOLOGY]
+        self._artwork: BluOSArtworkCache = coordinator.hass.data[DOMAIN][DATA_ARTWORK]
+        self._host: str = entry.data[CONF_HOST]
+
+        # Playback position as last reported to Home Assistant
+        self._position: int | None = None
+        self._position_updated_at: datetime | None = None
+        self._position_playing = False
+        self._async_track_position()
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to host index and group topology updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_HOST_INDEX_UPDATED, self._async_host_index_updated
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_TOPOLOGY_UPDATED, self._async_topology_updated
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state when the position jumped or a watched field changed."""
+        if self._async_track_position():
+            self._last_available = self.available
+            self.async_write_ha_state()
+            return
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_track_position(self) -> bool:
+        """Update the position snapshot if it no longer matches extrapolation.
+
+        Home Assistant extrapolates the position from media_position and
+        media_position_updated_at, so the regular progress of a playing
+        track doesn't need a state write. Only seeks, track changes and
+        play/pause transitions (or drift beyond POSITION_TOLERANCE) do.
+
+        Returns True if the snapshot was updated.
+        """
+        if not self.coordinator.data:
+            return False
+
+        status = self.coordinator.data.status
+        playing = status.state == "playing"
+        now = dt_util.utcnow()
+
+        if (
+            self._position is not None
+            and self._position_updated_at is not None
+            and playing == self._position_playing
+        ):
+            expected = self._position
+            if playing:
+                expected += (now - self._position_updated_at).total_seconds()
+            if abs(status.secs - expected) <= POSITION_TOLERANCE:
+                return False
+
+        self._position = status.secs
+        self._position_updated_at = now
+        self._position_playing = playing
+        return True
 
     @property
     def state(self) -> MediaPlayerState:
@@ -120,7 +232,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return MediaPlayerState.OFF
         
-        state = self.coordinator.data["status"].get("state", "idle")
+        state = self.coordinator.data.status.state
         
         state_map = {
             "playing": MediaPlayerState.PLAYING,
@@ -136,26 +248,21 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         
         Uses /Volume endpoint which returns individual player volume,
         even when grouped (unlike /Status which returns master's volume).
+        For ungrouped players the coordinator fills it in from /Status.
         Falls back to /Status if /Volume fails.
         """
         if not self.coordinator.data:
             return None
         
         # Try to use volume from /Volume endpoint for accurate individual volume
-        volume_data = self.coordinator.data.get("volume", {})
-        _LOGGER.debug("volume_level: volume_data = %s", volume_data)
-        
-        if volume_data and "volume" in volume_data:
-            volume = volume_data.get("volume", 0)
-            _LOGGER.debug("volume_level: Using /Volume endpoint, volume = %s", volume)
+        volume_data = self.coordinator.data.volume
+        if volume_data is not None:
+            volume = volume_data.volume
         else:
             # Fallback to /Status volume if /Volume failed
-            volume = self.coordinator.data["status"].get("volume", 0)
-            _LOGGER.debug("volume_level: Using /Status fallback, volume = %s", volume)
+            volume = self.coordinator.data.status.volume
         
-        result = volume / 100
-        _LOGGER.debug("volume_level: Final result = %s", result)
-        return result
+        return volume / 100
 
     @property
     def is_volume_muted(self) -> bool | None:
@@ -168,12 +275,12 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             return None
         
         # Try to use mute from /Volume endpoint
-        volume_data = self.coordinator.data.get("volume", {})
-        if volume_data and "mute" in volume_data:
-            return volume_data.get("mute", False)
+        volume_data = self.coordinator.data.volume
+        if volume_data is not None:
+            return volume_data.mute
         else:
             # Fallback to /Status mute if /Volume failed
-            return self.coordinator.data["status"].get("mute", False)
+            return self.coordinator.data.status.mute
 
     @property
     def media_content_type(self) -> str | None:
@@ -187,7 +294,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             return None
         
         # Use parsed title (from title2) or fall back to title1
-        return self.coordinator.data["status"].get("title", "")
+        return self.coordinator.data.status.title
 
     @property
     def media_artist(self) -> str | None:
@@ -195,7 +302,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        return self.coordinator.data["status"].get("artist", "")
+        return self.coordinator.data.status.artist
 
     @property
     def media_album_name(self) -> str | None:
@@ -203,7 +310,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        return self.coordinator.data["status"].get("album", "")
+        return self.coordinator.data.status.album
 
     @property
     def media_image_url(self) -> str | None:
@@ -211,7 +318,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        image = self.coordinator.data["status"].get("image", "")
+        image = self.coordinator.data.status.image
         if image:
             # Image can be a full URL or a path
             if image.startswith("http://") or image.startswith("https://"):
@@ -225,19 +332,28 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Return the entity picture to use in the frontend.
         
         Shows media art when playing, otherwise None (uses default speaker icon).
+        The art goes through Home Assistant's image proxy, see
+        async_get_media_image.
         """
         # Only show media art when actually playing
         if self.state == MediaPlayerState.PLAYING:
-            return self.media_image_url
+            return super().entity_picture
         return None
 
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Return the now-playing art from the artwork cache, scaled down."""
+        url = self.media_image_url
+        if not url:
+            return None, None
+        return await self._artwork.async_get(url, ARTWORK_SIZE)
+
     @property
     def media_duration(self) -> int | None:
         """Duration of current playing media in seconds."""
         if not self.coordinator.data:
             return None
         
-        return self.coordinator.data["status"].get("totlen", 0)
+        return self.coordinator.data.status.totlen
 
     @property
     def media_position(self) -> int | None:
@@ -245,10 +361,10 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        return self.coordinator.data["status"].get("secs", 0)
+        return self._position
 
     @property
-    def media_position_updated_at(self):
+    def media_position_updated_at(self) -> datetime | None:
         """When was the position of the current playing media valid.
         
         Returns value from homeassistant.util.dt.utcnow().
@@ -257,16 +373,8 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        # Return the coordinator's last successful update time
-        # This is used by Home Assistant to calculate current position
-        from homeassistant.util import dt as dt_util
-        
-        # Use the coordinator's last update time if available
-        if hasattr(self.coordinator, 'last_update_success_time'):
-            return self.coordinator.last_update_success_time
-        
-        # Fallback: return current time (less accurate but works)
-        return dt_util.utcnow()
+        # Home Assistant calculates the current position from this
+        return self._position_updated_at
 
     @property
     def source(self) -> str | None:
@@ -274,7 +382,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        return self.coordinator.data["status"].get("service", "")
+        return self.coordinator.data.status.service
 
     @property
     def source_list(self) -> list[str] | None:
@@ -282,8 +390,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        presets = self.coordinator.data.get("presets", [])
-        return [preset["name"] for preset in presets]
+        return [preset.name for preset in self.coordinator.data.presets]
 
     @property
     def shuffle(self) -> bool | None:
@@ -291,7 +398,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        return self.coordinator.data["status"].get("shuffle", False)
+        return self.coordinator.data.status.shuffle
 
     @property
     def repeat(self) -> str | None:
@@ -299,7 +406,7 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not self.coordinator.data:
             return None
         
-        repeat_mode = self.coordinator.data["status"].get("repeat", "0")
+        repeat_mode = self.coordinator.data.status.repeat
         
         repeat_map = {
             "0": "off",
@@ -309,50 +416,49 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         
         return repeat_map.get(str(repeat_mode), "off")
 
+    @property
+    def group_members(self) -> list[str] | None:
+        """Return the entity ids of this player's group, master first."""
+        members = self._topology.members(self._host)
+        if not members:
+            return None
+        return [
+            entity_id
+            for host in members
+            if (entity_id := self._host_to_entity_id(host)) is not None
+        ]
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
         if not self.coordinator.data:
             return {}
         
-        sync_status = self.coordinator.data.get("sync_status", {})
-        
-        # Determine if this player is a master
-        is_master = bool(sync_status.get("slaves"))
-        is_slave = bool(sync_status.get("master"))
-        
-        # Build group information with entity IDs
-        group_members = []
-        master_entity = None
-        slave_entities = []
-        
-        if is_slave:
-            # This player is a slave
-            master_ip = sync_status.get("master")
-            master_entity = self._ip_to_entity_id(master_ip)
-            group_members.append(master_entity if master_entity else master_ip)
-            group_members.append(self.entity_id)
-        elif is_master:
-            # This player is a master
-            group_members.append(self.entity_id)
-            for slave in sync_status.get("slaves", []):
-                slave_ip = slave.get("ip")
-                slave_entity = self._ip_to_entity_id(slave_ip)
-                entity_or_ip = slave_entity if slave_entity else slave_ip
-                slave_entities.append(entity_or_ip)
-                group_members.append(entity_or_ip)
+        # Group information comes from the domain-wide topology, which merges
+        # what every player in the group reported
+        master_ip = self._topology.master_of(self._host)
+        slave_ips = self._topology.slaves_of(self._host)
+        is_slave = master_ip is not None
+        is_master = bool(slave_ips)
+        
+        # Build group information with entity IDs (IP if not in Home Assistant)
+        group_members = [
+            self._host_to_entity_id(host) or host
+            for host in self._topology.members(self._host)
+        ]
         
         return {
             ATTR_BLUEOS_GROUP: group_members,
-            ATTR_MASTER: master_entity if is_slave else None,
-            ATTR_SLAVES: slave_entities if is_master else [],
+            ATTR_MASTER: self._ip_to_entity_id(master_ip) if is_slave else None,
+            ATTR_SLAVES: [self._ip_to_entity_id(ip) or ip for ip in slave_ips],
             "is_master": is_master,
             "is_slave": is_slave,
-            "group_name": sync_status.get("zone", ""),
+            "group_name": self._topology.group_name(self._host),
         }
     
+    @callback
     def _ip_to_entity_id(self, ip: str | None) -> str | None:
-        """Convert IP address to entity ID by finding the matching coordinator.
+        """Convert IP address to entity ID using the domain's host index.
         
         Args:
             ip: IP address to convert
@@ -360,34 +466,26 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         Returns:
             Entity ID (e.g., "media_player.flex_speaker") or None if not found
         """
-        if not ip:
-            return None
-        
-        _LOGGER.debug("_ip_to_entity_id: Converting IP %s to entity ID", ip)
-        
-        # Get all BluOS coordinators from hass.data
-        bluos_data = self.hass.data.get(DOMAIN, {})
-        _LOGGER.debug("_ip_to_entity_id: Found %d BluOS entries", len(bluos_data))
-        
-        for entry_id, coordinator in bluos_data.items():
-            # Check if this coordinator's host matches the IP
-            if hasattr(coordinator, 'api') and coordinator.api.host == ip:
-                _LOGGER.debug("_ip_to_entity_id: Found matching coordinator for IP %s (entry_id: %s)", ip, entry_id)
-                # Found the coordinator, now find its media_player entity
-                try:
-                    entity_registry = er.async_get(self.hass)
-                    
-                    # Find media_player entity for this config entry
-                    for entity in entity_registry.entities.values():
-                        if (entity.config_entry_id == entry_id and 
-                            entity.domain == "media_player"):
-                            _LOGGER.debug("_ip_to_entity_id: Found entity %s for IP %s", entity.entity_id, ip)
-                            return entity.entity_id
-                except Exception as e:
-                    _LOGGER.error("_ip_to_entity_id: Error getting entity registry: %s", e)
-        
-        _LOGGER.warning("_ip_to_entity_id: Could not find entity for IP %s, returning IP", ip)
-        return None
+        return self._host_index.entity_id_for_host(ip)
+
+    @callback
+    def _host_to_entity_id(self, host: str) -> str | None:
+        """Like _ip_to_entity_id, but this player is always itself."""
+        if host == self._host:
+            return self.entity_id
+        return self._ip_to_entity_id(host)
+
+    @callback
+    def _async_host_index_updated(self) -> None:
+        """Rewrite group attributes after a BluOS entity was added or renamed."""
+        if self._topology.members(self._host):
+            self.async_write_ha_state()
+
+    @callback
+    def _async_topology_updated(self, hosts: set[str]) -> None:
+        """Rewrite group attributes when this player's group changed."""
+        if self._host in hosts:
+            self.async_write_ha_state()
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
@@ -397,58 +495,96 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Turn the media player off."""
         await self.async_media_stop()
 
+    async def _async_send(
+        self,
+        channel: str,
+        command: Callable[[], Awaitable[bool]],
+        status: dict[str, Any] | None = None,
+        volume: dict[str, Any] | None = None,
+    ) -> None:
+        """Send a command, showing its expected result right away.
+
+        The expected state is applied optimistically and rolled back if the
+        player rejects the command. The player's response carries the
+        resulting state, which is merged into the data, so no refresh is
+        needed. Commands on the same ``channel`` are latest-wins: during a
+        burst (e.g. a slider drag) only the newest one is sent after the one
+        in flight.
+        """
+        keys = self.coordinator.async_set_optimistic(status=status, volume=volume)
+        result = await self.coordinator.commands.async_send(channel, command)
+        if not result:
+            self.coordinator.async_clear_optimistic(keys)
+            return
+        self.coordinator.async_apply_command_result(result)
+
+    def _volume_changes(self, **changes: Any) -> dict[str, dict[str, Any]]:
+        """Return optimistic volume changes for the model volume_level reads."""
+        if self.coordinator.data and self.coordinator.data.volume is not None:
+            return {"volume": changes}
+        return {"status": changes}
+
     async def async_media_play(self) -> None:
         """Send play command."""
-        await self.hass.async_add_executor_job(self.coordinator.api.play)
-        await self.coordinator.async_request_refresh()
+        await self._async_send(
+            "transport", self.coordinator.api.play, status={"state": "playing"}
+        )
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
-        await self.hass.async_add_executor_job(self.coordinator.api.pause)
-        await self.coordinator.async_request_refresh()
+        await self._async_send(
+            "transport", self.coordinator.api.pause, status={"state": "paused"}
+        )
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
-        await self.hass.async_add_executor_job(self.coordinator.api.stop)
-        await self.coordinator.async_request_refresh()
+        # BluOS stops by pausing, so the player reports paused
+        await self._async_send(
+            "transport", self.coordinator.api.stop, status={"state": "paused"}
+        )
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
-        await self.hass.async_add_executor_job(self.coordinator.api.next_track)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.api.next_track()
+        await self.coordinator.async_refresh_endpoints("status")
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
-        await self.hass.async_add_executor_job(self.coordinator.api.previous_track)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.api.previous_track()
+        await self.coordinator.async_refresh_endpoints("status")
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.set_volume, int(volume * 100)
+        level = int(volume * 100)
+        await self._async_send(
+            "volume",
+            lambda: self.coordinator.api.set_volume(level),
+            **self._volume_changes(volume=level),
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute (true) or unmute (false) media player."""
-        await self.hass.async_add_executor_job(self.coordinator.api.mute, mute)
-        await self.coordinator.async_request_refresh()
+        await self._async_send(
+            "mute",
+            lambda: self.coordinator.api.mute(mute),
+            **self._volume_changes(mute=mute),
+        )
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        presets = self.coordinator.data.get("presets", [])
-        for preset in presets:
-            if preset["name"] == source:
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.select_preset, preset["id"]
-                )
-                await self.coordinator.async_request_refresh()
+        for preset in self.coordinator.data.presets:
+            if preset.name == source:
+                await self.coordinator.api.select_preset(preset.id)
+                await self.coordinator.async_refresh_endpoints("status")
                 return
 
     async def async_set_shuffle(self, shuffle: bool) -> None:
         """Enable/disable shuffle mode."""
-        await self.hass.async_add_executor_job(self.coordinator.api.shuffle, shuffle)
-        await self.coordinator.async_request_refresh()
+        await self._async_send(
+            "shuffle",
+            lambda: self.coordinator.api.shuffle(shuffle),
+            status={"shuffle": shuffle},
+        )
 
     async def async_set_repeat(self, repeat: str) -> None:
         """Set repeat mode."""
@@ -459,8 +595,149 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         }
         
         repeat_mode = repeat_map.get(repeat, 0)
-        await self.hass.async_add_executor_job(self.coordinator.api.repeat, repeat_mode)
-        await self.coordinator.async_request_refresh()
+        await self._async_send(
+            "repeat",
+            lambda: self.coordinator.api.repeat(repeat_mode),
+            status={"repeat": str(repeat_mode)},
+        )
+
+    async def async_browse_media(
+        self,
+        media_content_type: MediaType | str | None = None,
+        media_content_id: str | None = None,
+    ) -> BrowseMedia:
+        """Return a page of the player's /Browse tree.
+
+        Only the opened page is loaded. Long listings end in a "More" entry
+        that loads the next page, so a library of any size costs one
+        request per page the user actually looks at.
+        """
+        key = media_content_id or None
+        page = await self.coordinator.browser.async_get_page(key)
+        if page is None:
+            raise BrowseError(f"Cannot browse {key or 'BluOS'} on {self._host}")
+
+        item = self.coordinator.browser.find_item(key) if key else None
+        return self._browse_page(key or "", page, item)
+
+    def _browse_page(
+        self, key: str, page: BrowsePage, item: BrowseItem | None
+    ) -> BrowseMedia:
+        """Build the media browser node of a /Browse page."""
+        children = [self._browse_item(child) for child in page.items]
+        if page.next_key:
+            children.append(
+                BrowseMedia(
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_id=page.next_key,
+                    media_content_type=MEDIA_TYPE_BLUOS,
+                    title="More…",
+                    can_play=False,
+                    can_expand=True,
+                )
+            )
+
+        return BrowseMedia(
+            media_class=self._browse_media_class(item) if item else MediaClass.DIRECTORY,
+            media_content_id=key,
+            media_content_type=MEDIA_TYPE_BLUOS,
+            title=(item.text if item else page.service_name) or "BluOS",
+            can_play=bool(item and item.play_url),
+            can_expand=True,
+            children=children,
+            thumbnail=self._browse_image(
+                item.image if item else page.service_icon
+            ),
+        )
+
+    def _browse_item(self, item: BrowseItem) -> BrowseMedia:
+        """Build the media browser entry of a /Browse item.
+
+        Containers are identified by their browse key, entries that can
+        only be played by their play URL (which always starts with "/").
+        """
+        title = item.text
+        if item.text2:
+            title = f"{item.text} - {item.text2}"
+        return BrowseMedia(
+            media_class=self._browse_media_class(item),
+            media_content_id=item.browse_key or item.play_url,
+            media_content_type=MEDIA_TYPE_BLUOS,
+            title=title,
+            can_play=bool(item.play_url),
+            can_expand=bool(item.browse_key),
+            thumbnail=self._browse_image(item.image),
+        )
+
+    @staticmethod
+    def _browse_media_class(item: BrowseItem) -> MediaClass:
+        """Return the media class of a /Browse item."""
+        if item.type in BROWSE_MEDIA_CLASSES:
+            return BROWSE_MEDIA_CLASSES[item.type]
+        return MediaClass.DIRECTORY if item.browse_key else MediaClass.MUSIC
+
+    def _browse_image(self, image: str) -> str | None:
+        """Return the thumbnail URL of an image of the /Browse tree.
+
+        Images on the player go through the image proxy (see
+        async_get_browse_image), other images are linked directly.
+        """
+        if not image:
+            return None
+        if image.startswith(("http://", "https://")):
+            return image
+        # The proxy route takes the content id as one path segment, so it
+        # gets a slash-free digest; the path itself goes in the query string
+        content_id = hashlib.sha1(image.encode()).hexdigest()
+        return self.get_browse_image_url(MEDIA_TYPE_BLUOS, content_id, image)
+
+    async def async_get_browse_image(
+        self,
+        media_content_type: MediaType | str,
+        media_content_id: str,
+        media_image_id: str | None = None,
+    ) -> tuple[bytes | None, str | None]:
+        """Return a media browser thumbnail from the artwork cache."""
+        # Only proxy paths on this player, never arbitrary URLs
+        if not media_image_id or not media_image_id.startswith("/"):
+            return None, None
+        return await self._artwork.async_get(
+            f"{self.coordinator.api.base_url}{media_image_id}", ARTWORK_THUMBNAIL_SIZE
+        )
+
+    async def async_play_media(
+        self, media_type: MediaType | str, media_id: str, **kwargs: Any
+    ) -> None:
+        """Play a /Browse entry, a media source or a URL."""
+        if media_source.is_media_source_id(media_id):
+            play_item = await media_source.async_resolve_media(
+                self.hass, media_id, self.entity_id
+            )
+            media_id = async_process_play_media_url(self.hass, play_item.url)
+            media_type = MediaType.MUSIC
+
+        if media_type == MEDIA_TYPE_BLUOS:
+            action = media_id
+            if not action.startswith("/"):
+                # A container that can be played as a whole (e.g. an album)
+                item = self.coordinator.browser.find_item(media_id)
+                action = item.play_url if item else ""
+            if not action:
+                raise HomeAssistantError(f"{media_id} cannot be played")
+            success = await self.coordinator.api.play_action(action)
+        else:
+            success = await self.coordinator.api.play_url(media_id)
+
+        if not success:
+            _LOGGER.error("Playing %s on %s failed", media_id, self._host)
+            return
+        await self.coordinator.async_refresh_endpoints("status")
+
+    async def async_refresh_player(self) -> None:
+        """Refresh every endpoint now, including the cached presets."""
+        self.coordinator.async_invalidate_cache()
+        self.coordinator.browser.clear()
+        await self.coordinator.async_refresh()
 
     async def async_join_player(self, master: str) -> None:
         """Join this player to a master player."""
@@ -478,49 +755,47 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         master_coordinator = None
         master_ip = None
         
-        # Method 1: Try to find by matching entity_id to the coordinator's entities
-        from homeassistant.helpers import entity_registry as er
-        entity_reg = er.async_get(self.hass)
-        master_entity_entry = entity_reg.async_get(master)
+        # Method 1: Look up the master's config entry in the host index
+        master_entry_id = self._host_index.entry_id_for_entity(master)
         
-        if master_entity_entry:
-            _LOGGER.debug("Master entity entry found: config_entry_id=%s", master_entity_entry.config_entry_id)
-            # Try to find coordinator by config entry ID
-            if master_entity_entry.config_entry_id in self.hass.data[DOMAIN]:
-                master_coordinator = self.hass.data[DOMAIN][master_entity_entry.config_entry_id]
+        if master_entry_id:
+            _LOGGER.debug("Master entity entry found: config_entry_id=%s", master_entry_id)
+            master_coordinator = self.hass.data[DOMAIN].get(master_entry_id)
+            if master_coordinator:
                 master_ip = master_coordinator.entry.data[CONF_HOST]
-                _LOGGER.debug("Found master coordinator by entity registry: %s (IP: %s)", 
-                             master_entity_entry.config_entry_id, master_ip)
+                _LOGGER.debug("Found master coordinator by host index: %s (IP: %s)", 
+                             master_entry_id, master_ip)
         
         # Method 2: If not found, try matching by device name
         if not master_coordinator:
             _LOGGER.debug("Trying to match by device name")
             master_name = master_entity.attributes.get("friendly_name", "")
-            for entry_id, coordinator in self.hass.data[DOMAIN].items():
-                coordinator_name = coordinator.data.get("status", {}).get("name", "")
+            for coordinator in async_get_coordinators(self.hass):
+                coordinator_name = coordinator.data.status.name if coordinator.data else ""
                 if coordinator_name and coordinator_name in master_name:
                     master_coordinator = coordinator
                     master_ip = coordinator.entry.data[CONF_HOST]
-                    _LOGGER.debug("Found master coordinator by name match: %s (IP: %s)", entry_id, master_ip)
+                    _LOGGER.debug("Found master coordinator by name match: %s (IP: %s)", coordinator.entry.entry_id, master_ip)
                     break
         
         # Method 3: If still not found, we can still make a direct API call if we can get the IP
         if not master_coordinator:
             _LOGGER.warning("Could not find master coordinator. Available coordinators: %s", 
-                          list(self.hass.data[DOMAIN].keys()))
+                          [coordinator.entry.entry_id for coordinator in async_get_coordinators(self.hass)])
             # Try to get IP from blueos_group attribute or other means
             # For now, we'll need the coordinator, so return error
             _LOGGER.error("Cannot join without finding master coordinator")
             return
         
-        slave_ip = self._entry.data[CONF_HOST]
+        slave_ip = self._host
+        if self._topology.master_of(slave_ip) == master_ip:
+            _LOGGER.info("%s is already grouped with %s", slave_ip, master_ip)
+            return
         _LOGGER.info("Calling AddSlave on master %s to add slave %s", master_ip, slave_ip)
         
         # Call AddSlave on the master
         try:
-            result = await self.hass.async_add_executor_job(
-                master_coordinator.api.add_slave, slave_ip
-            )
+            result = await master_coordinator.api.add_slave(slave_ip)
             _LOGGER.debug("AddSlave result: %s", result)
             
             if not result:
@@ -528,8 +803,8 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
                 return
             
             # Refresh both players
-            await master_coordinator.async_request_refresh()
-            await self.coordinator.async_request_refresh()
+            await master_coordinator.async_refresh_endpoints("sync_status")
+            await self.coordinator.async_refresh_endpoints("sync_status")
             _LOGGER.info("Successfully joined %s to %s", slave_ip, master_ip)
         except Exception as err:
             _LOGGER.error("Error joining player: %s", err, exc_info=True)
@@ -538,50 +813,63 @@ class BluOSMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Unjoin this player from its group."""
         _LOGGER.info("Attempting to unjoin player %s", self.entity_id)
         
-        sync_status = self.coordinator.data.get("sync_status", {})
-        _LOGGER.debug("Current sync status: %s", sync_status)
+        master_ip = self._topology.master_of(self._host)
+        _LOGGER.debug("Current master: %s", master_ip)
         
         try:
-            if sync_status.get("master"):
+            if master_ip:
                 # This player is a slave, remove it from the master
-                master_ip = sync_status["master"]
                 _LOGGER.info("Player is a slave. Removing from master %s", master_ip)
                 
                 # Find the master's coordinator
                 master_coordinator = None
-                for entry_id, coordinator in self.hass.data[DOMAIN].items():
-                    if coordinator.entry.data[CONF_HOST] == master_ip:
-                        master_coordinator = coordinator
-                        _LOGGER.debug("Found master coordinator for IP %s", master_ip)
-                        break
+                master_entry_id = self._host_index.entry_id_for_host(master_ip)
+                if master_entry_id:
+                    master_coordinator = self.hass.data[DOMAIN].get(master_entry_id)
+                    _LOGGER.debug("Found master coordinator for IP %s", master_ip)
                 
-                slave_ip = self._entry.data[CONF_HOST]
+                slave_ip = self._host
                 
                 if master_coordinator:
                     # Use the master's coordinator to remove this slave
-                    result = await self.hass.async_add_executor_job(
-                        master_coordinator.api.remove_slave, slave_ip
-                    )
+                    result = await master_coordinator.api.remove_slave(slave_ip)
                     _LOGGER.debug("RemoveSlave via coordinator result: %s", result)
-                    await master_coordinator.async_request_refresh()
+                    await master_coordinator.async_refresh_endpoints("sync_status")
                 else:
                     # Master coordinator not found in HA, make direct API call to master
                     _LOGGER.warning("Could not find master coordinator for IP %s, making direct API call", master_ip)
                     from .bluos_api import BluOSApi
-                    master_api = BluOSApi(master_ip, self._entry.data.get("port", 11000))
-                    result = await self.hass.async_add_executor_job(
-                        master_api.remove_slave, slave_ip
+                    master_api = BluOSApi(
+                        master_ip,
+                        self._entry.data.get("port", 11000),
+                        async_get_clientsession(self.hass),
                     )
+                    result = await master_api.remove_slave(slave_ip)
                     _LOGGER.debug("RemoveSlave via direct API result: %s", result)
             else:
                 # This player is a master or standalone, remove all slaves
                 _LOGGER.info("Player is master or standalone. Ungrouping all slaves")
-                result = await self.hass.async_add_executor_job(
-                    self.coordinator.api.remove_slave
-                )
+                result = await self.coordinator.api.remove_slave()
                 _LOGGER.debug("Ungroup all result: %s", result)
             
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_endpoints("sync_status")
             _LOGGER.info("Successfully unjoined player %s", self.entity_id)
         except Exception as err:
             _LOGGER.error("Error unjoining player: %s", err, exc_info=True)
+
+    async def async_join_players(self, group_members: list[str]) -> None:
+        """Join other BluOS players to this one (media_player.join)."""
+        for entity_id in group_members:
+            entry_id = self._host_index.entry_id_for_entity(entity_id)
+            coordinator = self.hass.data[DOMAIN].get(entry_id) if entry_id else None
+            if coordinator is None:
+                _LOGGER.error("Cannot join %s: not a loaded BluOS player", entity_id)
+                continue
+            slave_ip = coordinator.entry.data[CONF_HOST]
+            if self._topology.master_of(slave_ip) == self._host:
+                continue
+            if await self.coordinator.api.add_slave(slave_ip):
+                await coordinator.async_refresh_endpoints("sync_status")
+            else:
+                _LOGGER.error("AddSlave of %s to %s failed", slave_ip, self._host)
+        await self.coordinator.async_refresh_endpoints("sync_status")
@@ -0,0 +1,174 @@
+"""Request metrics of a BluOS player."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (seconds) of the latency histogram buckets; one more bucket
+# collects everything slower
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Weight of the newest sample in the moving latency average
+EWMA_ALPHA = 0.2
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters of one endpoint (e.g. "Status")."""
+
+    requests: int = 0
+    long_polls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    response_bytes: int = 0
+    # Latency of regular requests; long-polls wait on purpose and are left out
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    latency_average: float | None = None
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    parses: int = 0
+    parse_total: float = 0.0
+    parse_max: float = 0.0
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Estimate a latency percentile (upper bound of its bucket, or the max)."""
+        timed = sum(self.latency_buckets)
+        if not timed:
+            return None
+        rank = timed * percentile / 100
+        seen = 0
+        for index, count in enumerate(self.latency_buckets):
+            seen += count
+            if seen >= rank:
+                break
+        if index < len(LATENCY_BUCKETS):
+            return min(LATENCY_BUCKETS[index], self.latency_max)
+        return self.latency_max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters in milliseconds, for diagnostics."""
+        timed = sum(self.latency_buckets)
+        return {
+            "requests": self.requests,
+            "long_polls": self.long_polls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "response_bytes": self.response_bytes,
+            "latency_ms": {
+                "average": _ms(self.latency_total / timed) if timed else None,
+                "moving_average": _ms(self.latency_average),
+                "p50": _ms(self.latency_percentile(50)),
+                "p95": _ms(self.latency_percentile(95)),
+                "max": _ms(self.latency_max),
+                "histogram": {
+                    f"<={_ms(bound)}": count
+                    for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets)
+                }
+                | {f">{_ms(LATENCY_BUCKETS[-1])}": self.latency_buckets[-1]},
+            },
+            "parse_ms": {
+                "average": _ms(self.parse_total / self.parses, 3) if self.parses else None,
+                "max": _ms(self.parse_max, 3),
+            },
+        }
+
+
+class BluOSMetrics:
+    """Per-endpoint request metrics and refresh durations of one player.
+
+    Recording is a few additions per request, so it always runs; the
+    diagnostic sensors and the diagnostics download read it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.cycles = 0
+        self.cycle_total = 0.0
+        self.cycle_last: float | None = None
+        self.cycle_max = 0.0
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint."""
+        if (metrics := self.endpoints.get(name)) is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    def record_response(
+        self, endpoint: str, latency: float, size: int, long_poll: bool = False
+    ) -> None:
+        """Record a successful request."""
+        metrics = self.endpoint(endpoint)
+        metrics.requests += 1
+        metrics.response_bytes += size
+        if long_poll:
+            metrics.long_polls += 1
+            return
+        metrics.latency_total += latency
+        metrics.latency_max = max(metrics.latency_max, latency)
+        metrics.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if metrics.latency_average is None:
+            metrics.latency_average = latency
+        else:
+            metrics.latency_average += EWMA_ALPHA * (latency - metrics.latency_average)
+
+    def record_error(self, endpoint: str, timeout: bool) -> None:
+        """Record a failed request."""
+        metrics = self.endpoint(endpoint)
+        metrics.requests += 1
+        metrics.errors += 1
+        if timeout:
+            metrics.timeouts += 1
+
+    def record_parse(self, endpoint: str, duration: float) -> None:
+        """Record the time spent parsing a response."""
+        metrics = self.endpoint(endpoint)
+        metrics.parses += 1
+        metrics.parse_total += duration
+        metrics.parse_max = max(metrics.parse_max, duration)
+
+    def record_cycle(self, duration: float) -> None:
+        """Record the duration of a coordinator refresh."""
+        self.cycles += 1
+        self.cycle_total += duration
+        self.cycle_last = duration
+        self.cycle_max = max(self.cycle_max, duration)
+
+    @property
+    def errors(self) -> int:
+        """Return the failed requests of all endpoints."""
+        return sum(metrics.errors for metrics in self.endpoints.values())
+
+    @property
+    def timeouts(self) -> int:
+        """Return the timed out requests of all endpoints."""
+        return sum(metrics.timeouts for metrics in self.endpoints.values())
+
+    @property
+    def response_bytes(self) -> int:
+        """Return the bytes received from all endpoints."""
+        return sum(metrics.response_bytes for metrics in self.endpoints.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics, for diagnostics."""
+        return {
+            "refresh_ms": {
+                "count": self.cycles,
+                "last": _ms(self.cycle_last),
+                "average": _ms(self.cycle_total / self.cycles) if self.cycles else None,
+                "max": _ms(self.cycle_max),
+            },
+            "endpoints": {
+                name: metrics.as_dict() for name, metrics in sorted(self.endpoints.items())
+            },
+        }
+
+
+def _ms(seconds: float | None, digits: int = 1) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    if seconds is None:
+        return None
+    return round(seconds * 1000, digits)
@@ -0,0 +1,195 @@
+"""Typed state models for BluOS data."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from functools import cache
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Return the field names of a model class."""
+    return tuple(model_field.name for model_field in fields(cls))
+
+
+class Model:
+    """Base class for immutable BluOS models.
+
+    Models are frozen, slotted dataclasses: equality is a field-by-field
+    comparison and ``diff`` tells which fields changed.
+    """
+
+    __slots__ = ()
+
+    def diff(self, other: Model | None) -> frozenset[str]:
+        """Return the names of the fields that differ from ``other``.
+
+        Nested models are compared field by field and reported as
+        ``"parent.child"``. Every field is reported when ``other`` is None.
+        """
+        names = _field_names(type(self))
+        if other is None:
+            return frozenset(names)
+        if other is self:
+            return frozenset()
+
+        changed: set[str] = set()
+        for name in names:
+            new = getattr(self, name)
+            old = getattr(other, name)
+            if new == old:
+                continue
+            changed.add(name)
+            if isinstance(new, Model) and isinstance(old, Model | None):
+                changed.update(f"{name}.{sub}" for sub in new.diff(old))
+        return frozenset(changed)
+
+
+@dataclass(frozen=True, slots=True)
+class Battery(Model):
+    """Battery information of battery-powered players (e.g. Flex)."""
+
+    level: int = 0
+    charging: bool = False
+    icon: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerStatus(Model):
+    """Parsed /Status response."""
+
+    # Changes whenever anything in /Status changes (used for long-polling)
+    etag: str = ""
+    name: str = "BluOS Player"
+    state: str = "idle"
+    volume: int = 0
+    mute: bool = False
+    shuffle: bool = False
+    repeat: str = "0"
+    service: str = ""
+    service_name: str = ""
+    service_icon: str = ""
+    # Title fields from BluOS
+    title1: str = ""
+    title2: str = ""
+    title3: str = ""
+    # Parsed fields for media player
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+    image: str = ""
+    # Playback info
+    totlen: int = 0
+    secs: int = 0
+    can_seek: bool = False
+    # Stream info
+    stream_format: str = ""
+    stream_url: str = ""
+    # Preset info
+    is_preset: bool = False
+    preset_id: str = ""
+    preset_name: str = ""
+    # Changes whenever the preset list is edited
+    presets_version: str = ""
+    quality: str = "0"
+    db: str = "0"
+    battery: Battery | None = None
+    group: str = ""
+    # Changes whenever /SyncStatus changes (grouping, name, battery)
+    sync_stat: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class GroupMember(Model):
+    """A slave player as listed in the master's /SyncStatus."""
+
+    ip: str
+    name: str = ""
+    zone: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class SyncState(Model):
+    """Parsed /SyncStatus response: group topology and device identity."""
+
+    etag: str = ""
+    # IP of the master when this player is a slave
+    master: str | None = None
+    slaves: tuple[GroupMember, ...] = ()
+    zone: str | None = None
+    device_name: str = ""
+    model: str = ""
+    model_name: str = ""
+    brand: str = ""
+    icon: str = ""
+    mac: str = ""
+    # Battery info (always present in SyncStatus, even when grouped)
+    battery: Battery | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class VolumeState(Model):
+    """Parsed /Volume response (the player's own volume, even when grouped)."""
+
+    volume: int = 0
+    mute: bool = False
+    db: str = "0"
+
+
+@dataclass(frozen=True, slots=True)
+class PlaylistState(Model):
+    """Play queue settings returned by /Shuffle and /Repeat (None if absent)."""
+
+    shuffle: bool | None = None
+    repeat: str | None = None
+    length: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Preset(Model):
+    """A preset from /Presets."""
+
+    id: str
+    name: str = ""
+    url: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class BrowseItem(Model):
+    """An entry of a /Browse page.
+
+    Containers have a ``browse_key``, playable entries a ``play_url``
+    (a player-relative action URL); some have both.
+    """
+
+    text: str
+    text2: str = ""
+    type: str = ""
+    image: str = ""
+    browse_key: str = ""
+    play_url: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class BrowsePage(Model):
+    """One page of a /Browse listing; ``next_key`` browses the next page."""
+
+    items: tuple[BrowseItem, ...] = ()
+    next_key: str = ""
+    parent_key: str = ""
+    service_name: str = ""
+    service_icon: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerData(Model):
+    """Everything the coordinator knows about one player."""
+
+    status: PlayerStatus
+    sync_status: SyncState = field(default_factory=SyncState)
+    volume: VolumeState | None = None
+    presets: tuple[Preset, ...] = ()
+
+    @property
+    def battery(self) -> Battery | None:
+        """Return battery info, preferring SyncStatus (present even when grouped)."""
+        return self.sync_status.battery or self.status.battery
@@ -0,0 +1,61 @@
+"""Ring buffer of recent requests to a BluOS player."""
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timezone
+import time
+from typing import Any
+
+from .const import TRACE_BODY_LIMIT, TRACE_SIZE
+
+
+class BluOSRequestTrace:
+    """Keep the last TRACE_SIZE requests of a player for troubleshooting.
+
+    Replaces debug logging on the hot path: recording appends one tuple of
+    values the request already has (the body cut to TRACE_BODY_LIMIT
+    characters), and nothing is formatted until the trace is exported with
+    the diagnostics.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        """Initialize the trace."""
+        self._entries: deque[
+            tuple[float, str, dict[str, str] | None, int | str, float, int, str]
+        ] = deque(maxlen=size)
+
+    def record(
+        self,
+        endpoint: str,
+        params: dict[str, str] | None,
+        status: int | str,
+        latency: float,
+        body: str | None = None,
+    ) -> None:
+        """Record a request; ``status`` is the HTTP status or the error."""
+        self._entries.append(
+            (
+                time.time(),
+                endpoint,
+                params,
+                status,
+                latency,
+                len(body) if body else 0,
+                body[:TRACE_BODY_LIMIT] if body else "",
+            )
+        )
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the recorded requests, oldest first."""
+        return [
+            {
+                "time": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+                "endpoint": endpoint,
+                "params": params,
+                "status": status,
+                "latency_ms": round(latency * 1000, 1),
+                "length": length,
+                "body": body,
+            }
+            for timestamp, endpoint, params, status, latency, length, body in self._entries
+        ]
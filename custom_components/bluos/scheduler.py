@@ -0,0 +1,179 @@
+"""Fleet-wide poll scheduler for BluOS players."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import MAX_INFLIGHT_REQUESTS, SCHEDULER_LAG_WARNING
+
+if TYPE_CHECKING:
+    from .coordinator import BluOSDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds between two scheduling lag warnings
+LAG_WARNING_INTERVAL = 300
+
+
+@dataclass(slots=True)
+class _ScheduledPlayer:
+    """Scheduling state of one player."""
+
+    coordinator: BluOSDataUpdateCoordinator
+    next_due: float = 0.0
+    task: asyncio.Task | None = None
+
+
+class BluOSPollScheduler:
+    """Poll every BluOS player from a single timer.
+
+    Each coordinator used to run its own timer, so after a restart all
+    players polled in lock-step. The scheduler spreads the players' phases
+    across their poll interval, and every request (except long-polls)
+    shares one in-flight limit, which keeps CPU and network load flat.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        # Shared by the API clients of all players
+        self.limiter = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+        self._players: dict[str, _ScheduledPlayer] = {}
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._last_lag_warning = 0.0
+        self.stats: dict[str, Any] = {
+            "polls": 0,
+            "late_polls": 0,
+            "last_lag": 0.0,
+            "max_lag": 0.0,
+        }
+
+    @callback
+    def async_add(self, coordinator: BluOSDataUpdateCoordinator) -> None:
+        """Start polling a player."""
+        player = _ScheduledPlayer(coordinator)
+        self._async_place(player)
+        self._players[coordinator.entry.entry_id] = player
+
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), "BluOS poll scheduler"
+            )
+        self._wakeup.set()
+
+    @callback
+    def async_remove(self, coordinator: BluOSDataUpdateCoordinator) -> None:
+        """Stop polling a player."""
+        player = self._players.pop(coordinator.entry.entry_id, None)
+        if player and player.task:
+            player.task.cancel()
+
+        if not self._players and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def async_reschedule(self, coordinator: BluOSDataUpdateCoordinator) -> None:
+        """Bring a player's next poll forward after its poll interval shrank."""
+        player = self._players.get(coordinator.entry.entry_id)
+        if player is None or player.task is not None:
+            # A running poll schedules the next one with the new interval
+            return
+        player.next_due = min(
+            player.next_due, time.monotonic() + coordinator.poll_interval
+        )
+        self._wakeup.set()
+
+    @callback
+    def _async_place(self, player: _ScheduledPlayer) -> None:
+        """Give a new player the phase furthest from the other players' polls.
+
+        The phase is the middle of the widest gap between the scheduled
+        polls, within the new player's interval. Players already scheduled
+        keep their phase, so adding players one by one at startup doesn't
+        reshuffle the fleet, and the new player's first poll comes at least
+        half an interval after the refresh of its setup.
+        """
+        now = time.monotonic()
+        interval = player.coordinator.poll_interval
+        phases = sorted(
+            (other.next_due - now) % interval for other in self._players.values()
+        )
+        if not phases:
+            player.next_due = now + interval
+            return
+
+        # Gaps between consecutive phases, the last one wrapping around
+        gaps = zip(phases, [*phases[1:], phases[0] + interval])
+        start, end = max(gaps, key=lambda gap: gap[1] - gap[0])
+        phase = (start + end) / 2 % interval
+        if phase < interval / 2:
+            phase += interval
+        player.next_due = now + phase
+
+    async def _async_run(self) -> None:
+        """Start each player's poll when it is due."""
+        while True:
+            now = time.monotonic()
+            next_due = min(
+                (p.next_due for p in self._players.values() if p.task is None),
+                default=None,
+            )
+            if next_due is None or next_due > now:
+                self._wakeup.clear()
+                timeout = None if next_due is None else next_due - now
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            for player in self._players.values():
+                if player.task is None and player.next_due <= now:
+                    self._record_lag(now - player.next_due)
+                    player.task = self.hass.async_create_background_task(
+                        self._async_poll(player),
+                        f"BluOS poll {player.coordinator.api.host}",
+                    )
+
+    async def _async_poll(self, player: _ScheduledPlayer) -> None:
+        """Refresh one player and schedule its next poll on the same phase."""
+        try:
+            await player.coordinator.async_refresh()
+        finally:
+            player.task = None
+            interval = player.coordinator.poll_interval
+            now = time.monotonic()
+            # Skip missed cycles rather than firing them back to back
+            player.next_due += interval
+            if player.next_due <= now:
+                player.next_due += ((now - player.next_due) // interval + 1) * interval
+            self._wakeup.set()
+
+    @callback
+    def _record_lag(self, lag: float) -> None:
+        """Track how late polls start compared with their schedule."""
+        stats = self.stats
+        stats["polls"] += 1
+        stats["last_lag"] = round(lag, 3)
+        stats["max_lag"] = max(stats["max_lag"], stats["last_lag"])
+        if lag < SCHEDULER_LAG_WARNING:
+            return
+
+        stats["late_polls"] += 1
+        now = time.monotonic()
+        if now - self._last_lag_warning >= LAG_WARNING_INTERVAL:
+            self._last_lag_warning = now
+            _LOGGER.warning(
+                "BluOS polls are running %.1fs behind schedule (%d of %d late); "
+                "the event loop or network may be overloaded",
+                lag,
+                stats["late_polls"],
+                stats["polls"],
+            )
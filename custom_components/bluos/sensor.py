@@ -1,19 +1,34 @@
 """BluOS sensor platform."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
+import time
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import BluOSDataUpdateCoordinator
+from .entity import BluOSEntity
+from .listening import BluOSListeningStats
+from .metrics import BluOSMetrics
+from .models import Battery
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,31 +44,173 @@ async def async_setup_entry(
     # Check if device has battery
     # Battery info is in SyncStatus (always present, even when grouped)
     # Fallback to Status for older code compatibility
-    battery_info = coordinator.data.get("sync_status", {}).get("battery", {})
-    if not battery_info:
-        battery_info = coordinator.data.get("status", {}).get("battery", {})
-    
     entities = []
     
-    if battery_info:
+    if coordinator.data.battery:
         # Device has battery, add battery sensors
         _LOGGER.info("Device %s has battery, adding battery sensors", entry.data.get("host"))
         entities.append(BluOSBatterySensor(coordinator, entry))
         entities.append(BluOSBatteryChargingSensor(coordinator, entry))
     else:
         _LOGGER.debug("Device %s has no battery information", entry.data.get("host"))
-    
-    if entities:
-        async_add_entities(entities)
+
+    entities.extend(
+        BluOSMetricSensor(coordinator, entry, description)
+        for description in METRIC_SENSORS
+    )
+    entities.extend(
+        BluOSListeningSensor(coordinator, entry, description)
+        for description in LISTENING_SENSORS
+    )
+    async_add_entities(entities)
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to milliseconds with one decimal."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BluOSMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a request metric sensor."""
+
+    value_fn: Callable[[BluOSMetrics], float | int | None]
+    attributes_fn: Callable[[BluOSMetrics], dict[str, Any]]
+
+
+METRIC_SENSORS: tuple[BluOSMetricSensorEntityDescription, ...] = (
+    BluOSMetricSensorEntityDescription(
+        key="status_latency",
+        name="Status latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: _ms(
+            getattr(metrics.endpoints.get("Status"), "latency_average", None)
+        ),
+        attributes_fn=lambda metrics: {
+            f"{name} p95": _ms(endpoint.latency_percentile(95))
+            for name, endpoint in sorted(metrics.endpoints.items())
+            if endpoint.latency_average is not None
+        },
+    ),
+    BluOSMetricSensorEntityDescription(
+        key="request_errors",
+        name="Request errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.errors,
+        attributes_fn=lambda metrics: {
+            "timeouts": metrics.timeouts,
+        }
+        | {
+            f"{name} errors": endpoint.errors
+            for name, endpoint in sorted(metrics.endpoints.items())
+            if endpoint.errors
+        },
+    ),
+    BluOSMetricSensorEntityDescription(
+        key="refresh_duration",
+        name="Refresh duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: _ms(metrics.cycle_last),
+        attributes_fn=lambda metrics: {
+            "average": _ms(metrics.cycle_total / metrics.cycles)
+            if metrics.cycles
+            else None,
+            "max": _ms(metrics.cycle_max),
+        },
+    ),
+    BluOSMetricSensorEntityDescription(
+        key="response_bytes",
+        name="Received data",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.response_bytes,
+        attributes_fn=lambda metrics: {
+            f"{name} bytes": endpoint.response_bytes
+            for name, endpoint in sorted(metrics.endpoints.items())
+        },
+    ),
+)
+
+
+def _minutes(seconds: float) -> int:
+    """Convert seconds to whole minutes."""
+    return int(seconds // 60)
+
+
+def _window_attributes(stats: BluOSListeningStats, window: str) -> dict[str, Any]:
+    """Return the minutes per source and the tracks of a rolling window."""
+    _, tracks, sources = getattr(stats, window).totals(time.time())
+    return {"tracks": tracks} | {
+        f"{source} minutes": _minutes(seconds)
+        for source, seconds in sorted(sources.items(), key=lambda item: -item[1])
+    }
 
 
-class BluOSBatterySensor(CoordinatorEntity, SensorEntity):
+@dataclass(frozen=True, kw_only=True)
+class BluOSListeningSensorEntityDescription(SensorEntityDescription):
+    """Describes a listening statistics sensor."""
+
+    value_fn: Callable[[BluOSListeningStats], float | int | str | None]
+    attributes_fn: Callable[[BluOSListeningStats], dict[str, Any]]
+
+
+LISTENING_SENSORS: tuple[BluOSListeningSensorEntityDescription, ...] = (
+    BluOSListeningSensorEntityDescription(
+        key="listening_time_day",
+        name="Listening time (24h)",
+        icon="mdi:headphones",
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: _minutes(stats.day.totals(time.time())[0]),
+        attributes_fn=lambda stats: _window_attributes(stats, "day"),
+    ),
+    BluOSListeningSensorEntityDescription(
+        key="listening_time_week",
+        name="Listening time (7d)",
+        icon="mdi:headphones",
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: _minutes(stats.week.totals(time.time())[0]),
+        attributes_fn=lambda stats: _window_attributes(stats, "week"),
+    ),
+    BluOSListeningSensorEntityDescription(
+        key="tracks_played",
+        name="Tracks played",
+        icon="mdi:music-note",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.total_tracks,
+        attributes_fn=lambda stats: {
+            f"{artist} plays": int(plays) for artist, plays in stats.artists.top(5)
+        },
+    ),
+    BluOSListeningSensorEntityDescription(
+        key="top_station",
+        name="Top station",
+        icon="mdi:radio",
+        value_fn=lambda stats: next(iter(stats.stations.top(1)), (None,))[0],
+        attributes_fn=lambda stats: {
+            f"{station} minutes": _minutes(seconds)
+            for station, seconds in stats.stations.top(5)
+        },
+    ),
+)
+
+
+class BluOSBatterySensor(BluOSEntity, SensorEntity):
     """Battery level sensor for BluOS devices."""
 
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_has_entity_name = True
+    _update_fields = frozenset({"sync_status.battery", "status.battery"})
 
     def __init__(
         self,
@@ -65,20 +222,7 @@ class BluOSBatterySensor(CoordinatorEntity, SensorEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_battery"
         self._attr_name = "Battery"
-        
-        # Get device information from SyncStatus (same as media_player)
-        sync_status = coordinator.data.get("sync_status", {}) if coordinator.data else {}
-        
-        device_name = sync_status.get("device_name", "")
-        if not device_name and coordinator.data and "status" in coordinator.data:
-            device_name = coordinator.data["status"].get("name", "BluOS Player")
-        if not device_name:
-            device_name = "BluOS Player"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": device_name,
-        }
+        self._attr_device_info = self._device_info(coordinator, entry)
 
     @property
     def native_value(self) -> int | None:
@@ -87,12 +231,11 @@ class BluOSBatterySensor(CoordinatorEntity, SensorEntity):
             return None
         
         # Battery info is in SyncStatus (always present, even when grouped)
-        battery_info = self.coordinator.data.get("sync_status", {}).get("battery", {})
-        if not battery_info:
-            # Fallback to Status
-            battery_info = self.coordinator.data.get("status", {}).get("battery", {})
+        battery_info = self.coordinator.data.battery
+        if battery_info is None:
+            return None
         
-        return battery_info.get("level")
+        return battery_info.level
 
     @property
     def extra_state_attributes(self) -> dict[str, any]:
@@ -101,20 +244,19 @@ class BluOSBatterySensor(CoordinatorEntity, SensorEntity):
             return {}
         
         # Battery info is in SyncStatus (always present, even when grouped)
-        battery_info = self.coordinator.data.get("sync_status", {}).get("battery", {})
-        if not battery_info:
-            battery_info = self.coordinator.data.get("status", {}).get("battery", {})
+        battery_info = self.coordinator.data.battery or Battery()
         
         return {
-            "charging": battery_info.get("charging", False),
-            "icon_path": battery_info.get("icon", ""),
+            "charging": battery_info.charging,
+            "icon_path": battery_info.icon,
         }
 
 
-class BluOSBatteryChargingSensor(CoordinatorEntity, SensorEntity):
+class BluOSBatteryChargingSensor(BluOSEntity, SensorEntity):
     """Battery charging status sensor for BluOS devices."""
 
     _attr_has_entity_name = True
+    _update_fields = frozenset({"sync_status.battery", "status.battery"})
 
     def __init__(
         self,
@@ -126,20 +268,7 @@ class BluOSBatteryChargingSensor(CoordinatorEntity, SensorEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_battery_charging"
         self._attr_name = "Battery charging"
-        
-        # Get device information from SyncStatus (same as media_player)
-        sync_status = coordinator.data.get("sync_status", {}) if coordinator.data else {}
-        
-        device_name = sync_status.get("device_name", "")
-        if not device_name and coordinator.data and "status" in coordinator.data:
-            device_name = coordinator.data["status"].get("name", "BluOS Player")
-        if not device_name:
-            device_name = "BluOS Player"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": device_name,
-        }
+        self._attr_device_info = self._device_info(coordinator, entry)
 
     @property
     def native_value(self) -> str | None:
@@ -148,10 +277,8 @@ class BluOSBatteryChargingSensor(CoordinatorEntity, SensorEntity):
             return None
         
         # Battery info is in SyncStatus (always present, even when grouped)
-        battery_info = self.coordinator.data.get("sync_status", {}).get("battery", {})
-        if not battery_info:
-            battery_info = self.coordinator.data.get("status", {}).get("battery", {})
-        charging = battery_info.get("charging", False)
+        battery_info = self.coordinator.data.battery or Battery()
+        charging = battery_info.charging
         
         return "Charging" if charging else "Not charging"
 
@@ -162,10 +289,8 @@ class BluOSBatteryChargingSensor(CoordinatorEntity, SensorEntity):
             return "mdi:battery"
         
         # Battery info is in SyncStatus (always present, even when grouped)
-        battery_info = self.coordinator.data.get("sync_status", {}).get("battery", {})
-        if not battery_info:
-            battery_info = self.coordinator.data.get("status", {}).get("battery", {})
-        charging = battery_info.get("charging", False)
+        battery_info = self.coordinator.data.battery or Battery()
+        charging = battery_info.charging
         
         return "mdi:battery-charging" if charging else "mdi:battery"
 
@@ -176,11 +301,101 @@ class BluOSBatteryChargingSensor(CoordinatorEntity, SensorEntity):
             return {}
         
         # Battery info is in SyncStatus (always present, even when grouped)
-        battery_info = self.coordinator.data.get("sync_status", {}).get("battery", {})
-        if not battery_info:
-            battery_info = self.coordinator.data.get("status", {}).get("battery", {})
+        battery_info = self.coordinator.data.battery or Battery()
         
         return {
-            "battery_level": battery_info.get("level"),
-            "charging": battery_info.get("charging", False),
+            "battery_level": battery_info.level,
+            "charging": battery_info.charging,
         }
+
+
+class BluOSMetricSensor(BluOSEntity, SensorEntity):
+    """Diagnostic sensor for the request metrics of a player.
+
+    Disabled by default; enable it to find the player (e.g. one on a weak
+    Wi-Fi link) that slows the fleet down, without debug logging.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    entity_description: BluOSMetricSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BluOSDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: BluOSMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the metric sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = self._device_info(coordinator, entry)
+        self._last_value: float | int | None = None
+
+    @property
+    def available(self) -> bool:
+        """Metrics are available while the player is not."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the metric."""
+        return self.entity_description.value_fn(self.coordinator.api.metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the metric per endpoint."""
+        return self.entity_description.attributes_fn(self.coordinator.api.metrics)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state when the metric changed (metrics aren't player data)."""
+        value = self.native_value
+        if value != self._last_value:
+            self._last_value = value
+            self.async_write_ha_state()
+
+
+class BluOSListeningSensor(BluOSEntity, SensorEntity):
+    """Listening statistics of a player, see listening.py."""
+
+    _attr_has_entity_name = True
+    entity_description: BluOSListeningSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BluOSDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: BluOSListeningSensorEntityDescription,
+    ) -> None:
+        """Initialize the listening sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = self._device_info(coordinator, entry)
+        self._last_state: tuple[Any, dict[str, Any]] | None = None
+
+    @property
+    def available(self) -> bool:
+        """Statistics are available while the player is not."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | str | None:
+        """Return the statistic."""
+        return self.entity_description.value_fn(self.coordinator.listening)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the breakdown of the statistic."""
+        return self.entity_description.attributes_fn(self.coordinator.listening)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state when the statistic or its breakdown changed."""
+        state = (self.native_value, self.extra_state_attributes)
+        if state != self._last_state:
+            self._last_state = state
+            self.async_write_ha_state()
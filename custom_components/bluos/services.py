@@ -0,0 +1,191 @@
+"""Domain services that control many BluOS players at once."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import (
+    ATTR_PRESET,
+    ATTR_VOLUME_LEVEL,
+    DATA_HOST_INDEX,
+    DATA_TOPOLOGY,
+    DOMAIN,
+    SERVICE_PAUSE_ALL,
+    SERVICE_PLAY_PRESET_MANY,
+    SERVICE_SET_VOLUME_MANY,
+)
+from .coordinator import BluOSDataUpdateCoordinator, async_get_coordinators
+
+_LOGGER = logging.getLogger(__name__)
+
+PAUSE_ALL_SCHEMA = vol.Schema({**cv.ENTITY_SERVICE_FIELDS})
+SET_VOLUME_MANY_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Required(ATTR_VOLUME_LEVEL): cv.small_float,
+    }
+)
+PLAY_PRESET_MANY_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Required(ATTR_PRESET): cv.string,
+    }
+)
+
+Command = Callable[[BluOSDataUpdateCoordinator], Awaitable[Any]]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the domain services."""
+
+    async def async_pause_all(call: ServiceCall) -> ServiceResponse:
+        """Pause every targeted player (every player without a target)."""
+        return await _async_fan_out(
+            hass,
+            call,
+            lambda coordinator: coordinator.commands.async_send(
+                "transport", coordinator.api.pause
+            ),
+            per_group=True,
+        )
+
+    async def async_set_volume_many(call: ServiceCall) -> ServiceResponse:
+        """Set the same volume on every targeted player."""
+        level = round(call.data[ATTR_VOLUME_LEVEL] * 100)
+        return await _async_fan_out(
+            hass,
+            call,
+            lambda coordinator: coordinator.commands.async_send(
+                "volume", lambda: coordinator.api.set_volume(level)
+            ),
+        )
+
+    async def async_play_preset_many(call: ServiceCall) -> ServiceResponse:
+        """Play a preset, by name or id, on every targeted player."""
+        preset = call.data[ATTR_PRESET]
+
+        async def play_preset(coordinator: BluOSDataUpdateCoordinator) -> bool:
+            presets = coordinator.data.presets if coordinator.data else ()
+            for candidate in presets:
+                if preset in (candidate.name, candidate.id):
+                    return await coordinator.api.select_preset(candidate.id)
+            raise HomeAssistantError(f"Unknown preset: {preset}")
+
+        return await _async_fan_out(
+            hass, call, play_preset, per_group=True, refresh=("status",)
+        )
+
+    for service, handler, schema in (
+        (SERVICE_PAUSE_ALL, async_pause_all, PAUSE_ALL_SCHEMA),
+        (SERVICE_SET_VOLUME_MANY, async_set_volume_many, SET_VOLUME_MANY_SCHEMA),
+        (SERVICE_PLAY_PRESET_MANY, async_play_preset_many, PLAY_PRESET_MANY_SCHEMA),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+
+@callback
+def _async_get_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, BluOSDataUpdateCoordinator]:
+    """Return the targeted players by entity id; every player without a target."""
+    host_index = hass.data.get(DOMAIN, {}).get(DATA_HOST_INDEX)
+    if host_index is None:
+        return {}
+
+    if not any(key in call.data for key in cv.ENTITY_SERVICE_FIELDS):
+        return {
+            host_index.entity_id_for_host(coordinator.api.host)
+            or coordinator.entry.entry_id: coordinator
+            for coordinator in async_get_coordinators(hass)
+        }
+
+    selected = async_extract_referenced_entity_ids(hass, call)
+    targets: dict[str, BluOSDataUpdateCoordinator] = {}
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        entry_id = host_index.entry_id_for_entity(entity_id)
+        if entry_id and (coordinator := hass.data[DOMAIN].get(entry_id)):
+            targets[entity_id] = coordinator
+    return targets
+
+
+async def _async_fan_out(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    command: Command,
+    per_group: bool = False,
+    refresh: tuple[str, ...] = (),
+) -> ServiceResponse:
+    """Send a command to all targeted players at once.
+
+    The state in each player's response is merged into its data; only the
+    endpoints in ``refresh`` are re-fetched, once per player for the batch.
+    With ``per_group`` the command only goes to the master of a group whose
+    master is targeted too; BluOS applies it to the whole group anyway.
+    The response maps every target to its outcome.
+    """
+    targets = _async_get_targets(hass, call)
+    followers: list[BluOSDataUpdateCoordinator] = []
+    results: dict[str, dict[str, Any]] = {}
+
+    domain_data = hass.data.get(DOMAIN, {})
+    if per_group and (topology := domain_data.get(DATA_TOPOLOGY)):
+        host_index = domain_data[DATA_HOST_INDEX]
+        hosts = {coordinator.api.host for coordinator in targets.values()}
+        for entity_id, coordinator in list(targets.items()):
+            master = topology.master_of(coordinator.api.host)
+            if master in hosts:
+                results[entity_id] = {
+                    "success": True,
+                    "via": host_index.entity_id_for_host(master) or master,
+                }
+                followers.append(targets.pop(entity_id))
+
+    outcomes = await asyncio.gather(
+        *(command(coordinator) for coordinator in targets.values()),
+        return_exceptions=True,
+    )
+    for (entity_id, coordinator), outcome in zip(targets.items(), outcomes):
+        if isinstance(outcome, BaseException):
+            _LOGGER.error("%s failed for %s: %s", call.service, entity_id, outcome)
+            results[entity_id] = {"success": False, "error": str(outcome)}
+        elif not outcome:
+            results[entity_id] = {"success": False, "error": "Player did not respond"}
+        else:
+            results[entity_id] = {"success": True}
+            coordinator.async_apply_command_result(outcome)
+
+    # Slaves only learn about their master's change by refreshing /Status
+    await asyncio.gather(
+        *(
+            coordinator.async_refresh_endpoints(*refresh)
+            for coordinator in targets.values()
+            if refresh
+        ),
+        *(coordinator.async_refresh_endpoints("status") for coordinator in followers),
+    )
+
+    if not call.return_response:
+        return None
+    return {"results": results}
@@ -0,0 +1,190 @@
+"""Domain-wide group topology of BluOS players."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_TOPOLOGY_UPDATED
+from .models import SyncState
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _Report:
+    """What one player's SyncStatus says about its group."""
+
+    master: str | None
+    slaves: frozenset[str]
+    zone: str | None
+    # Increases with every report, newer reports win conflicts
+    seq: int
+
+
+class BluOSGroupTopology:
+    """Shared master -> slaves model built from every player's SyncStatus.
+
+    Each player reports its own view: a slave names its master, a master
+    lists its slaves. Right after a (un)join only some players have
+    refreshed, so their views can disagree. A link between two players
+    exists when both agree, when only one of them has reported, or, when
+    they disagree, when the most recent report says so.
+
+    Reports only trigger work when a player's view changed, and then only
+    the links touching that player are re-evaluated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the topology."""
+        self.hass = hass
+        self._reports: dict[str, _Report] = {}
+        self._seq = 0
+        # Reverse lookups of the reports: who lists / claims a host
+        self._listed_by: dict[str, set[str]] = {}
+        self._claimed_by: dict[str, set[str]] = {}
+        # Resolved links
+        self._master_of: dict[str, str] = {}
+        self._slaves_of: dict[str, set[str]] = {}
+
+    @callback
+    def async_update_player(self, host: str, sync_status: SyncState) -> None:
+        """Apply a player's SyncStatus to the topology."""
+        master = sync_status.master or None
+        slaves = frozenset(slave.ip for slave in sync_status.slaves if slave.ip)
+        old = self._reports.get(host)
+        if (
+            old is not None
+            and old.master == master
+            and old.slaves == slaves
+            and old.zone == sync_status.zone
+        ):
+            return
+
+        self._seq += 1
+        self._async_unindex(host, old)
+        report = _Report(master, slaves, sync_status.zone, self._seq)
+        self._reports[host] = report
+        if master:
+            self._claimed_by.setdefault(master, set()).add(host)
+        for slave in slaves:
+            self._listed_by.setdefault(slave, set()).add(host)
+
+        self._async_resolve(host, old, report)
+
+    @callback
+    def async_remove_player(self, host: str) -> None:
+        """Forget a player, e.g. when its config entry is unloaded."""
+        old = self._reports.pop(host, None)
+        if old is None:
+            return
+        self._async_unindex(host, old)
+        self._async_resolve(host, old, None)
+
+    @callback
+    def master_of(self, host: str) -> str | None:
+        """Return the master of a slave, None if the player is not a slave."""
+        return self._master_of.get(host)
+
+    @callback
+    def slaves_of(self, host: str) -> list[str]:
+        """Return the slaves of a master, sorted for stable attributes."""
+        return sorted(self._slaves_of.get(host, ()))
+
+    @callback
+    def members(self, host: str) -> list[str]:
+        """Return the group of a player, master first; [] if not grouped."""
+        master = self._master_of.get(host, host)
+        slaves = self.slaves_of(master)
+        if not slaves:
+            return []
+        return [master, *slaves]
+
+    @callback
+    def group_name(self, host: str) -> str:
+        """Return the zone (group) name reported for a player's group."""
+        master = self._master_of.get(host, host)
+        for candidate in (host, master):
+            report = self._reports.get(candidate)
+            if report and report.zone:
+                return report.zone
+        return ""
+
+    @callback
+    def _async_unindex(self, host: str, report: _Report | None) -> None:
+        """Remove a report from the reverse lookups."""
+        if report is None:
+            return
+        if report.master:
+            self._claimed_by.get(report.master, set()).discard(host)
+        for slave in report.slaves:
+            self._listed_by.get(slave, set()).discard(host)
+
+    @callback
+    def _async_resolve(
+        self, host: str, old: _Report | None, new: _Report | None
+    ) -> None:
+        """Re-evaluate every link touching ``host`` and notify changed players."""
+        candidates: set[tuple[str, str]] = set()
+        for report in (old, new):
+            if report is None:
+                continue
+            if report.master:
+                candidates.add((report.master, host))
+            candidates.update((host, slave) for slave in report.slaves)
+        candidates.update((master, host) for master in self._listed_by.get(host, ()))
+        candidates.update((host, slave) for slave in self._claimed_by.get(host, ()))
+        if (current := self._master_of.get(host)) is not None:
+            candidates.add((current, host))
+        candidates.update((host, slave) for slave in self._slaves_of.get(host, ()))
+        # A slave that lost (or changed) its master may still be listed by
+        # another master, or name one itself; re-check those links too
+        for slave in {slave for _, slave in candidates}:
+            candidates.update(
+                (master, slave) for master in self._listed_by.get(slave, ())
+            )
+            if (report := self._reports.get(slave)) is not None and report.master:
+                candidates.add((report.master, slave))
+
+        changed: set[str] = set()
+        for master, slave in candidates:
+            linked = self._link_exists(master, slave)
+            if linked == (self._master_of.get(slave) == master):
+                continue
+            if linked:
+                previous = self._master_of.get(slave)
+                if previous is not None:
+                    self._slaves_of.get(previous, set()).discard(slave)
+                    changed.add(previous)
+                self._master_of[slave] = master
+                self._slaves_of.setdefault(master, set()).add(slave)
+            else:
+                del self._master_of[slave]
+                self._slaves_of.get(master, set()).discard(slave)
+            changed.update((master, slave))
+
+        if old is None or new is None or old.zone != new.zone:
+            changed.add(host)
+
+        if changed:
+            _LOGGER.debug("Group topology changed for %s", sorted(changed))
+            async_dispatcher_send(self.hass, SIGNAL_TOPOLOGY_UPDATED, changed)
+
+    @callback
+    def _link_exists(self, master: str, slave: str) -> bool:
+        """Decide whether ``slave`` is grouped under ``master``."""
+        master_report = self._reports.get(master)
+        slave_report = self._reports.get(slave)
+        master_says = slave in master_report.slaves if master_report else None
+        slave_says = slave_report.master == master if slave_report else None
+
+        if master_says is None:
+            return bool(slave_says)
+        if slave_says is None or master_says == slave_says:
+            return master_says
+        # Views disagree: trust the most recent report
+        if master_report.seq > slave_report.seq:
+            return master_says
+        return slave_says
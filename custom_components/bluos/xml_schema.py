@@ -0,0 +1,165 @@
+"""Schema-driven XML extraction for BluOS responses.
+
+BluOS responses are flat: a root element with attributes and one level of
+children. Instead of building an element tree and converting it to nested
+dicts, each endpoint declares the fields it needs and ``extract`` collects
+exactly those in a single streaming pass over the response.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+from xml.parsers import expat
+
+ExpatError = expat.ExpatError
+
+
+@dataclass(frozen=True)
+class XmlSchema:
+    """Fields to extract from one BluOS response.
+
+    Attributes:
+        root_attrs: Attributes of the root element to keep
+        root_text: Keep the text of a root without children (as "_text")
+        text: Direct children whose text content is wanted
+        attrs: Direct children whose attributes are wanted (as a dict)
+        lists: Repeated direct children whose attributes are wanted (as a list)
+    """
+
+    root_attrs: frozenset[str] = frozenset()
+    root_text: bool = False
+    text: frozenset[str] = frozenset()
+    attrs: frozenset[str] = frozenset()
+    lists: frozenset[str] = frozenset()
+
+
+STATUS_SCHEMA = XmlSchema(
+    root_attrs=frozenset({"etag"}),
+    text=frozenset(
+        {
+            "album",
+            "artist",
+            "canSeek",
+            "currentImage",
+            "db",
+            "group",
+            "image",
+            "is_preset",
+            "mute",
+            "name",
+            "preset_id",
+            "preset_name",
+            "prid",
+            "quality",
+            "repeat",
+            "secs",
+            "service",
+            "serviceIcon",
+            "serviceName",
+            "shuffle",
+            "state",
+            "stationImage",
+            "streamFormat",
+            "streamUrl",
+            "syncStat",
+            "title1",
+            "title2",
+            "title3",
+            "totlen",
+            "volume",
+        }
+    ),
+    attrs=frozenset({"battery"}),
+)
+
+SYNC_STATUS_SCHEMA = XmlSchema(
+    root_attrs=frozenset(
+        {"brand", "etag", "icon", "mac", "model", "modelName", "name", "zone"}
+    ),
+    text=frozenset({"master", "zone"}),
+    attrs=frozenset({"battery"}),
+    lists=frozenset({"slave"}),
+)
+
+VOLUME_SCHEMA = XmlSchema(
+    root_attrs=frozenset({"db", "etag", "mute"}),
+    root_text=True,
+)
+
+PRESETS_SCHEMA = XmlSchema(
+    root_attrs=frozenset({"prid"}),
+    lists=frozenset({"preset"}),
+)
+
+# Response of /Browse: one page of a service's menu tree
+BROWSE_SCHEMA = XmlSchema(
+    root_attrs=frozenset({"nextKey", "parentKey", "serviceIcon", "serviceName", "type"}),
+    lists=frozenset({"item"}),
+)
+
+# Response of /Play and /Pause: <state>pause</state>
+STATE_SCHEMA = XmlSchema(root_text=True)
+
+# Response of /Shuffle and /Repeat: <playlist shuffle="1" length="28" .../>
+PLAYLIST_SCHEMA = XmlSchema(
+    root_attrs=frozenset({"length", "repeat", "shuffle"}),
+)
+
+
+def extract(xml_string: str, schema: XmlSchema) -> dict[str, Any]:
+    """Extract the fields declared in ``schema`` from a BluOS response.
+
+    Text fields are returned as stripped strings, ``attrs`` fields as
+    attribute dicts and ``lists`` fields as lists of attribute dicts. Fields
+    missing from the response are missing from the result.
+
+    Raises:
+        ExpatError: The response is not well-formed XML
+    """
+    result: dict[str, Any] = {}
+    depth = 0
+    # Tag of the depth-1 child (or "_text" for the root) whose text we collect
+    capture: str | None = None
+    chunks: list[str] = []
+
+    def start_element(tag: str, attrib: dict[str, str]) -> None:
+        nonlocal depth, capture, chunks
+        depth += 1
+        if depth == 1:
+            for key, value in attrib.items():
+                if key in schema.root_attrs:
+                    result[key] = value
+            if schema.root_text:
+                capture = "_text"
+                chunks = []
+        elif depth == 2:
+            if tag in schema.text:
+                capture = tag
+                chunks = []
+            elif tag in schema.attrs:
+                result[tag] = attrib
+            elif tag in schema.lists:
+                result.setdefault(tag, []).append(attrib)
+
+    def character_data(data: str) -> None:
+        if capture is not None and depth == (1 if capture == "_text" else 2):
+            chunks.append(data)
+
+    def end_element(tag: str) -> None:
+        nonlocal depth, capture
+        if capture is not None and (
+            (depth == 2 and capture == tag) or (depth == 1 and capture == "_text")
+        ):
+            text = "".join(chunks).strip()
+            if text or capture != "_text":
+                result[capture] = text
+            capture = None
+        depth -= 1
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.CharacterDataHandler = character_data
+    parser.EndElementHandler = end_element
+    parser.Parse(xml_string, True)
+    return result
@@ -0,0 +1,114 @@
+"""Microbenchmark: schema-driven XML extraction vs. the previous parser.
+
+Compares, for each captured response in ``tools/fixtures``, the previous
+``ElementTree`` + recursive ``_element_to_dict`` path with the single-pass
+``xml_schema.extract`` used by ``BluOSApi`` today.
+
+Usage:
+    python tools/bench_parser.py [--number N] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+import xml.etree.ElementTree as ET
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def _load_xml_schema():
+    """Import xml_schema without importing the Home Assistant integration."""
+    path = ROOT / "custom_components" / "bluos" / "xml_schema.py"
+    spec = importlib.util.spec_from_file_location("bluos_xml_schema", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def element_to_dict(element: ET.Element) -> dict[str, Any] | str:
+    """The recursive converter BluOSApi used before xml_schema (for reference)."""
+    result = {}
+    if element.attrib:
+        result.update(element.attrib)
+    if element.text and element.text.strip():
+        if len(element.attrib) == 0 and len(list(element)) == 0:
+            return element.text.strip()
+        result["_text"] = element.text.strip()
+    for child in element:
+        child_data = element_to_dict(child)
+        if child.tag in result:
+            if not isinstance(result[child.tag], list):
+                result[child.tag] = [result[child.tag]]
+            result[child.tag].append(child_data)
+        else:
+            result[child.tag] = child_data
+    return result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="calls per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per fixture")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    xml_schema = _load_xml_schema()
+    schemas = {
+        "status": xml_schema.STATUS_SCHEMA,
+        "sync_status": xml_schema.SYNC_STATUS_SCHEMA,
+        "volume": xml_schema.VOLUME_SCHEMA,
+        "presets": xml_schema.PRESETS_SCHEMA,
+    }
+
+    results = []
+    for fixture in sorted(FIXTURES.glob("*.xml")):
+        xml_string = fixture.read_text()
+        schema = next(
+            schema
+            for prefix, schema in sorted(schemas.items(), key=lambda s: -len(s[0]))
+            if fixture.stem.startswith(prefix)
+        )
+
+        def legacy(xml_string=xml_string):
+            return element_to_dict(ET.fromstring(xml_string))
+
+        def schema_driven(xml_string=xml_string, schema=schema):
+            return xml_schema.extract(xml_string, schema)
+
+        timings = {}
+        for name, func in (("legacy", legacy), ("schema", schema_driven)):
+            best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+            timings[name] = best / args.number * 1e6
+
+        results.append(
+            {
+                "fixture": fixture.name,
+                "bytes": len(xml_string.encode()),
+                "legacy_us": round(timings["legacy"], 2),
+                "schema_us": round(timings["schema"], 2),
+                "speedup": round(timings["legacy"] / timings["schema"], 2),
+            }
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'fixture':28} {'bytes':>6} {'legacy µs':>10} {'schema µs':>10} {'speedup':>8}")
+    for row in results:
+        print(
+            f"{row['fixture']:28} {row['bytes']:>6} {row['legacy_us']:>10.2f} "
+            f"{row['schema_us']:>10.2f} {row['speedup']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""Benchmark BluOSApi and the coordinator against a simulated fleet.
+
+For each fleet size, ``tools/fake_bluos.py`` is started with that many
+players, and one coordinator per player polls it like Home Assistant does
+(polling mode, sharing one in-flight request limit). Measured:
+
+- parse: BluOSApi calls per second on the captured responses in
+  ``tools/fixtures`` (network left out)
+- cycle: refresh latency per player (p50/p95/max) and wall time of a fleet
+  cycle, for tiered cycles (/Status) and full cycles (all endpoints)
+- cpu: event loop and executor CPU time per player per cycle
+- memory: bytes allocated per player by setting up its coordinator and
+  running the first refresh
+
+Needs Home Assistant installed (``pip install homeassistant``). Results are
+printed as JSON; with ``--baseline`` the run is compared with an earlier
+result and the exit status is 1 when a metric got worse by more than
+``--tolerance``.
+
+Usage:
+    python tools/benchmark.py [--players 1,10,50,100] [--cycles N]
+                              [--latency MS] [--jitter MS] [--output FILE]
+                              [--baseline FILE] [--tolerance FRACTION]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parent.parent
+TOOLS = Path(__file__).resolve().parent
+FIXTURES = TOOLS / "fixtures"
+sys.path.insert(0, str(ROOT))
+
+try:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.bluos.bluos_api import BluOSApi
+    from custom_components.bluos.const import (
+        CONF_PUSH_UPDATES,
+        MAX_INFLIGHT_REQUESTS,
+    )
+    from custom_components.bluos.coordinator import BluOSDataUpdateCoordinator
+except ImportError as err:
+    sys.exit(f"The benchmark needs Home Assistant installed: {err}")
+
+# (metric path, True if higher is better) compared with --baseline
+COMPARED_METRICS = (
+    ("calls_per_s", True),
+    ("tiered.p95_ms", False),
+    ("full.p95_ms", False),
+    ("full.fleet_cycle_ms", False),
+    ("loop_cpu_us_per_player", False),
+    ("memory_kib_per_player", False),
+)
+
+
+async def bench_parse(number: int) -> dict[str, dict[str, float]]:
+    """Measure BluOSApi request methods on captured responses."""
+    api = BluOSApi("127.0.0.1", 11000)
+    cases = (
+        ("status", api.get_status, "status_playing.xml"),
+        ("status_radio", api.get_status, "status_radio.xml"),
+        ("sync_status", api.get_sync_status, "sync_status_master.xml"),
+        ("volume", api.get_volume, "volume.xml"),
+        ("presets", api.get_presets, "presets.xml"),
+    )
+    results = {}
+    for name, method, fixture in cases:
+        response = (FIXTURES / fixture).read_text()
+
+        async def get(*args, response=response, **kwargs):
+            return response
+
+        api._get = get
+        start = time.perf_counter()
+        for _ in range(number):
+            await method()
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "calls_per_s": round(number / elapsed),
+            "us_per_call": round(elapsed / number * 1e6, 2),
+        }
+    await api.close()
+    return results
+
+
+async def start_fleet(args: argparse.Namespace, players: int):
+    """Start the fake fleet and return the process and its players."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(TOOLS / "fake_bluos.py"),
+        "--players",
+        str(players),
+        "--latency",
+        str(args.latency),
+        "--jitter",
+        str(args.jitter),
+        "--addresses",
+        args.addresses,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    line = await asyncio.wait_for(process.stdout.readline(), 30)
+    if not line:
+        raise RuntimeError("fake_bluos.py did not start")
+    return process, json.loads(line)["players"]
+
+
+async def run_cycles(
+    coordinators: list[BluOSDataUpdateCoordinator], cycles: int, full: bool
+) -> dict[str, float]:
+    """Refresh every coordinator ``cycles`` times and summarize the latencies."""
+    latencies: list[float] = []
+    fleet_cycles: list[float] = []
+
+    async def refresh(coordinator: BluOSDataUpdateCoordinator) -> None:
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        latencies.append(time.perf_counter() - start)
+
+    for _ in range(cycles):
+        # Cycles run back to back, before any tier is due; make each one do
+        # the work it measures (/Status only, or every endpoint)
+        for coordinator in coordinators:
+            coordinator.async_invalidate_cache(None if full else "status")
+        start = time.perf_counter()
+        await asyncio.gather(*(refresh(coordinator) for coordinator in coordinators))
+        fleet_cycles.append(time.perf_counter() - start)
+
+    latencies.sort()
+    failed = sum(not coordinator.last_update_success for coordinator in coordinators)
+    return {
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2),
+        "fleet_cycle_ms": round(statistics.median(fleet_cycles) * 1000, 2),
+        "failed_players": failed,
+    }
+
+
+async def bench_fleet(
+    hass: HomeAssistant, args: argparse.Namespace, size: int
+) -> dict[str, float]:
+    """Measure coordinators polling a fleet of ``size`` players."""
+    process, players = await start_fleet(args, size)
+    limiter = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+    coordinators: list[BluOSDataUpdateCoordinator] = []
+    try:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for index, player in enumerate(players):
+            entry = SimpleNamespace(
+                entry_id=f"benchmark_{index}",
+                title=player["name"],
+                data={"host": player["host"], "port": player["port"]},
+                options={CONF_PUSH_UPDATES: False},
+            )
+            coordinator = BluOSDataUpdateCoordinator(hass, entry)
+            coordinator.api.limiter = limiter
+            coordinators.append(coordinator)
+        await asyncio.gather(*(c.async_refresh() for c in coordinators))
+        memory = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        loop_cpu = time.thread_time()
+        process_cpu = time.process_time()
+        tiered = await run_cycles(coordinators, args.cycles, full=False)
+        full = await run_cycles(coordinators, args.cycles, full=True)
+        loop_cpu = time.thread_time() - loop_cpu
+        executor_cpu = time.process_time() - process_cpu - loop_cpu
+        player_cycles = size * args.cycles * 2
+    finally:
+        for coordinator in coordinators:
+            await coordinator.api.close()
+        process.terminate()
+        await process.wait()
+
+    return {
+        "players": size,
+        "tiered": tiered,
+        "full": full,
+        "loop_cpu_us_per_player": round(loop_cpu / player_cycles * 1e6, 1),
+        "executor_cpu_us_per_player": round(max(executor_cpu, 0) / player_cycles * 1e6, 1),
+        "memory_kib_per_player": round(memory / size / 1024, 1),
+    }
+
+
+def _metric(result: dict, path: str) -> float | None:
+    """Return a nested metric like ``full.p95_ms``."""
+    value = result
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return the metrics that regressed by more than ``tolerance``."""
+    pairs = [
+        (f"parse.{name}", results["parse"][name], baseline.get("parse", {}).get(name, {}))
+        for name in results["parse"]
+    ]
+    old_fleets = {fleet["players"]: fleet for fleet in baseline.get("fleet", [])}
+    pairs += [
+        (f"fleet[{fleet['players']}]", fleet, old_fleets.get(fleet["players"], {}))
+        for fleet in results["fleet"]
+    ]
+
+    regressions = []
+    for name, new, old in pairs:
+        for path, higher_is_better in COMPARED_METRICS:
+            new_value, old_value = _metric(new, path), _metric(old, path)
+            if new_value is None or not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            if higher_is_better:
+                change = -change
+            if change > tolerance:
+                regressions.append(
+                    f"{name}.{path}: {old_value} -> {new_value} ({change:+.0%} worse)"
+                )
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Run all benchmarks."""
+    results: dict = {
+        "python": platform.python_version(),
+        "version": json.loads(
+            (ROOT / "custom_components" / "bluos" / "manifest.json").read_text()
+        )["version"],
+        "settings": {
+            "cycles": args.cycles,
+            "latency_ms": args.latency,
+            "jitter_ms": args.jitter,
+        },
+        "parse": await bench_parse(args.number),
+        "fleet": [],
+    }
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            for size in args.players:
+                print(f"benchmarking {size} players", file=sys.stderr)
+                results["fleet"].append(await bench_fleet(hass, args, size))
+        finally:
+            await hass.async_stop(force=True)
+    return results
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--players",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[1, 10, 50, 100],
+        help="comma-separated fleet sizes",
+    )
+    parser.add_argument("--cycles", type=int, default=20, help="refresh cycles per fleet")
+    parser.add_argument("--number", type=int, default=2000, help="calls per parse benchmark")
+    parser.add_argument("--latency", type=float, default=5, help="ms per response")
+    parser.add_argument("--jitter", type=float, default=5, help="random extra ms")
+    parser.add_argument(
+        "--addresses",
+        choices=("loopback", "ports"),
+        default="loopback" if sys.platform.startswith("linux") else "ports",
+        help="how the fake players listen, see fake_bluos.py",
+    )
+    parser.add_argument("--output", type=Path, help="also write the results here")
+    parser.add_argument("--baseline", type=Path, help="earlier results to compare with")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed regression (0.2 = 20%%)"
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        args.output.write_text(output + "\n")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""Local stand-in for a fleet of BluOS players over HTTP.
+
+Serves /Status, /SyncStatus, /Volume and /Presets like a real player
+(including the etag/timeout long-poll of /Status and /SyncStatus), plus the
+transport and volume commands, for N fake players. Used by
+``tools/benchmark.py``; also handy to run the integration without hardware.
+
+Usage:
+    python tools/fake_bluos.py [--players N] [--latency MS] [--jitter MS]
+                               [--error-rate P] [--group-size N]
+                               [--track-change S] [--addresses MODE]
+
+Each player listens on its own loopback address (127.0.1.1, 127.0.1.2, ...,
+Linux only) or, with ``--addresses ports``, on 127.0.0.1 and its own port
+(``--base-port`` + index). Once all players listen, one JSON line listing
+them is printed to stdout.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import random
+import sys
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# Tracks the fake players cycle through: (title, artist, album, length)
+TRACKS = [
+    ("Dreams", "Fleetwood Mac", "Rumours", 257),
+    ("Go Your Own Way", "Fleetwood Mac", "Rumours", 223),
+    ("Heroes", "David Bowie", '"Heroes"', 371),
+    ("Teardrop", "Massive Attack", "Mezzanine", 330),
+    ("Harvest Moon", "Neil Young", "Harvest Moon", 303),
+]
+
+# Longest long-poll the fake players hold open, like real players
+MAX_LONG_POLL = 100
+
+
+def _xml_escape(value: str) -> str:
+    """Escape text for XML content and attributes."""
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+    )
+
+
+class FakePlayer:
+    """State and HTTP API of one fake player."""
+
+    def __init__(self, index: int, host: str, port: int, args: argparse.Namespace) -> None:
+        """Initialize the player."""
+        self.index = index
+        self.host = host
+        self.port = port
+        self.args = args
+        self.name = f"Fake Player {index + 1}"
+        self.mac = f"02:00:00:00:{index >> 8:02X}:{index & 0xFF:02X}"
+        self.state = "play"
+        self.track = index % len(TRACKS)
+        self.track_started = time.monotonic() - random.uniform(0, 60)
+        self.volume = 20 + index % 30
+        self.mute = False
+        self.shuffle = False
+        self.repeat = 2
+        self.master: FakePlayer | None = None
+        self.slaves: list[FakePlayer] = []
+        self._status_etag = 1
+        self._sync_etag = 1
+        self._status_changed = asyncio.Event()
+        self._sync_changed = asyncio.Event()
+        self._presets = (FIXTURES / "presets.xml").read_text()
+
+    @property
+    def address(self) -> str:
+        """Return host:port."""
+        return f"{self.host}:{self.port}"
+
+    def changed(self) -> None:
+        """Wake long-polls waiting for a new status, also on the slaves.
+
+        Slaves report their master's playback, so their status changes too.
+        """
+        for player in (self, *self.slaves):
+            player._status_etag += 1
+            player._status_changed.set()
+            player._status_changed = asyncio.Event()
+
+    def next_track(self, step: int = 1) -> None:
+        """Start another track."""
+        source = self.master or self
+        source.track = (source.track + step) % len(TRACKS)
+        source.track_started = time.monotonic()
+        source.changed()
+
+    async def handle(self, target: str) -> tuple[int, str]:
+        """Answer one request."""
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        endpoint = url.path.strip("/")
+
+        if self.args.latency or self.args.jitter:
+            delay = self.args.latency + random.uniform(0, self.args.jitter)
+            await asyncio.sleep(delay / 1000)
+        if self.args.error_rate and random.random() < self.args.error_rate:
+            return 500, "<error>Simulated error</error>"
+
+        if endpoint == "Status":
+            await self._long_poll(params, str(self._status_etag), lambda: self._status_changed)
+            return 200, self.status_xml()
+        if endpoint == "SyncStatus":
+            await self._long_poll(params, str(self._sync_etag), lambda: self._sync_changed)
+            return 200, self.sync_status_xml()
+        if endpoint == "Presets":
+            return 200, self._presets
+        if endpoint == "Volume":
+            return 200, self._set_volume(params)
+        # Slaves pass transport commands on to their master
+        source = self.master or self
+        if endpoint == "Play":
+            source.state = "play"
+            source.changed()
+            return 200, "<state>play</state>"
+        if endpoint == "Pause":
+            if params.get("toggle") == "1" and source.state == "pause":
+                source.state = "play"
+            else:
+                source.state = "pause"
+            source.changed()
+            return 200, f"<state>{source.state}</state>"
+        if endpoint in ("Skip", "Back"):
+            self.next_track(1 if endpoint == "Skip" else -1)
+            return 200, f"<id>{self.track}</id>"
+        if endpoint == "Shuffle":
+            self.shuffle = params.get("state") == "1"
+            self.changed()
+            return 200, self._playlist_xml()
+        if endpoint == "Repeat":
+            self.repeat = int(params.get("state", self.repeat))
+            self.changed()
+            return 200, self._playlist_xml()
+        if endpoint == "Preset":
+            self.next_track()
+            return 200, f'<loadedService service="TuneIn">{_xml_escape(params.get("id", ""))}</loadedService>'
+        return 404, "<error>Unknown endpoint</error>"
+
+    async def _long_poll(self, params: dict[str, str], etag: str, event) -> None:
+        """Hold the request until the etag changes or the timeout passes."""
+        if "timeout" not in params or params.get("etag") != etag:
+            return
+        timeout = min(float(params["timeout"]), MAX_LONG_POLL)
+        try:
+            await asyncio.wait_for(event().wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _set_volume(self, params: dict[str, str]) -> str:
+        """Apply volume parameters and return the /Volume response."""
+        if "level" in params:
+            level = params["level"]
+            if level.startswith(("+", "-")):
+                self.volume += int(level)
+            else:
+                self.volume = int(level)
+            self.volume = max(0, min(100, self.volume))
+            self.changed()
+        if "mute" in params:
+            self.mute = params["mute"] == "1"
+            self.changed()
+        db = -80 + self.volume * 0.8
+        return (
+            f'<volume db="{db:.1f}" mute="{int(self.mute)}" offsetDb="0" '
+            f'etag="{self._status_etag}">{self.volume}</volume>'
+        )
+
+    def _playlist_xml(self) -> str:
+        """Return the response of /Shuffle and /Repeat."""
+        return (
+            f'<playlist modified="0" length="{len(TRACKS)}" '
+            f'shuffle="{int(self.shuffle)}" repeat="{self.repeat}" id="{self.track}"/>'
+        )
+
+    def status_xml(self) -> str:
+        """Return the /Status response."""
+        source = self.master or self
+        title, artist, album, length = TRACKS[source.track]
+        secs = int(time.monotonic() - source.track_started) % length
+        return f"""<status etag="{self._status_etag}">
+<actions>
+<action name="back"/>
+<action name="skip"/>
+</actions>
+<album>{_xml_escape(album)}</album>
+<artist>{_xml_escape(artist)}</artist>
+<canMovePlayback>true</canMovePlayback>
+<canSeek>1</canSeek>
+<cursor>{source.track}</cursor>
+<db>{-80 + self.volume * 0.8:.1f}</db>
+<fn>LocalMusic:{source.track}</fn>
+<image>/Artwork?service=LocalMusic&amp;album={source.track}</image>
+<indexing>0</indexing>
+<mid>3</mid>
+<mode>1</mode>
+<mute>{int(self.mute)}</mute>
+<name>{_xml_escape(title)}</name>
+<pid>142</pid>
+<prid>2</prid>
+<quality>cd</quality>
+<repeat>{self.repeat}</repeat>
+<schemaVersion>34</schemaVersion>
+<secs>{secs}</secs>
+<service>LocalMusic</service>
+<serviceIcon>/images/LibraryIcon.png</serviceIcon>
+<serviceName>Library</serviceName>
+<shuffle>{int(self.shuffle)}</shuffle>
+<sid>7</sid>
+<sleep></sleep>
+<song>{source.track}</song>
+<state>{source.state}</state>
+<streamFormat>FLAC 44.1kHz/16bit</streamFormat>
+<syncStat>{self._sync_etag}</syncStat>
+<title1>{_xml_escape(title)}</title1>
+<title2>{_xml_escape(artist)}</title2>
+<title3>{_xml_escape(album)}</title3>
+<totlen>{length}</totlen>
+<volume>{self.volume}</volume>
+</status>
+"""
+
+    def sync_status_xml(self) -> str:
+        """Return the /SyncStatus response."""
+        group = ""
+        children = ""
+        if self.slaves:
+            group = f' group="{_xml_escape("+".join(p.name for p in (self, *self.slaves)))}"'
+            children = "".join(
+                f'<slave id="{slave.host}" port="{slave.port}"/>\n' for slave in self.slaves
+            )
+        elif self.master:
+            children = f'<master port="{self.master.port}">{self.master.host}</master>\n'
+        return (
+            f'<SyncStatus icon="/images/players/N230_nt.png" volume="{self.volume}" '
+            f'modelName="Fake NODE" name="{_xml_escape(self.name)}" model="FAKE" '
+            f'brand="Bluesound" etag="{self._sync_etag}" outlevel="-33.5" '
+            f'syncStat="{self._sync_etag}" id="{self.address}" mac="{self.mac}"'
+            f'{group} schemaVersion="34" initialized="true">\n{children}</SyncStatus>\n'
+        )
+
+
+async def _serve_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, player: FakePlayer
+) -> None:
+    """Answer HTTP/1.1 GET requests on one keep-alive connection."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+            keep_alive = True
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "connection" and value.strip().lower() == "close":
+                    keep_alive = False
+
+            if method != "GET":
+                status, body = 405, "<error>Method not allowed</error>"
+            else:
+                status, body = await player.handle(target)
+            payload = body.encode()
+            writer.write(
+                (
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                    "Content-Type: text/xml; charset=utf-8\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n"
+                ).encode()
+                + payload
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+def player_address(index: int, args: argparse.Namespace) -> tuple[str, int]:
+    """Return the address a player listens on."""
+    if args.addresses == "loopback":
+        return f"127.0.{1 + index // 250}.{1 + index % 250}", args.base_port
+    return "127.0.0.1", args.base_port + index
+
+
+async def _change_tracks(players: list[FakePlayer], interval: float) -> None:
+    """Let every playing master start a new track every ``interval`` seconds."""
+    while True:
+        await asyncio.sleep(interval / max(len(players), 1))
+        for player in players:
+            if (
+                player.master is None
+                and player.state == "play"
+                and time.monotonic() - player.track_started >= interval
+            ):
+                player.next_track()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Start the fleet and run until interrupted."""
+    players = []
+    for index in range(args.players):
+        host, port = player_address(index, args)
+        players.append(FakePlayer(index, host, port, args))
+
+    # Group consecutive players, the first of each group is the master
+    for start in range(0, len(players), max(args.group_size, 1)):
+        master, *slaves = players[start : start + args.group_size]
+        master.slaves = slaves
+        for slave in slaves:
+            slave.master = master
+
+    servers = []
+    for player in players:
+        servers.append(
+            await asyncio.start_server(
+                lambda reader, writer, player=player: _serve_connection(
+                    reader, writer, player
+                ),
+                player.host,
+                player.port,
+            )
+        )
+
+    print(
+        json.dumps(
+            {
+                "players": [
+                    {"host": p.host, "port": p.port, "name": p.name} for p in players
+                ]
+            }
+        ),
+        flush=True,
+    )
+    print(f"{len(players)} fake BluOS players running", file=sys.stderr)
+
+    tasks = []
+    if args.track_change:
+        tasks.append(asyncio.create_task(_change_tracks(players, args.track_change)))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for task in tasks:
+            task.cancel()
+        for server in servers:
+            server.close()
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=1, help="fake players")
+    parser.add_argument("--latency", type=float, default=0, help="ms added to each response")
+    parser.add_argument("--jitter", type=float, default=0, help="random extra ms (0..jitter)")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of requests failing with 500")
+    parser.add_argument("--group-size", type=int, default=1, help="players per group (master first)")
+    parser.add_argument("--track-change", type=float, default=0, help="seconds per track (0: never)")
+    parser.add_argument(
+        "--addresses",
+        choices=("loopback", "ports"),
+        default="loopback" if sys.platform.startswith("linux") else "ports",
+        help="one loopback address per player, or one port per player",
+    )
+    parser.add_argument("--base-port", type=int, default=11000, help="(first) HTTP port")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
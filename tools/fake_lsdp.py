@@ -0,0 +1,167 @@
+"""Local stand-in for BluOS players on LSDP (and optionally mDNS).
+
+Answers LSDP queries with announces for N fake players on one host, so the
+discovery in the config flow can be exercised without real hardware. The
+players' HTTP ports are ``--base-port`` + index.
+
+Usage:
+    python tools/fake_lsdp.py [--players N] [--host IP] [--mdns]
+    python tools/fake_lsdp.py --query [--host IP]
+
+``--query`` runs the integration's LSDP client against the responder and
+prints what it found. ``--mdns`` also registers every player as
+``_musc._tcp`` (requires the ``zeroconf`` package).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+import socket
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_lsdp():
+    """Import lsdp without importing the Home Assistant integration."""
+    path = ROOT / "custom_components" / "bluos" / "lsdp.py"
+    spec = importlib.util.spec_from_file_location("bluos_lsdp", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+lsdp = _load_lsdp()
+
+
+def fake_players(count: int, host: str, base_port: int) -> list[dict]:
+    """Describe the fake players."""
+    return [
+        {
+            "name": f"Fake Player {index + 1}",
+            "host": host,
+            "port": base_port + index,
+            "node_id": bytes([0x02, 0, 0, 0, index >> 8, index & 0xFF]),
+        }
+        for index in range(count)
+    ]
+
+
+class ResponderProtocol(asyncio.DatagramProtocol):
+    """Answer LSDP queries for the fake players."""
+
+    def __init__(self, players: list[dict]) -> None:
+        """Initialize the responder."""
+        self.players = players
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Keep the transport to answer on."""
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Answer broadcast queries with one announce per player."""
+        if len(data) < 8 or data[1:5] != lsdp.LSDP_MAGIC or data[7] != lsdp.MSG_QUERY_BROADCAST:
+            return
+        for player in self.players:
+            announce = lsdp.build_announce(
+                player["host"],
+                player["node_id"],
+                [
+                    (
+                        lsdp.CLASS_PLAYER,
+                        {
+                            "name": player["name"],
+                            "port": str(player["port"]),
+                            "model": "FAKE",
+                            "version": "4.0.0",
+                        },
+                    )
+                ],
+            )
+            # Real players broadcast; answering the sender also works when
+            # the client couldn't bind port 11430 (we own it here)
+            self.transport.sendto(announce, addr)
+        print(f"answered query from {addr[0]}:{addr[1]}", file=sys.stderr)
+
+
+def register_mdns(players: list[dict]):
+    """Register the players as _musc._tcp services, if zeroconf is installed."""
+    try:
+        from zeroconf import ServiceInfo, Zeroconf
+    except ImportError:
+        print("zeroconf is not installed, skipping mDNS", file=sys.stderr)
+        return None
+
+    zeroconf = Zeroconf()
+    for player in players:
+        zeroconf.register_service(
+            ServiceInfo(
+                "_musc._tcp.local.",
+                f"{player['name']}._musc._tcp.local.",
+                addresses=[socket.inet_aton(player["host"])],
+                port=player["port"],
+                server=f"{player['name'].replace(' ', '-')}.local.",
+            )
+        )
+    return zeroconf
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run the responder until interrupted."""
+    players = fake_players(args.players, args.host, args.base_port)
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: ResponderProtocol(players),
+        local_addr=("0.0.0.0", args.port),
+        allow_broadcast=True,
+    )
+    zeroconf = register_mdns(players) if args.mdns else None
+    print(f"LSDP responder for {len(players)} players on UDP {args.port}", file=sys.stderr)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        transport.close()
+        if zeroconf is not None:
+            zeroconf.unregister_all_services()
+            zeroconf.close()
+
+
+async def query(args: argparse.Namespace) -> None:
+    """Discover players through the integration's LSDP client."""
+    nodes = await lsdp.async_discover(args.timeout, target=(args.host, args.port))
+    print(
+        json.dumps(
+            [
+                {"host": node.host, "port": node.port, "name": node.name, "id": node.node_id}
+                for node in nodes
+            ],
+            indent=2,
+        )
+    )
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=3, help="fake players")
+    parser.add_argument("--host", default="127.0.0.1", help="address the players announce")
+    parser.add_argument("--port", type=int, default=lsdp.LSDP_PORT, help="LSDP UDP port")
+    parser.add_argument("--base-port", type=int, default=11000, help="first HTTP port")
+    parser.add_argument("--mdns", action="store_true", help="also register mDNS services")
+    parser.add_argument("--query", action="store_true", help="query instead of respond")
+    parser.add_argument("--timeout", type=float, default=1.5, help="query duration")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(query(args) if args.query else serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()